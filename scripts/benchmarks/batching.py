@@ -0,0 +1,66 @@
+#!python
+"""
+Time the register_all batchers on synthetic GEMD histories of increasing size.
+
+Each history is a material run with its process, specs and a measurement, all sharing a common
+set of templates, so the templates are dependencies of every object in the graph.  The time per
+object should stay roughly constant as the graph grows.
+
+Usage: python scripts/benchmarks/batching.py [--sizes 1000 10000 100000] [--batch-size 50]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+
+from gemd.entity.bounds import IntegerBounds
+from gemd.entity.object import MaterialRun, MaterialSpec, MeasurementRun, ProcessRun, \
+    ProcessSpec
+from gemd.entity.template import MaterialTemplate, MeasurementTemplate, ProcessTemplate, \
+    PropertyTemplate
+from gemd.util import flatten, set_uuids
+
+from citrine._utils.batcher import Batcher
+
+
+def make_histories(count: int) -> list:
+    """Build `count` material histories that share their templates, as flattened objects."""
+    bounds = IntegerBounds(0, 10)
+    prop = PropertyTemplate("hardness", bounds=bounds)
+    templates = [
+        prop,
+        MaterialTemplate("material", properties=[[prop, bounds]]),
+        ProcessTemplate("process"),
+        MeasurementTemplate("measurement", properties=[[prop, bounds]]),
+    ]
+    histories = list()
+    for i in range(count):
+        process = ProcessSpec(f"process {i}", template=templates[2])
+        spec = MaterialSpec(f"material {i}", template=templates[1], process=process)
+        material = MaterialRun(f"material {i}", spec=spec, process=ProcessRun(f"process {i}",
+                                                                             spec=process))
+        MeasurementRun(f"measurement {i}", material=material)
+        histories.append(material)
+    set_uuids(histories + templates, scope="benchmark")
+    return flatten(histories + templates)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'batcher':>13} {'histories':>10} {'objects':>8} {'batches':>8} "
+          f"{'seconds':>8} {'us/object':>10}")
+    for size in args.sizes:
+        objects = make_histories(size)
+        for name, batcher in [("by_type", Batcher.by_type()),
+                              ("by_dependency", Batcher.by_dependency())]:
+            start = perf_counter()
+            batches = batcher.batch(objects, args.batch_size)
+            elapsed = perf_counter() - start
+            print(f"{name:>13} {size:>10} {len(objects):>8} {len(batches):>8} "
+                  f"{elapsed:>8.3f} {1e6 * elapsed / len(objects):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
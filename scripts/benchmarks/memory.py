@@ -0,0 +1,64 @@
+#!python
+"""
+Measure the memory held by built Serializable objects, and their pickled size.
+
+Objects are built from the same payloads as the serialization benchmark, decoded from JSON one
+page of 100 at a time as they would be from responses.  Memory is the growth in allocations
+traced by tracemalloc while the objects are built and kept, so it includes everything they
+reference (strings, UUIDs, datetimes, nested objects), divided by the number of objects.
+Listed material runs share their dataset and creator, as in a listing of one dataset, and
+listed measurement runs also share their spec, material, and the templates and units of their
+properties.  Listings are built both as they are and sharing repeated links and strings, as a
+collection does.
+
+Usage: python scripts/benchmarks/memory.py [--count 20000]
+"""
+import gc
+import json
+import pickle
+import tracemalloc
+from argparse import ArgumentParser
+
+from payloads import (candidate_data, listed_material_run_data, listed_measurement_data,
+                      material_run_data)
+from citrine._serialization.interning import interned
+from citrine.informatics.design_candidate import DesignCandidate
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+
+PAGE_SIZE = 100
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'payload':>18} {'interned':>8} {'objects':>8} {'bytes/object':>13} "
+          f"{'pickled bytes/object':>21}")
+    for name, klass, make_data, listed in [
+            ("DesignCandidate", DesignCandidate, candidate_data, False),
+            ("MaterialRun", MaterialRun, material_run_data, False),
+            ("listed run", MaterialRun, listed_material_run_data, True),
+            ("listed measurement", MeasurementRun, listed_measurement_data, True)]:
+        for intern in (False, True) if listed else (False,):
+            pages = [json.dumps([make_data() for _ in range(PAGE_SIZE)])
+                     for _ in range(args.count // PAGE_SIZE)]
+            klass.build(make_data())  # Leave one-time setup out of the measurement
+            gc.collect()
+            tracemalloc.start()
+            built = (klass.build(payload) for page in pages for payload in json.loads(page))
+            objects = list(interned(built) if intern else built)
+            held, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            try:
+                pickled = f"{len(pickle.dumps(objects)) / len(objects):.0f}"
+            except AttributeError:  # Some gemd objects hold validators that can't be pickled
+                pickled = "-"
+            print(f"{name:>18} {'yes' if intern else 'no':>8} {len(objects):>8} "
+                  f"{held / len(objects):>13.0f} {pickled:>21}")
+            del objects
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Serialized payloads shaped like those returned by the platform, shared by the benchmarks.
+
+Each function builds a fresh payload, with new ids where the platform would return distinct
+objects, so that payloads built repeatedly don't share their strings unless they would in a
+real response.
+"""
+from uuid import uuid4
+
+from citrine.gemtables.columns import IdentityColumn, MeanColumn
+from citrine.gemtables.rows import MaterialRunByTemplate
+from citrine.gemtables.variables import (AttributeByTemplate, LocalAttribute,
+                                         TerminalMaterialIdentifier, TerminalMaterialInfo)
+from citrine.informatics.descriptors import RealDescriptor
+from citrine.informatics.predictors import AutoMLPredictor, GraphPredictor
+from citrine.resources.table_config import TableConfig
+
+
+def candidate_data() -> dict:
+    """Build a serialized design candidate."""
+    return {
+        "id": str(uuid4()),
+        "material_id": str(uuid4()),
+        "identifiers": [],
+        "primary_score": 0.5,
+        "name": "Example candidate",
+        "hidden": False,
+        "material": {
+            "vars": {
+                "Temperature": {"type": "R", "m": 475.8, "s": 0},
+                "Flour": {"type": "C", "cp": {"flour": 100.0}},
+                "Water": {"type": "M", "q": {"water": 72.5}, "l": {}},
+                "Salt": {"type": "F", "f": "NaCl"},
+            },
+            "identifiers": {"id": str(uuid4()), "identifiers": [],
+                            "material_template": str(uuid4()),
+                            "process_template": str(uuid4())},
+        },
+        "comments": [{"message": "a message",
+                      "created": {"user": str(uuid4()), "time": "2025-02-20T10:46:26Z"}}],
+    }
+
+
+def candidate_page_data(size: int = 100) -> list[dict]:
+    """Build a page of `size` serialized design candidates."""
+    return [candidate_data() for _ in range(size)]
+
+
+def material_run_data() -> dict:
+    """Build a serialized material run, as returned by the platform."""
+    return {
+        "type": "material_run",
+        "name": "Example run",
+        "uids": {"id": str(uuid4()), "lims": str(uuid4())},
+        "tags": ["benchmark::true"],
+        "process": {"type": "link_by_uid", "scope": "id", "id": str(uuid4())},
+        "spec": {"type": "link_by_uid", "scope": "id", "id": str(uuid4())},
+        "sample_type": "experimental",
+        "audit_info": {"created_by": str(uuid4()), "created_at": 1563533168000},
+        "dataset": str(uuid4()),
+    }
+
+
+def listed_material_run_data(dataset: str = str(uuid4()), user: str = str(uuid4())) -> dict:
+    """Build a serialized material run from a listing of one dataset."""
+    data = material_run_data()
+    data["dataset"] = dataset
+    data["audit_info"]["created_by"] = user
+    return data
+
+
+def measurement_run_data(attributes: int = 30, *,
+                         dataset: str | None = None,
+                         user: str | None = None,
+                         spec: str | None = None,
+                         material: str | None = None,
+                         templates: list[str] | None = None) -> dict:
+    """
+    Build a serialized measurement run with `attributes` properties, conditions and parameters.
+
+    The attributes are split evenly among the three kinds, each with a template link and a
+    value with units.  Ids that aren't given are new.
+    """
+    if templates is None:
+        templates = [str(uuid4()) for _ in range(attributes)]
+    kinds = {"property": "properties", "condition": "conditions", "parameter": "parameters"}
+    values = [{"type": "nominal_real", "nominal": 1.5, "units": "MPa"},
+              {"type": "uniform_real", "lower_bound": 20.0, "upper_bound": 25.0,
+               "units": "degC"},
+              {"type": "nominal_categorical", "category": "fast"}]
+    data = {
+        "type": "measurement_run",
+        "name": "Example measurement",
+        "uids": {"id": str(uuid4())},
+        "tags": ["benchmark::true"],
+        "notes": "Measured on the benchmark instrument",
+        "spec": {"type": "link_by_uid", "scope": "id", "id": spec or str(uuid4())},
+        "material": {"type": "link_by_uid", "scope": "id", "id": material or str(uuid4())},
+        "audit_info": {"created_by": user or str(uuid4()), "created_at": 1563533168000},
+        "dataset": dataset or str(uuid4()),
+    }
+    for index, (kind, key) in enumerate(kinds.items()):
+        data[key] = [
+            {"type": kind, "name": f"{kind} {i}", "origin": "measured",
+             "template": {"type": "link_by_uid", "scope": "id", "id": templates[i]},
+             "value": values[index]}
+            for i in range(index, attributes, len(kinds))
+        ]
+    return data
+
+
+def listed_measurement_data(dataset: str = str(uuid4()), user: str = str(uuid4()),
+                            spec: str = str(uuid4()), material: str = str(uuid4()),
+                            templates: tuple[str, ...] = tuple(str(uuid4()) for _ in range(5))
+                            ) -> dict:
+    """Build a serialized measurement run with five properties from a listing of one dataset."""
+    data = measurement_run_data(0, dataset=dataset, user=user, spec=spec, material=material)
+    data["properties"] = [
+        {"type": "property", "name": f"property {i}", "origin": "measured",
+         "template": {"type": "link_by_uid", "scope": "id", "id": template},
+         "value": {"type": "nominal_real", "nominal": 1.5, "units": "MPa"}}
+        for i, template in enumerate(templates)
+    ]
+    return data
+
+
+def table_config_data(size: int = 500) -> dict:
+    """Build a serialized table config with `size` variables and columns."""
+    variables, columns = [], []
+    for i in range(size):
+        name = f"v{i}"
+        kind = i % 4
+        if kind == 0:
+            variables.append(TerminalMaterialInfo(name, headers=[name], field="name"))
+            columns.append(IdentityColumn(data_source=name))
+        elif kind == 1:
+            variables.append(TerminalMaterialIdentifier(name, headers=[name]))
+            columns.append(IdentityColumn(data_source=name))
+        elif kind == 2:
+            variables.append(AttributeByTemplate(name, headers=[name], template=uuid4()))
+            columns.append(MeanColumn(data_source=name))
+        else:
+            variables.append(LocalAttribute(name, headers=[name], template=uuid4()))
+            columns.append(MeanColumn(data_source=name))
+    config = TableConfig(name="benchmark", description="", datasets=[uuid4()],
+                         variables=variables, columns=columns,
+                         rows=[MaterialRunByTemplate(templates=[uuid4()])])
+    return config.dump()
+
+
+def graph_predictor_data(size: int = 10) -> dict:
+    """Build a serialized graph predictor of `size` AutoML predictors, as from the platform."""
+    descriptors = [RealDescriptor(f"x{i}", lower_bound=0, upper_bound=1, units="")
+                   for i in range(size + 10)]
+    predictors = [AutoMLPredictor(name=f"p{i}", description="", inputs=descriptors[:10],
+                                  outputs=[descriptors[10 + i]]) for i in range(size)]
+    instance = GraphPredictor(name="graph", description="", predictors=predictors).dump()
+    stamp = {"user": str(uuid4()), "time": 1563533168000}
+    return {
+        "id": str(uuid4()),
+        "data": {"name": "graph", "description": "", "instance": instance["instance"]},
+        "metadata": {"status": {"name": "READY", "detail": []}, "created": stamp,
+                     "updated": stamp, "version": 1, "draft": False},
+    }
+
+
+def cross_validation_result_data(responses: int = 4, points: int = 250) -> dict:
+    """
+    Build a serialized cross-validation result for `responses` real-valued responses.
+
+    Each response has its RMSE and a predicted-vs-actual metric with `points` points.
+    """
+    names = [f"y{i}" for i in range(responses)]
+
+    def real(mean: float) -> dict:
+        return {"type": "RealMetricValue", "mean": mean, "standard_error": 0.1}
+
+    def predicted_vs_actual() -> dict:
+        return {"type": "RealPredictedVsActual",
+                "value": [{"uuid": str(uuid4()), "identifiers": [f"sample {i}"],
+                           "trial": i % 3, "fold": i % 5,
+                           "predicted": real(1.0), "actual": real(1.2)}
+                          for i in range(points)]}
+
+    return {
+        "type": "CrossValidationResult",
+        "evaluator": {"type": "CrossValidationEvaluator", "name": "benchmark",
+                      "description": "", "responses": names, "n_folds": 5, "n_trials": 3,
+                      "metrics": [{"type": "PVA"}, {"type": "RMSE"}],
+                      "ignore_when_grouping": []},
+        "response_results": {name: {"metrics": {"predicted_vs_actual": predicted_vs_actual(),
+                                                "rmse": real(0.4)}}
+                             for name in names},
+    }
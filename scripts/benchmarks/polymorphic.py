@@ -0,0 +1,55 @@
+#!python
+"""
+Time building objects whose fields are polymorphic, which look up a subtype for each element.
+
+A table config has 500 variables of four kinds, with a column for each, so building it looks
+up 1,000 subtypes among the variable and column types.  A graph predictor of 50 AutoML
+predictors looks up a subtype for each predictor and each of its descriptors.  Both are also
+built inside `trusted_build`.  The cost of a single lookup is reported for a few bases.
+
+Usage: python scripts/benchmarks/polymorphic.py [--count 100] [--repeat 5]
+"""
+from argparse import ArgumentParser
+from contextlib import nullcontext
+from timeit import repeat
+
+from payloads import graph_predictor_data, table_config_data
+from serialization import best_time
+from citrine._serialization.trusted import trusted_build
+from citrine.gemd_queries.criteria import Criteria
+from citrine.gemtables.columns import Column
+from citrine.gemtables.variables import Variable
+from citrine.informatics.descriptors import Descriptor
+from citrine.informatics.predictors import GraphPredictor, PredictorNode
+from citrine.resources.table_config import TableConfig
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'class':>16} {'mode':>8} {'seconds':>8} {'ms/object':>10}")
+    for klass, data in [(TableConfig, table_config_data()),
+                        (GraphPredictor, graph_predictor_data(50))]:
+        for mode in ("checked", "trusted"):
+            with trusted_build() if mode == "trusted" else nullcontext():
+                elapsed, _ = best_time(args.repeat, lambda: [klass.build(data)
+                                                             for _ in range(args.count)])
+            print(f"{klass.__name__:>16} {mode:>8} {elapsed:>8.2f} "
+                  f"{elapsed / args.count * 1e3:>10.2f}")
+
+    print()
+    print(f"{'base':>16} {'type':>28} {'ns/call':>8}")
+    count = args.count * 1000
+    for base, typ in [(Variable, "xor"), (Column, "concat_column"),
+                      (Criteria, "connectivity_class_criteria"),
+                      (PredictorNode, "SimpleMixture"), (Descriptor, "Integer")]:
+        elapsed = min(repeat(lambda: base.get_type({"type": typ}), number=count,
+                             repeat=args.repeat))
+        print(f"{base.__name__:>16} {typ:>28} {elapsed / count * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!python
+"""
+Time building register_all payloads, dumping whole objects versus the single-pass serializer.
+
+The histories from the batching benchmark are rebuilt as citrine objects, so each object holds
+references to the other objects in its history rather than links.  Dumping an object serializes
+everything it references before those references are replaced by links, so the cost of the old
+path grows with the depth of the history; the single-pass path writes the links directly.
+
+Usage: python scripts/benchmarks/registration_payload.py [--sizes 100 1000] [--repeat 3]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+
+from gemd.json import GEMDJson
+
+from batching import make_histories
+from citrine._utils.functions import registration_payload, replace_objects_with_links, \
+    scrub_none
+
+
+def dump_and_link(model) -> dict:
+    """Build a payload the way register_all did before the single-pass serializer."""
+    return replace_objects_with_links(scrub_none(model.dump()))
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    encoder = GEMDJson()
+    print(f"{'serializer':>12} {'histories':>10} {'objects':>8} {'seconds':>8} {'us/object':>10}")
+    for size in args.sizes:
+        objects = encoder.loads(encoder.dumps(make_histories(size)))
+        for name, serialize in [("dump", dump_and_link), ("single_pass", registration_payload)]:
+            elapsed = float("inf")
+            for _ in range(args.repeat):
+                start = perf_counter()
+                payloads = [serialize(obj) for obj in objects]
+                elapsed = min(elapsed, perf_counter() - start)
+            assert payloads == [dump_and_link(obj) for obj in objects]
+            print(f"{name:>12} {size:>10} {len(objects):>8} {elapsed:>8.2f} "
+                  f"{elapsed / len(objects) * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
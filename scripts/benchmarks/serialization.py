@@ -0,0 +1,103 @@
+#!python
+"""
+Time building and dumping Serializable objects, with and without the generated serializers.
+
+Design candidates are built from payloads shaped like those returned by the candidates
+endpoint, and material runs from payloads shaped like those returned by the data model
+endpoints.  The descriptor path loops over each class's fields, which is what every class used
+before the build and dump functions were generated, and the trusted path builds objects
+inside `trusted_build`, skipping type checks.  The cost of reading and assigning
+individual properties of a material run, which go through the property descriptors, is
+also reported, as is the cost of building objects and reading only their names, with and
+without `lazy_build`.
+
+Usage: python scripts/benchmarks/serialization.py [--count 10000] [--repeat 3]
+"""
+from argparse import ArgumentParser
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from timeit import repeat
+from uuid import uuid4
+
+from payloads import candidate_data, graph_predictor_data, material_run_data
+from citrine._serialization import properties
+from citrine._serialization.lazy import lazy_build
+from citrine._serialization.trusted import trusted_build
+from citrine.informatics.design_candidate import DesignCandidate
+from citrine.informatics.predictors import GraphPredictor
+from citrine.resources.material_run import MaterialRun
+
+
+@contextmanager
+def descriptor_path():
+    """Serialize by looping over each class's fields, as before the generated functions."""
+    builder, dumper = properties.compiled_builder, properties.compiled_dumper
+    properties.compiled_builder = properties.compiled_dumper = lambda klass, *args: None
+    try:
+        yield
+    finally:
+        properties.compiled_builder, properties.compiled_dumper = builder, dumper
+
+
+def best_time(repeat: int, func) -> tuple[float, list]:
+    """Run `func` repeatedly, returning the fastest time and the last result."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        result = func()
+        elapsed = min(elapsed, perf_counter() - start)
+    return elapsed, result
+
+
+def time_accessors(count: int, repeats: int):
+    """Print the time taken to read and assign properties of a material run."""
+    run = MaterialRun("Example run", uids={"id": str(uuid4())}, tags=["benchmark::true"])
+    print(f"{'statement':>28} {'ns/call':>8}")
+    for statement in ["run.uids", "run.tags", "run.audit_info", "run.uids = {'id': 'x'}",
+                      "run.tags = ['a']", "run.sample_type = 'virtual'"]:
+        elapsed = min(repeat(statement, globals={"run": run}, number=count, repeat=repeats))
+        print(f"{statement:>28} {elapsed / count * 1e9:>8.0f}")
+
+
+def time_lazy(count: int, repeats: int):
+    """Print the time taken to build objects and read their names, with and without laziness."""
+    print(f"{'class':>16} {'mode':>6} {'seconds':>8} {'us/object':>10}")
+    for klass, make_data in [(DesignCandidate, candidate_data),
+                             (GraphPredictor, graph_predictor_data)]:
+        payloads = [make_data() for _ in range(count)]
+        for mode in ("eager", "lazy"):
+            with lazy_build() if mode == "lazy" else nullcontext():
+                elapsed, _ = best_time(repeats, lambda: [klass.build(payload).name
+                                                         for payload in payloads])
+            print(f"{klass.__name__:>16} {mode:>6} {elapsed:>8.2f} "
+                  f"{elapsed / count * 1e6:>10.1f}")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'class':>16} {'operation':>9} {'path':>10} {'seconds':>8} {'us/object':>10}")
+    for klass, make_data in [(DesignCandidate, candidate_data), (MaterialRun, material_run_data)]:
+        payloads = [make_data() for _ in range(args.count)]
+        for path in ("descriptor", "generated", "trusted"):
+            context = {"descriptor": descriptor_path(), "trusted": trusted_build()}.get(
+                path, nullcontext())
+            with context:
+                elapsed, built = best_time(args.repeat, lambda: [klass.build(payload)
+                                                                  for payload in payloads])
+                print(f"{klass.__name__:>16} {'build':>9} {path:>10} {elapsed:>8.2f} "
+                      f"{elapsed / args.count * 1e6:>10.1f}")
+                elapsed, _ = best_time(args.repeat, lambda: [obj.dump() for obj in built])
+                print(f"{klass.__name__:>16} {'dump':>9} {path:>10} {elapsed:>8.2f} "
+                      f"{elapsed / args.count * 1e6:>10.1f}")
+    print()
+    time_accessors(args.count * 10, args.repeat)
+    print()
+    time_lazy(args.count // 10, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!python
+"""
+Measure build and dump throughput and peak memory of representative serialized objects.
+
+Every case is built from the fixture payloads in `payloads`, with no network access.  The
+payloads are encoded to JSON and decoded again, as from a response, so equal strings in them
+are separate objects.  Each case is also compared with a raw-dict baseline, a plain recursive
+copy of the same payloads, which is the least work any deserializer could do to produce a new
+object tree:
+
+* build: time to build an object from its decoded payload, and the baseline's time to copy it
+* dump: time to dump the built object back to a dictionary
+* peak: the peak memory traced while building a batch of objects, and while copying their
+  payloads, per object
+
+The cases are material runs; measurement runs with 30 attributes; table configs with 500
+variables and columns; graph predictors of 50 nodes; pages of 100 design candidates; and
+cross-validation results of four responses with 250 predicted-vs-actual points each.
+
+Results can be saved to a JSON file and compared with an earlier run, which reports each
+metric that got worse by more than the threshold and exits with status 1 if any did.  Runs
+are only comparable on the same machine and Python version.
+
+Usage: python scripts/benchmarks/suite.py [--case NAME ...] [--repeat 5] [--scale 1.0]
+                                          [--save results.json] [--compare baseline.json]
+                                          [--threshold 0.1]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from payloads import (candidate_page_data, cross_validation_result_data, graph_predictor_data,
+                      material_run_data, measurement_run_data, table_config_data)
+from serialization import best_time
+from citrine.informatics.design_candidate import DesignCandidate
+from citrine.informatics.predictor_evaluation_result import PredictorEvaluationResult
+from citrine.informatics.predictors import GraphPredictor
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.table_config import TableConfig
+
+
+@dataclass
+class Case:
+    """A kind of payload to build and dump, with the number of payloads to time per run."""
+
+    name: str
+    make_data: Callable[[], Any]
+    build: Callable[[Any], Any]
+    count: int
+
+    def dump(self, obj: Any) -> Any:
+        """Dump an object built by this case."""
+        return [item.dump() for item in obj] if isinstance(obj, list) else obj.dump()
+
+
+CASES = [
+    Case("material-run", material_run_data, MaterialRun.build, 2000),
+    Case("measurement-run", measurement_run_data, MeasurementRun.build, 200),
+    Case("table-config", table_config_data, TableConfig.build, 5),
+    Case("graph-predictor", lambda: graph_predictor_data(50), GraphPredictor.build, 10),
+    Case("candidate-page", candidate_page_data, DesignCandidate.build_many, 20),
+    Case("cv-result", cross_validation_result_data,
+         PredictorEvaluationResult.build, 20),
+]
+
+
+def raw_copy(value: Any) -> Any:
+    """Copy a decoded payload, as the raw-dict baseline."""
+    if type(value) is dict:
+        return {key: raw_copy(item) for key, item in value.items()}
+    elif type(value) is list:
+        return [raw_copy(item) for item in value]
+    return value
+
+
+def peak_memory(func: Callable[[Any], Any], payloads: list) -> float:
+    """Return the peak memory traced while applying `func` to every payload, per payload."""
+    gc.collect()
+    tracemalloc.start()
+    results = [func(payload) for payload in payloads]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return peak / len(payloads)
+
+
+def measure(case: Case, *, repeat: int, scale: float) -> dict[str, float]:
+    """Measure a case, returning times in microseconds and memory in bytes, per payload."""
+    count = max(1, round(case.count * scale))
+    encoded = json.dumps([case.make_data() for _ in range(count)])
+    payloads = json.loads(encoded)
+    case.build(payloads[0])  # Leave one-time setup out of the measurement
+
+    def timed(func: Callable[[Any], Any], inputs: list) -> float:
+        elapsed, _ = best_time(repeat, lambda: [func(item) for item in inputs])
+        return elapsed / count * 1e6
+
+    built = [case.build(payload) for payload in payloads]
+    return {
+        "build_us": timed(case.build, payloads),
+        "raw_build_us": timed(raw_copy, payloads),
+        "dump_us": timed(case.dump, built),
+        "peak_bytes": peak_memory(case.build, json.loads(encoded)),
+        "raw_peak_bytes": peak_memory(raw_copy, json.loads(encoded)),
+    }
+
+
+def regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Describe each metric in `results` that is worse than in `baseline` by over `threshold`.
+
+    The raw-dict baselines are only for reference, and aren't compared.
+    """
+    found = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            if metric.startswith("raw_"):
+                continue
+            before = baseline.get(name, {}).get(metric)
+            if before and value > before * (1 + threshold):
+                found.append(f"{name}: {metric} {before:.1f} -> {value:.1f} "
+                             f"(+{(value / before - 1) * 100:.0f}%)")
+    return found
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--case", nargs="+", choices=[case.name for case in CASES],
+                        help="The cases to run; all of them by default.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply the number of payloads of every case.")
+    parser.add_argument("--save", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="Compare the results with this JSON file.")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="The fraction by which a metric may get worse.")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'case':>16} {'build us':>10} {'raw us':>8} {'x raw':>6} {'dump us':>9} "
+          f"{'peak KiB':>9} {'raw KiB':>8} {'x raw':>6}")
+    for case in CASES:
+        if args.case and case.name not in args.case:
+            continue
+        metrics = results[case.name] = measure(case, repeat=args.repeat, scale=args.scale)
+        print(f"{case.name:>16} {metrics['build_us']:>10.1f} {metrics['raw_build_us']:>8.1f} "
+              f"{metrics['build_us'] / metrics['raw_build_us']:>6.1f} "
+              f"{metrics['dump_us']:>9.1f} {metrics['peak_bytes'] / 1024:>9.1f} "
+              f"{metrics['raw_peak_bytes'] / 1024:>8.1f} "
+              f"{metrics['peak_bytes'] / metrics['raw_peak_bytes']:>6.1f}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            found = regressions(results, json.load(f), args.threshold)
+        print()
+        print("\n".join(found) if found else "No regressions.")
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
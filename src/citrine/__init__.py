@@ -5,5 +5,5 @@ Documentation:
 https://citrineinformatics.github.io/citrine-python/index.html
 
 """
-from citrine.citrine import Citrine  # noqa: F401
+from citrine.citrine import AsyncCitrine, Citrine  # noqa: F401
 from .__version__ import __version__  # noqa: F401
@@ -1 +1 @@
-__version__ = "4.0.2"
+__version__ = "4.25.0"
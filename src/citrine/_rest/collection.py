@@ -1,11 +1,15 @@
 from abc import abstractmethod
 from collections.abc import Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
 from typing import Generic, TypeVar
 from uuid import UUID
 
 from citrine._rest.pageable import Pageable
 from citrine._rest.paginator import Paginator
 from citrine._rest.resource import Resource
+from citrine._serialization.lazy import lazy_build
+from citrine._serialization.trusted import trusted_build
 from citrine._utils.functions import resource_path
 from citrine.exceptions import ModuleRegistrationFailedException, NonRetryableException
 from citrine.resources.response import Response
@@ -45,6 +49,26 @@ class Collection(Generic[ResourceType], Pageable):
     def build(self, data: dict):
         """Build an individual element of the collection."""
 
+    def build_many(self, data: Iterable[dict]) -> list[ResourceType]:
+        """
+        Build an element of the collection from each of several dictionaries, such as a page.
+
+        By default this calls `build` on each one.  Collections that can build a whole page
+        faster, sharing the work that is the same for every element, override it.
+        """
+        return [self.build(item) for item in data]
+
+    def _building(self) -> AbstractContextManager:
+        """
+        Enter a context for building resources from the platform's responses.
+
+        If the session was created with `trusted_build=True`, the responses are built without
+        validating the types of their values.
+        """
+        if self.session.trusted_build:
+            return trusted_build()
+        return nullcontext()
+
     def get(self, uid: UUID | str) -> ResourceType:
         """Get a particular element of the collection."""
         if uid is None:
@@ -52,7 +76,8 @@ class Collection(Generic[ResourceType], Pageable):
         path = self._get_path(uid)
         data = self.session.get_resource(path, version=self._api_version)
         data = data[self._individual_key] if self._individual_key else data
-        return self.build(data)
+        with self._building():
+            return self.build(data)
 
     def register(self, model: CreationType) -> CreationType:
         """Create a new element of the collection by registering an existing resource."""
@@ -60,11 +85,12 @@ class Collection(Generic[ResourceType], Pageable):
         try:
             data = self.session.post_resource(path, model.dump(), version=self._api_version)
             data = data[self._individual_key] if self._individual_key else data
-            return self.build(data)
+            with self._building():
+                return self.build(data)
         except NonRetryableException as e:
             raise ModuleRegistrationFailedException(model.__class__.__name__, e)
 
-    def list(self, *, per_page: int = 100) -> Iterator[ResourceType]:
+    def list(self, *, per_page: int = 100, lazy: bool = False) -> Iterator[ResourceType]:
         """
         Paginate over the elements of the collection.
 
@@ -77,6 +103,10 @@ class Collection(Generic[ResourceType], Pageable):
             Max number of results to return per page. Default is 100.  This parameter
             is used when making requests to the backend service.  If the page parameter
             is specified it limits the maximum number of elements in the response.
+        lazy: bool, optional
+            Whether to defer building the nested objects of each resource until they are first
+            read.  This makes listing faster when only a few fields, such as names, are used.
+            Errors in the nested data are then raised when they are read.  Default is False.
 
         Returns
         -------
@@ -86,7 +116,8 @@ class Collection(Generic[ResourceType], Pageable):
 
         """
         return self._paginator.paginate(page_fetcher=self._fetch_page,
-                                        collection_builder=self._build_collection_elements,
+                                        collection_builder=partial(
+                                            self._build_collection_elements, lazy=lazy),
                                         per_page=per_page)
 
     def update(self, model: CreationType) -> CreationType:
@@ -94,7 +125,8 @@ class Collection(Generic[ResourceType], Pageable):
         url = self._get_path(model.uid)
         updated = self.session.put_resource(url, model.dump(), version=self._api_version)
         data = updated[self._individual_key] if self._individual_key else updated
-        return self.build(data)
+        with self._building():
+            return self.build(data)
 
     def delete(self, uid: UUID | str) -> Response:
         """Delete a particular element of the collection."""
@@ -103,7 +135,9 @@ class Collection(Generic[ResourceType], Pageable):
         return Response(body=data)
 
     def _build_collection_elements(self,
-                                   collection: Iterable[dict]) -> Iterator[ResourceType]:
+                                   collection: Iterable[dict],
+                                   *,
+                                   lazy: bool = False) -> Iterator[ResourceType]:
         """
         For each element in the collection, build the appropriate resource type.
 
@@ -111,6 +145,8 @@ class Collection(Generic[ResourceType], Pageable):
         ---------
         collection: Iterable[dict]
             collection containing the elements to be built
+        lazy: bool
+            Whether to defer building the nested objects of each element until they are read
 
         Returns
         -------
@@ -118,5 +154,7 @@ class Collection(Generic[ResourceType], Pageable):
             Resources in this collection.
 
         """
-        for element in collection:
-            yield self.build(element)
+        # Build the page before yielding, so the contexts never outlive the build
+        with self._building(), lazy_build() if lazy else nullcontext():
+            built = self.build_many(collection)
+        yield from built
@@ -2,6 +2,9 @@ from collections.abc import Callable, Iterable, Iterator
 from typing import Any, Generic, TypeVar
 from uuid import uuid4
 
+from citrine._serialization.interning import interned, interning
+from citrine._utils.functions import read_ahead
+
 ResourceType = TypeVar('ResourceType')
 
 
@@ -18,7 +21,8 @@ class Paginator(Generic[ResourceType]):
                  collection_builder: Callable[[Iterable[dict]], Iterable[ResourceType]],
                  per_page: int = 100,
                  search_params: dict | None = None,
-                 deduplicate: bool = True) -> Iterator[ResourceType]:
+                 deduplicate: bool = True,
+                 prefetch: int = 0) -> Iterator[ResourceType]:
         """
         A generic support class to paginate requests into an iterable of a built object.
 
@@ -45,6 +49,10 @@ class Paginator(Generic[ResourceType]):
             no search_params argument will get passed to the page_fetcher function.
         deduplicate: bool, optional
             Whether to deduplicate the yielded resources by their uid.  The default is true.
+        prefetch: int, optional
+            The number of pages to request ahead of the caller on a background thread, so that
+            fetching the next page overlaps with consuming the current one.  The default, 0,
+            fetches each page only once the previous one has been consumed.
 
         Returns
         -------
@@ -57,14 +65,17 @@ class Paginator(Generic[ResourceType]):
         search_params = {} if search_params is None else {'search_params': search_params}
 
         first_entity = None
-        page_idx = 1
         uids = set()
+        table = {}  # Share repeated links and strings among all the elements of every page
 
-        while True:
-            subset_collection, next_uri = page_fetcher(page=page_idx, per_page=per_page,
-                                                       **search_params)
+        pages = self._pages(page_fetcher, per_page=per_page, search_params=search_params,
+                            prefetch=prefetch)
+        if prefetch:
+            pages = read_ahead(pages, depth=prefetch)
 
-            subset = collection_builder(subset_collection)
+        for subset_collection, next_uri in pages:
+            with interning(table):  # Builders may build the page now, or each element later
+                subset = interned(collection_builder(subset_collection), table)
 
             count = 0
             for idx, element in enumerate(subset):
@@ -99,6 +110,28 @@ class Paginator(Generic[ResourceType]):
             if next_uri == "" and count < per_page:
                 break
 
+    @staticmethod
+    def _pages(page_fetcher: Callable[..., tuple[Iterable[dict], str]],
+               *,
+               per_page: int,
+               search_params: dict,
+               prefetch: int) -> Iterator[tuple[Iterable[dict], str]]:
+        """
+        Fetch successive pages until the last one.
+
+        Without prefetching, pages are only requested on demand, and `paginate` decides when to
+        stop.  A read-ahead thread can't wait for that decision, so it stops by itself after a
+        short final page instead of requesting pages past the end.
+        """
+        page_idx = 1
+        while True:
+            subset_collection, next_uri = page_fetcher(page=page_idx, per_page=per_page,
+                                                       **search_params)
+            if prefetch:
+                subset_collection = list(subset_collection)
+            yield subset_collection, next_uri
+            if prefetch and next_uri == "" and len(subset_collection) < per_page:
+                return
             page_idx += 1
 
     def _comparison_fields(self, entity: ResourceType) -> Any:
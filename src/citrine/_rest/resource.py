@@ -1,8 +1,10 @@
+from collections.abc import Callable, Iterable
 from typing import TypeVar
 from uuid import UUID
 
 from citrine._serialization.serializable import Serializable
 from citrine._serialization import properties
+from citrine._serialization.interning import interning
 from gemd.entity.dict_serializable import DictSerializable
 from gemd.enumeration.base_enumeration import BaseEnumeration
 from gemd.util import make_index, substitute_objects
@@ -57,24 +59,53 @@ class GEMDResource(Resource[GEMDSelf]):
     @classmethod
     def build(cls, data: dict) -> GEMDSelf:
         """Convert a raw, nested dictionary into Objects."""
-        if "context" in data and len(data) == 2:
-            def _inflate(x):
-                return DictSerializable.class_mapping[x["type"]].build(x)
-            key = next(k for k in data if k != "context")
-            idx = make_index([_inflate(x) for x in data["context"] + [data[key]]])
-            lst = [idx[k] for k in idx]
-            substitute_objects(lst, idx, inplace=True)
-
-            root = _inflate(data[key])
-            if root in idx:  # It was a link
-                return idx[root]
-            else:  # It was an object, but it won't be densely linked
-                return idx[root.to_link()]
-        else:
-            if data.get("type") is not None:
-                if not issubclass(cls, DictSerializable.class_mapping.get(data.get("type"))):
-                    raise ValueError(f"{cls.__name__} passed a {data.get('type')} dictionary.")
-            return super().build(data)
+        with interning():
+            if "context" in data and len(data) == 2:
+                def _inflate(x):
+                    return DictSerializable.class_mapping[x["type"]].build(x)
+                key = next(k for k in data if k != "context")
+                idx = make_index([_inflate(x) for x in data["context"] + [data[key]]])
+                lst = [idx[k] for k in idx]
+                substitute_objects(lst, idx, inplace=True)
+
+                root = _inflate(data[key])
+                if root in idx:  # It was a link
+                    return idx[root]
+                else:  # It was an object, but it won't be densely linked
+                    return idx[root.to_link()]
+            else:
+                if data.get("type") is not None:
+                    if not issubclass(cls, DictSerializable.class_mapping.get(data.get("type"))):
+                        raise ValueError(f"{cls.__name__} passed a {data.get('type')} dictionary.")
+                return super().build(data)
+
+    @classmethod
+    def build_many(cls, data: Iterable[dict]) -> list[GEMDSelf]:
+        """Convert several raw dictionaries into Objects, sharing their repeated values."""
+        with interning():
+            return super().build_many(data)
+
+    @classmethod
+    def _builder(cls) -> Callable[[dict], GEMDSelf]:
+        """
+        Find a function that builds objects like `build` does, for use by `build_many`.
+
+        Dictionaries of this class's type are built directly, and anything else, such as an
+        object with its context, by `build`.
+        """
+        build = cls._object_builder()
+        matches = {None: True}
+
+        def build_one(data: dict) -> GEMDSelf:
+            typ = data.get("type")
+            match = matches.get(typ)
+            if match is None:
+                base = DictSerializable.class_mapping.get(typ)
+                match = matches[typ] = base is not None and issubclass(cls, base)
+            if match and not ("context" in data and len(data) == 2):
+                return build(data)
+            return cls.build(data)
+        return build_one
 
     def as_dict(self) -> dict:
         """
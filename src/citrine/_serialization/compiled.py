@@ -0,0 +1,247 @@
+"""Generated build and dump functions for Serializable classes."""
+from functools import lru_cache
+from typing import Any, Callable
+
+from citrine._serialization.interning import intern_string
+from citrine._serialization.lazy import Deferred, _lazy
+
+
+def _storage_key(klass: type, name: str, field) -> str | None:
+    """
+    Find the attribute instances of a class keep a field's value in, if it is safe to use directly.
+
+    Fields whose values are handled by a parent class's accessors, and classes that customize
+    attribute access, must go through the descriptor instead.
+    """
+    if field._key is None or klass.__setattr__ is not object.__setattr__ \
+            or klass.__getattribute__ is not object.__getattribute__:
+        return None
+    owner = next(c for c in klass.__mro__ if name in c.__dict__)
+    if owner.__dict__[name] is not field:
+        return None  # Hidden by a subclass attribute that isn't a Property
+    return field._key
+
+
+def _builds_objects(field) -> bool:
+    """Determine whether deserializing a field builds nested objects, so it can be deferred."""
+    from citrine._serialization import properties
+
+    if isinstance(field, (properties.Object, properties.LinkOrElse)):
+        return True
+    elif isinstance(field, properties.Optional):
+        return _builds_objects(field.prop)
+    elif isinstance(field, (properties.List, properties.Set)):
+        return _builds_objects(field.element_type)
+    elif isinstance(field, properties.Mapping):
+        return _builds_objects(field.values_type)
+    elif isinstance(field, (properties.Union, properties.SpecifiedMixedList)):
+        return any(_builds_objects(element_type) for element_type in field.element_types)
+    return False
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _trusted_deserializer(field) -> Callable[[Any], Any]:
+    """
+    Find a function that deserializes a field's values without checking their types first.
+
+    Strings need no conversion beyond being shared inside `interning`, and the elements of
+    optional values, lists, sets and mappings are deserialized without checks as well.  Other
+    properties are deserialized as usual, but without the check that the value has one of their
+    serialized types.
+    """
+    from citrine._serialization import properties
+
+    if type(field) is properties.String:
+        return intern_string
+    elif type(field) is properties.Raw:
+        return _identity
+    elif type(field) is properties.Optional:
+        prop = _trusted_deserializer(field.prop)
+        return lambda value: None if value is None else prop(value)
+    elif type(field) is properties.List:
+        element = _trusted_deserializer(field.element_type)
+        return lambda value: [element(item) for item in value]
+    elif type(field) is properties.Set:
+        element = _trusted_deserializer(field.element_type)
+        return lambda value: {element(item) for item in value}
+    elif type(field) is properties.Mapping:
+        keys = _trusted_deserializer(field.keys_type)
+        values = _trusted_deserializer(field.values_type)
+        return lambda value: {keys(key): values(item) for key, item in
+                              (value if type(value) is list else value.items())}
+    return field._deserialize
+
+
+def _missing(data: dict, field, key: str) -> ValueError:
+    """Build the same error as `Property.deserialize_from_dict` for a missing required field."""
+    return ValueError("Unable to deserialize {} into {}, missing a required field: {}".format(
+        data, field.underlying_types, key))
+
+
+def _compile(name: str, lines: list[str], namespace: dict) -> Callable:
+    """Compile the source of a function and return it."""
+    code = compile("\n".join(lines), f"<citrine serializer {name}>", "exec")
+    exec(code, namespace)
+    return namespace[name]
+
+
+@lru_cache(maxsize=1024)
+def compiled_builder(klass: type, trusted: bool = False) -> Callable[[dict], Any] | None:
+    """
+    Generate a function that builds an instance of a class from its serialized form.
+
+    The generated function behaves like `Object(klass)._deserialize`, but with each field's path
+    unrolled and the values of the class's own fields stored without going through the
+    descriptors.  Inside `lazy_build`, fields holding nested objects are stored in serialized
+    form, to be built when they are first read.  Classes whose fields can't be handled this
+    way get None, and should be built by looping over their fields instead.
+
+    Parameters
+    ----------
+    klass: type
+        A Serializable class that is not polymorphic and has fields.
+    trusted: bool
+        Whether to skip checking the types of serialized and deserialized values, for use
+        inside `trusted_build`.
+
+    Returns
+    -------
+    Callable[[dict], Any] | None
+        The generated build function, or None if one could not be generated.
+
+    """
+    from citrine._serialization import properties
+
+    obj = properties._object_property(klass)
+    fields = obj.fields
+    if not fields or any(field.deserializable and field.serialization_path is None
+                         for field in fields.values()):
+        return None
+
+    namespace = {"_klass": klass, "_new": klass.__new__, "_missing": _missing,
+                 "_fallback": obj._deserialize_fields, "_lazy": _lazy.get, "_Deferred": Deferred}
+    lines = ["def build(data):", "    lazy = _lazy()"]
+    values = list()
+    for index, (name, field) in enumerate(fields.items()):
+        value = f"v{index}"
+        deferrable = not field.use_init and _storage_key(klass, name, field) is not None \
+            and _builds_objects(field)
+        if field.deserializable:
+            namespace[f"_f{index}"] = field
+            namespace[f"_d{index}"] = _trusted_deserializer(field) if trusted \
+                else field.deserialize
+            required = field.default is None and not field.optional
+            indent = "    "
+            source = "data"
+            for key in field.serialization_path.split('.'):
+                lines.append(f"{indent}{value} = {source}.get({key!r})")
+                lines.append(f"{indent}if {value} is None:")
+                if required:
+                    lines.append(f"{indent}    raise _missing(data, _f{index}, {key!r})")
+                else:
+                    lines.append(f"{indent}    {value} = _d{index}(_f{index}.serialize("
+                                 f"_f{index}.default))")
+                lines.append(f"{indent}else:")
+                indent += "    "
+                source = value
+            if deferrable:
+                lines.append(f"{indent}{value} = _Deferred(_f{index}, {value}) if lazy "
+                             f"else _d{index}({value})")
+            else:
+                lines.append(f"{indent}{value} = _d{index}({value})")
+        elif field.default is not None:
+            namespace[f"_default{index}"] = field.default
+            lines.append(f"    {value} = _default{index}")
+        else:
+            continue
+        values.append((index, name, field, value, deferrable))
+
+    init_args = ", ".join(f"{name}={value}"
+                          for _, name, field, value, _ in values if field.use_init)
+    if any(field.use_init for field in fields.values()):
+        lines.extend(["    try:",
+                      f"        instance = _klass({init_args})",
+                      "    except TypeError:",
+                      "        return _fallback(data)  # To raise the same error"])
+    else:
+        lines.append("    instance = _new(_klass)")
+    for index, name, field, value, deferrable in values:
+        if field.use_init:
+            continue
+        key = _storage_key(klass, name, field)
+        if key is not None and field.deserializable:
+            # Freshly deserialized values don't need the conversions done by the setter
+            store = f"instance.{key} = {value}" if key.isidentifier() \
+                else f"setattr(instance, {key!r}, {value})"
+            if trusted:
+                lines.append(f"    {store}")
+                continue
+            namespace[f"_t{index}"] = field.underlying_types
+            check = f"isinstance({value}, _t{index})"
+            if deferrable:
+                check = f"type({value}) is _Deferred or {check}"
+            lines.append(f"    if {check}:")
+            lines.append(f"        {store}")
+            lines.append("    else:")
+            lines.append(f"        setattr(instance, {name!r}, {value})")
+        else:
+            lines.append(f"    setattr(instance, {name!r}, {value})")
+    lines.append("    return instance")
+    return _compile("build", lines, namespace)
+
+
+@lru_cache(maxsize=1024)
+def compiled_dumper(klass: type) -> Callable[[Any], dict] | None:
+    """
+    Generate a function that serializes an instance of a class to a dictionary.
+
+    The generated function behaves like `Object(klass)._serialize` on an instance of exactly
+    `klass`, but with each field's path unrolled and the values of the class's own fields read
+    without going through the descriptors.  Classes whose fields can't be handled this way get
+    None, and should be serialized by looping over their fields instead.
+
+    Parameters
+    ----------
+    klass: type
+        A Serializable class that has fields.
+
+    Returns
+    -------
+    Callable[[Any], dict] | None
+        The generated dump function, or None if one could not be generated.
+
+    """
+    from citrine._serialization import properties
+
+    fields = properties._object_property(klass).fields
+    if not fields or any(field.serializable and field.serialization_path is None
+                         for field in fields.values()):
+        return None
+
+    namespace = {"_Deferred": Deferred}
+    lines = ["def dump(obj):", "    serialized = {}"]
+    for index, (name, field) in enumerate(fields.items()):
+        if not field.serializable:
+            continue
+        namespace[f"_s{index}"] = field.serialize
+        key = _storage_key(klass, name, field)
+        if key is not None and _builds_objects(field):
+            # Read through the descriptor if the value was deferred, to build it
+            namespace[f"_default{index}"] = field.default
+            lines.append(f"    v{index} = getattr(obj, {key!r}, _default{index})")
+            lines.append(f"    if type(v{index}) is _Deferred:")
+            lines.append(f"        v{index} = obj.{name}")
+            value = f"v{index}"
+        elif key is not None:
+            namespace[f"_default{index}"] = field.default
+            value = f"getattr(obj, {key!r}, _default{index})"
+        else:
+            value = f"obj.{name}"
+        *parents, last = field.serialization_path.split('.')
+        target = "serialized" + "".join(f".setdefault({parent!r}, {{}})" for parent in parents)
+        lines.append(f"    {target}[{last!r}] = _s{index}({value})")
+    lines.append("    return serialized")
+    return _compile("dump", lines, namespace)
@@ -0,0 +1,158 @@
+"""Sharing of repeated links and strings among objects built from the same listing."""
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from gemd.entity.dict_serializable import DictSerializable
+from gemd.entity.link_by_uid import LinkByUID
+
+T = TypeVar('T')
+
+_table = ContextVar("interning", default=None)
+
+MAX_SIZE = 65536
+"""The most values an interning table holds.  Later values are not shared, but are still found."""
+
+
+@contextmanager
+def interning(table: dict | None = None) -> Iterator[dict]:
+    """
+    Share equal links and strings among the objects built in this context.
+
+    Links to the same object, and equal attribute names, units and origins, are replaced with a
+    single instance as objects are built, so a large listing of objects from one dataset doesn't
+    keep thousands of copies of its template links and units.  Shared links are the same object
+    in every object that refers to them, so modify a link by replacing it rather than by setting
+    its `scope` or `id`.
+
+    Parameters
+    ----------
+    table: dict | None
+        The interning table to use, so values can be shared across several contexts.  If None,
+        the active table is used, or a new one if there is none.
+
+    Yields
+    ------
+    dict
+        The interning table.
+
+    """
+    if table is None:
+        table = _table.get()
+        if table is not None:
+            yield table
+            return
+        table = {}
+    token = _table.set(table)
+    try:
+        yield table
+    finally:
+        _table.reset(token)
+
+
+def interned(objects: Iterable[T], table: dict | None = None) -> Iterator[T]:
+    """
+    Iterate over lazily built objects, building each one in the same interning context.
+
+    A generator can't enter a context on behalf of its consumer, so this enters it around
+    building each object instead.
+
+    Parameters
+    ----------
+    objects: Iterable[T]
+        The objects, typically a generator that builds each one.
+    table: dict | None
+        The interning table to use.  If None, a new one is used for these objects.
+
+    Yields
+    ------
+    T
+        The built objects.
+
+    """
+    table = {} if table is None else table
+    iterator = iter(objects)
+    while True:
+        with interning(table):
+            try:
+                obj = next(iterator)
+            except StopIteration:
+                return
+        yield obj
+
+
+def _intern(table: dict, key: Any, value: T) -> T:
+    found = table.get(key)
+    if found is not None:
+        return found
+    if len(table) < MAX_SIZE:
+        table[key] = value
+    return value
+
+
+def intern_link(link: LinkByUID) -> LinkByUID:
+    """Return the shared instance of a link, if objects are being built in `interning`."""
+    table = _table.get()
+    if table is None:
+        return link
+    return _intern(table, (LinkByUID, link.scope, link.id), link)
+
+
+def intern_string(value: str) -> str:
+    """Return the shared instance of a string, if objects are being built in `interning`."""
+    table = _table.get()
+    if table is None:
+        return value
+    return _intern(table, value, value)
+
+
+def intern_values(obj: DictSerializable) -> DictSerializable:
+    """
+    Share the links and strings held by a gemd object, if it is being built in `interning`.
+
+    The object's attributes are replaced in place, including those of its nested values and
+    attributes, e.g., the template link of a property and the units of its value.  A link is
+    replaced by its shared instance instead.
+    """
+    table = _table.get()
+    if table is None:
+        return obj
+    return _share(obj, table, set())
+
+
+def _attribute_names(obj: DictSerializable) -> tuple[str, ...]:
+    """
+    Find the names of the attributes of instances of an object's class.
+
+    Reading `vars` of an object makes a dictionary of its attributes, which objects don't
+    otherwise need, so the names are only read from the first instance of each class.
+    """
+    names = _ATTRIBUTE_NAMES.get(type(obj))
+    if names is None:
+        names = _ATTRIBUTE_NAMES[type(obj)] = tuple(vars(obj))
+    return names
+
+
+_ATTRIBUTE_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _share(value: T, table: dict, seen: set) -> T:
+    """Return the shared instance of a value, after sharing the values it holds."""
+    if type(value) is str:
+        return _intern(table, value, value)
+    elif isinstance(value, LinkByUID):
+        return _intern(table, (LinkByUID, value.scope, value.id), value)
+    elif isinstance(value, DictSerializable) and id(value) not in seen:
+        seen.add(id(value))  # Objects may refer to each other
+        for name in _attribute_names(value):
+            item = getattr(value, name, None)
+            shared = _share(item, table, seen)
+            if shared is not item:
+                setattr(value, name, shared)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            shared = _share(item, table, seen)
+            if shared is not item:
+                value[index] = shared
+    return value
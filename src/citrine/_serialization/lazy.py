@@ -0,0 +1,42 @@
+"""Deferred deserialization of nested objects."""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_lazy = ContextVar("lazy_build", default=False)
+
+
+class Deferred:
+    """The serialized value of a property, deserialized the first time the property is read."""
+
+    __slots__ = ("prop", "data")
+
+    def __init__(self, prop, data: Any):
+        self.prop = prop
+        self.data = data
+
+    def resolve(self) -> Any:
+        """Deserialize the value."""
+        return self.prop.deserialize(self.data)
+
+
+@contextmanager
+def lazy_build() -> Iterator[None]:
+    """
+    Defer building the nested objects of any objects built in this context.
+
+    Objects built while the context is active keep the serialized form of their nested
+    objects (and lists or mappings of them), and build each one the first time it is read.
+    This makes building many large objects cheap when only a few of their fields are used,
+    e.g., finding one predictor by name among thousands.  Any error in the nested data is
+    raised when it is read rather than when the outer object is built.
+
+    Only objects built inside the context are affected, so a paginated listing must be
+    iterated inside it.  Reading a deferred field after the context ends still builds it.
+    """
+    token = _lazy.set(True)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
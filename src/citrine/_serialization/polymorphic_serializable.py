@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Callable, Iterable
 from typing import Generic, TypeVar
 
 from citrine._serialization.serializable import Serializable
@@ -8,7 +9,25 @@ SelfType = TypeVar('SelfType', bound='PolymorphicSerializable')
 
 
 class PolymorphicSerializable(Generic[SelfType]):
-    """A Wrapper class for Polymorphic deserialization of Serializable objects."""
+    """
+    A Wrapper class for Polymorphic deserialization of Serializable objects.
+
+    Each class that directly extends PolymorphicSerializable gets a registry, `_subtypes`, of
+    its subtypes keyed by the default value of their `typ` property.  Subtypes are added as
+    they are defined, so `get_type` can look them up rather than building a mapping per call.
+    """
+
+    _subtypes: dict[str, type[Serializable]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if PolymorphicSerializable in cls.__bases__:
+            cls._subtypes = {}
+        typ = getattr(cls.__dict__.get("typ"), "default", None)
+        if isinstance(typ, str):
+            for base in cls.__mro__[1:]:
+                if "_subtypes" in base.__dict__:
+                    base._subtypes.setdefault(typ, cls)
 
     @classmethod
     @abstractmethod
@@ -20,3 +39,30 @@ class PolymorphicSerializable(Generic[SelfType]):
         """Build the underlying type."""
         subtype = cls.get_type(data)
         return subtype.build(data)
+
+    @classmethod
+    def build_many(cls, data: Iterable[dict]) -> list[SelfType]:
+        """
+        Build an instance of the underlying type of each of several serialized forms.
+
+        This gives the same objects as calling `build` on each one, but how to build each
+        underlying type is only worked out the first time it is seen.
+        """
+        build = cls._builder()
+        return [build(item) for item in data]
+
+    @classmethod
+    def _builder(cls) -> Callable[[dict], SelfType]:
+        """Find a function that builds instances like `build` does, for use by `build_many`."""
+        if cls.build.__func__ is not PolymorphicSerializable.build.__func__:
+            return cls.build
+        get_type = cls.get_type
+        builders = {}
+
+        def build(data: dict) -> SelfType:
+            subtype = get_type(data)
+            builder = builders.get(subtype)
+            if builder is None:
+                builder = builders[subtype] = subtype._builder()
+            return builder(data)
+        return build
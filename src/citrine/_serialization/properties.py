@@ -2,7 +2,7 @@
 import re
 import uuid
 from abc import abstractmethod
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from datetime import datetime
 from functools import lru_cache
 from inspect import signature
@@ -16,6 +16,10 @@ from gemd.entity.link_by_uid import LinkByUID
 from gemd.entity.dict_serializable import DictSerializable
 from gemd.util.impl import cached_isinstance as isinstance
 
+from citrine._serialization.compiled import compiled_builder, compiled_dumper
+from citrine._serialization.interning import intern_link, intern_string, intern_values
+from citrine._serialization.lazy import Deferred
+from citrine._serialization.trusted import _trusted
 from citrine._serialization.serializable import Serializable
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 
@@ -24,6 +28,11 @@ DeserializedType = TypeVar('DeserializedType')
 SerializedInteger = TypeVar('SerializedInteger', int, str)
 SerializedFloat = TypeVar('SerializedFloat', float, str)
 
+# The timezone arrow attaches to UTC times, so fast paths produce identical datetimes
+_UTC = arrow.get(0).datetime.tzinfo
+# ISO 8601 times in UTC, as the platform formats them
+_ISO_UTC = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d{1,6})?Z?")
+
 
 class Property(Generic[DeserializedType, SerializedType]):
     """
@@ -66,13 +75,17 @@ class Property(Generic[DeserializedType, SerializedType]):
         if override:
             self._key: None = None
         else:
-            self._key: str = '__' + str(uuid.uuid4())  # Make this object key human-readable
+            # Replaced by a stable name once the property is assigned to a class
+            self._key: str = '__' + str(uuid.uuid4())
+        self._named: bool = False
         self.serializable: bool = serializable
         self.deserializable: bool = deserializable
         self.default: DeserializedType | None = default
         # Distinguish between no default being provided and the default being None
         self.optional: bool = False
         self.use_init: bool = use_init
+        # The attribute name and parent class of this property, for each class that uses it
+        self._resolved: dict[type, tuple[str | None, type | None]] = {}
 
     @property
     @abstractmethod
@@ -155,10 +168,54 @@ class Property(Generic[DeserializedType, SerializedType]):
         _data[fields[-1]] = self.serialize(value, base_class=None)  # Always a dict
         return data
 
+    def __set_name__(self, owner: type, name: str):
+        """
+        Name the instance attribute the value is stored under after the class attribute.
+
+        The name is mangled like a private attribute of the class that defines the property, so
+        it is the same in every process and doesn't collide with the same-named properties of
+        parent classes.  A property assigned to several classes keeps its first name, and one
+        whose name is already taken keeps its random name.
+        """
+        if self._key is None or self._named:
+            return
+        key = f"_{owner.__name__.lstrip('_')}__{name}"
+        taken = {value._key for base in owner.__mro__[1:] for value in base.__dict__.values()
+                 if isinstance(value, Property)}
+        if key not in taken and not any(key in base.__dict__ for base in owner.__mro__):
+            self._key = key
+            self._named = True
+
+    def _resolve(self, klass: type) -> tuple[str | None, type | None]:
+        """Find the attribute name and the parent class of this property, once per class."""
+        try:
+            return self._resolved[klass]
+        except KeyError:
+            resolved = self._resolved[klass] = _get_key_and_base_class(self, klass)
+            return resolved
+
+    def _store(self, obj, value_to_set):
+        """Store a value, deferring to the setter of the parent class, if applicable."""
+        if self._key is not None:
+            setattr(obj, self._key, value_to_set)
+            return
+        property_name, base_class = self._resolve(type(obj))
+        if base_class is not None:
+            prop = getattr(base_class, property_name)
+            if prop.fset is not None:  # It's a property with a setter
+                prop.fset(obj, value_to_set)
+            else:  # It's a read-only property
+                raise AttributeError(f"can't set attribute '{property_name}'")
+        else:
+            raise AttributeError(
+                f"No parent class could be resolved for '{property_name}' in "
+                f"{obj.__class__}.  'override' should probably be false."
+            )
+
     def __get__(self, obj, objtype=None) -> DeserializedType:
         """Property getter, deferring to the getter of the parent class, if applicable."""
         if self._key is None:
-            property_name, base_class = _get_key_and_base_class(self, type(obj))
+            property_name, base_class = self._resolve(type(obj))
             if base_class is not None:
                 return getattr(base_class, property_name).fget(obj)
             else:
@@ -167,31 +224,21 @@ class Property(Generic[DeserializedType, SerializedType]):
                     f"in {obj.__class__}.  'override' should probably be false."
                 )
         else:
-            return getattr(obj, self._key, self.default)
+            value = getattr(obj, self._key, self.default)
+            if type(value) is Deferred:  # Built lazily; build it now, and keep the result
+                value = value.resolve()
+                setattr(obj, self._key, value)
+            return value
 
     def __set__(self, obj, value: SerializedType | DeserializedType):
         """Property setter, deferring to the setter of the parent class, if applicable."""
-        property_name, base_class = _get_key_and_base_class(self, type(obj))
         if issubclass(type(value), self.underlying_types):
             value_to_set = value
         else:
             # if value is not an underlying type, set its deserialized version.
+            _, base_class = self._resolve(type(obj))
             value_to_set = self.deserialize(value, base_class=base_class)
-
-        if self._key is None:
-            if base_class is not None:
-                prop = getattr(base_class, property_name)
-                if prop.fset is not None:  # It's a property with a setter
-                    prop.fset(obj, value_to_set)
-                else:  # It's a read-only property
-                    raise AttributeError(f"can't set attribute '{property_name}'")
-            else:
-                raise AttributeError(
-                    f"No parent class could be resolved for '{property_name}' in "
-                    f"{obj.__class__}.  'override' should probably be false."
-                )
-        else:
-            setattr(obj, self._key, value_to_set)
+        self._store(obj, value_to_set)
 
     def __str__(self):
         return '<Property {!r}>'.format(self.serialization_path)
@@ -205,32 +252,19 @@ class PropertyCollection(Property[DeserializedType, SerializedType]):
 
         This setter defers to the subclass to implement the `_set_elements` logic
         """
-        property_name, base_class = _get_key_and_base_class(self, type(obj))
         if issubclass(type(value), self.underlying_types):
             value_to_set = self._set_elements(value)
         elif issubclass(type(value), self.serialized_types):
             # if value is not an underlying type, set its deserialized version.
+            _, base_class = self._resolve(type(obj))
             value_to_set = self.deserialize(value, base_class=base_class)
         else:
+            property_name, _ = self._resolve(type(obj))
             raise TypeError(
                 f"{value} is a {type(value)}, but {property_name} expects one of: "
                 f"{self.underlying_types}"
             )
-
-        if self._key is None:
-            if base_class is not None:
-                prop = getattr(base_class, property_name)
-                if prop.fset is not None:  # It's a property with a setter
-                    prop.fset(obj, value_to_set)
-                else:  # It's a read-only property
-                    raise AttributeError(f"can't set attribute '{property_name}'")
-            else:
-                raise AttributeError(
-                    f"No parent class could be resolved for '{property_name}' "
-                    f"in {obj.__class__}.  'override' should probably be false."
-                )
-        else:
-            setattr(obj, self._key, value_to_set)
+        self._store(obj, value_to_set)
 
     @abstractmethod
     def _set_elements(self, value: SerializedType | DeserializedType):
@@ -345,7 +379,7 @@ class String(Property[str, str]):
         value = self.default if value is None else value
         if value is None:
             raise ValueError('Value must not be none!')
-        return str(value)
+        return intern_string(str(value))
 
     def _serialize(self, value: str) -> str:
         return str(value)
@@ -385,12 +419,16 @@ class UUID(Property[uuid.UUID, str]):
         return str
 
     def _deserialize(self, value: str) -> uuid.UUID:
-        return uuid.UUID(value)
+        return _parse_uuid(value)
 
     def _serialize(self, value: uuid.UUID) -> str:
         return str(value)
 
 
+# Ids such as those of templates and datasets recur across objects, so share their UUIDs
+_parse_uuid = lru_cache(maxsize=1024)(uuid.UUID)
+
+
 class Datetime(Property[datetime, int]):
 
     @property
@@ -403,15 +441,25 @@ class Datetime(Property[datetime, int]):
 
     def _deserialize(self, value) -> datetime:
         if isinstance(value, str):
+            if _ISO_UTC.fullmatch(value):
+                try:
+                    return datetime.fromisoformat(value.rstrip("Z")).replace(tzinfo=_UTC)
+                except ValueError:
+                    pass  # An invalid date, or a precision Python 3.10 can't parse
             return arrow.get(value).datetime
         if isinstance(value, int):
-            # Backend returns time as ms since epoch, but arrow expects seconds since epoch
-            return arrow.get(value / 1000).datetime
+            # Backend returns time as ms since epoch, but datetime expects seconds since epoch
+            try:
+                return datetime.fromtimestamp(value / 1000, _UTC)
+            except (OverflowError, OSError, ValueError):
+                return arrow.get(value / 1000).datetime  # Normalizes or reports the timestamp
         raise TypeError("{} must be an int or a string".format(value))
 
     def _serialize(self, value: datetime) -> int:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=_UTC)  # Naive times are in UTC, as for arrow
         # Add 100 nanoseconds to avoid floating point truncation issues from microseconds
-        return int(arrow.get(value).float_timestamp * 1000 + 0.0001)
+        return int(value.timestamp() * 1000 + 0.0001)
 
 
 class List(PropertyCollection[list, list]):
@@ -741,16 +789,38 @@ class Object(PropertyCollection[Any, dict]):
     def serialized_types(self):
         return dict
 
+    def deserializer(self) -> Callable[[Any], Any]:
+        """
+        Find a function that deserializes values like `deserialize` does, to deserialize many.
+
+        The choices that don't depend on the value, such as how to build the class, are made
+        once, so the function should only be used while the context they depend on (e.g.,
+        `trusted_build`) is unchanged.
+        """
+        if self.polymorphic or not self.fields:
+            return self.deserialize
+        build = compiled_builder(self.klass, _trusted.get())
+        if build is None:
+            return self.deserialize
+        deserialize = self.deserialize
+        return lambda value: build(value) if type(value) is dict else deserialize(value)
+
     def _deserialize(self, data: dict) -> Any:
         if self.polymorphic:
             return self.klass.get_type(data).build(data)
         if not self.fields:
             # Maybe there are no fields because we hit a gemd-python class
             if issubclass(self.klass, DictSerializable):
-                return DictSerializable.build(data)
+                return intern_values(DictSerializable.build(data))
             raise AttributeError("Tried to deserialize to {!r}, which has no fields and is not an"
                                  " explicitly serializable class".format(self.klass))
+        build = compiled_builder(self.klass, _trusted.get())
+        if build is not None:
+            return build(data)
+        return self._deserialize_fields(data)
 
+    def _deserialize_fields(self, data: dict) -> Any:
+        """Build an instance by deserializing and setting each field in turn."""
         values = {}
         init_props = set()
         for property_name, field in self.fields.items():
@@ -802,6 +872,9 @@ class Object(PropertyCollection[Any, dict]):
             except AttributeError:
                 raise AttributeError("Tried to serialize object {!r} of type {}, which has "
                                      "neither fields not a dump() method.".format(obj, type(obj)))
+        dump = compiled_dumper(self.klass)
+        if dump is not None:
+            return dump(obj)
         for property_name, field in self.fields.items():
             if field.serializable:
                 value = getattr(obj, property_name)
@@ -818,6 +891,12 @@ class Object(PropertyCollection[Any, dict]):
             return self.deserialize(value)
 
 
+@lru_cache(maxsize=1024)
+def _object_property(klass: type) -> Object:
+    """Return a shared, unattached Object property for (de)serializing instances of a class."""
+    return Object(klass)
+
+
 class LinkOrElse(PropertyCollection[Serializable | LinkByUID, dict]):
     """
     A property that can either be a serializable object with IDs or a LinkByUID object.
@@ -874,6 +953,8 @@ class LinkOrElse(PropertyCollection[Serializable | LinkByUID, dict]):
         if 'type' in value:
             target = DictSerializable.class_mapping[value['type']]
             try:
+                if target is LinkByUID:
+                    return intern_link(LinkByUID.from_dict(value))
                 return target.build(value)
             except TypeError as e:
                 # TODO: Consider migrating this ValueError to a TypeError for 3
@@ -1,3 +1,4 @@
+from collections.abc import Callable, Iterable
 from typing import Generic, TypeVar
 
 
@@ -17,12 +18,44 @@ class Serializable(Generic[Self]):
         """Build an instance of this object from given data."""
         from citrine._serialization import properties
         pre_built = cls._pre_build(data)
-        return properties.Object(cls).deserialize(pre_built)
+        return properties._object_property(cls).deserialize(pre_built)
+
+    @classmethod
+    def build_many(cls, data: Iterable[dict]) -> list[Self]:
+        """
+        Build an instance of this object from each of several serialized forms.
+
+        This gives the same objects as calling `build` on each one, but the work that is the
+        same for all of them, such as finding how to build this class, is only done once.
+        """
+        build = cls._builder()
+        return [build(item) for item in data]
+
+    @classmethod
+    def _builder(cls) -> Callable[[dict], Self]:
+        """
+        Find a function that builds instances like `build` does, for use by `build_many`.
+
+        Classes that override `build` get `build` itself, unless they override this as well.
+        """
+        if cls.build.__func__ is not Serializable.build.__func__:
+            return cls.build
+        return cls._object_builder()
+
+    @classmethod
+    def _object_builder(cls) -> Callable[[dict], Self]:
+        """Find a function that builds instances like `Serializable.build` does."""
+        from citrine._serialization import properties
+        deserialize = properties._object_property(cls).deserializer()
+        if cls._pre_build.__func__ is Serializable._pre_build.__func__:
+            return deserialize
+        pre_build = cls._pre_build
+        return lambda data: deserialize(pre_build(data))
 
     def dump(self) -> dict:
         """Dump this instance."""
         from citrine._serialization import properties
-        serialized = properties.Object(type(self)).serialize(self)
+        serialized = properties._object_property(type(self)).serialize(self)
         return self._post_dump(serialized)
 
     def _post_dump(self, data: dict) -> dict:
@@ -0,0 +1,29 @@
+"""Deserialization of trusted payloads without validating their types."""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_trusted = ContextVar("trusted_build", default=False)
+
+
+@contextmanager
+def trusted_build() -> Iterator[None]:
+    """
+    Skip validating the types of serialized values for any objects built in this context.
+
+    Building an object normally checks that each serialized value has one of the types its
+    property accepts, and checks each deserialized value again before storing it.  Payloads
+    returned by the platform always have the expected types, so objects built from them can
+    skip those checks.  Missing required fields are still reported, and values that can be
+    one of several types are still checked to tell which type they are.
+
+    Only use this for data returned by the platform: a value of the wrong type in the payload
+    is stored as is, or fails with a less helpful error.  Objects built or modified by user
+    code are validated as usual.  Collections build the platform's responses this way when
+    their session was created with `trusted_build=True`.
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
@@ -1,9 +1,16 @@
+import asyncio
 import platform
-from collections.abc import Callable, Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
 from json.decoder import JSONDecodeError
 from logging import getLogger
 from os import environ
+from threading import Lock
 from urllib.parse import urlunsplit
 
 import jwt
@@ -13,12 +20,14 @@ from requests import Response
 from urllib3.util.retry import Retry
 
 import citrine
-from citrine._utils.functions import format_escaped_url
+from citrine._utils.functions import format_escaped_url, read_ahead
 from citrine.exceptions import (
     BadRequest,
     CitrineException,
     Conflict,
     NotFound,
+    PayloadTooLarge,
+    TooManyRequests,
     Unauthorized,
     UnauthorizedRefreshToken,
     WorkflowNotReadyException)
@@ -27,17 +36,80 @@ from citrine.exceptions import (
 # expiring during the check for expiration
 EXPIRATION_BUFFER: timedelta = timedelta(seconds=5)
 logger = getLogger(__name__)
+# Passed as the stale token to refresh whichever token is current
+_UNCONDITIONAL = object()
+
+_deferring_retry_after: ContextVar[bool] = ContextVar('_deferring_retry_after', default=False)
+
+
+@contextmanager
+def deferring_retry_after() -> Iterator[None]:
+    """
+    Raise 429 responses as TooManyRequests, rather than waiting and retrying them.
+
+    By default, a 429 response with a Retry-After header is slept on and retried before the
+    request returns.  Polling loops that wait on many things, and schedule their own retries,
+    make their requests within this context so that one throttled request doesn't block them.
+    """
+    token = _deferring_retry_after.set(True)
+    try:
+        yield
+    finally:
+        _deferring_retry_after.reset(token)
+
+
+class _Retry(Retry):
+    """A urllib3 Retry that doesn't retry 429 responses within `deferring_retry_after`."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429 and _deferring_retry_after.get():
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
 
 
 class Session(requests.Session):
-    """Wrapper around requests.Session that is both refresh-token and schema aware."""
+    """
+    Wrapper around requests.Session that is both refresh-token and schema aware.
+
+    A single session may be shared between threads.  Access token refreshes are serialized,
+    so that when the token expires only one refresh request is made and every other thread
+    waits for it and then reuses the new token.
+
+    Parameters
+    ----------
+    refresh_token: str
+        Unique key that allows a user to access the Citrine Platform.
+        Default: environ.get('CITRINE_API_KEY')
+    scheme: str
+        Networking protocol; usually https.  Default: https
+    host: str
+        Host URL, generally '<your_site>.citrine-platform.com'.
+        Default: environ.get('CITRINE_API_HOST')
+    port: str | None
+        Optional networking port.  Default: None
+    pool_maxsize: int
+        The maximum number of connections kept open to the platform.  This should be at least
+        the number of threads sharing the session.  Default: requests' default, 10
+    pool_block: bool
+        Whether a request should wait for a free connection once `pool_maxsize` connections
+        are in use, rather than opening (and then discarding) an extra one.
+        Default: requests' default, False
+    trusted_build: bool
+        Whether collections using this session build the platform's responses without
+        validating the types of their values, which is faster for large listings.  Objects
+        built or modified by user code are still validated.  Default: False
+
+    """
 
     def __init__(self,
                  refresh_token: str = None,
                  *,
                  scheme: str = None,
                  host: str = None,
-                 port: str | None = None):
+                 port: str | None = None,
+                 pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+                 pool_block: bool = requests.adapters.DEFAULT_POOLBLOCK,
+                 trusted_build: bool = False):
         super().__init__()
         if refresh_token is None:
             refresh_token = environ.get('CITRINE_API_KEY')
@@ -54,6 +126,7 @@ class Session(requests.Session):
         self.refresh_token: str = refresh_token
         self.access_token: str | None = None
         self.access_token_expiration: datetime = datetime.now(timezone.utc)
+        self._refresh_lock = Lock()
 
         agent = "{}/{} python-requests/{} citrine-python/{}".format(
             platform.python_implementation(),
@@ -75,16 +148,21 @@ class Session(requests.Session):
         # in a future release.
         self.use_idempotent_dataset_put = False
 
+        self.trusted_build = trusted_build
+
         # Custom adapter so we can use custom retry parameters. The default HTTP status
         # codes for retries are [503, 413, 429]. We're using status_force list to add
         # additional codes to retry on, focusing on specific CloudFlare 5XX errors.
-        retries = Retry(total=10,
-                        connect=5,
-                        read=5,
-                        status=5,
-                        backoff_factor=0.25,
-                        status_forcelist=[500, 502, 504, 520, 521, 522, 524, 527])
-        adapter = requests.adapters.HTTPAdapter(max_retries=retries)
+        # Polling loops handle 429s themselves; see `deferring_retry_after`.
+        retries = _Retry(total=10,
+                         connect=5,
+                         read=5,
+                         status=5,
+                         backoff_factor=0.25,
+                         status_forcelist=[500, 502, 504, 520, 521, 522, 524, 527])
+        adapter = requests.adapters.HTTPAdapter(max_retries=retries,
+                                                pool_maxsize=pool_maxsize,
+                                                pool_block=pool_block)
         self.mount('https://', adapter)
         self.mount('http://', adapter)
 
@@ -109,8 +187,20 @@ class Session(requests.Session):
         buffered_expire = self.access_token_expiration - EXPIRATION_BUFFER
         return datetime.now(timezone.utc) > buffered_expire
 
-    def _refresh_access_token(self) -> None:
-        """Optionally refresh our access token (if the previous one is about to expire)."""
+    def _refresh_access_token(self, stale_token: str | None | object = _UNCONDITIONAL) -> None:
+        """
+        Refresh our access token.
+
+        Only one refresh is in flight at a time.  If `stale_token` is given (even as None, before
+        any token was obtained) and another thread has already replaced it by the time the lock
+        is acquired, no request is made.
+        """
+        with self._refresh_lock:
+            if stale_token is not _UNCONDITIONAL and stale_token != self.access_token:
+                return
+            self._request_access_token()
+
+    def _request_access_token(self) -> None:
         data = {'refresh_token': self.refresh_token}
 
         response = self._request_with_retry('POST', self._versioned_base_url() + 'tokens/refresh',
@@ -155,7 +245,7 @@ class Session(requests.Session):
             logger.debug(f'\t{k}: {v}')
 
         if self._is_access_token_expired():
-            self._refresh_access_token()
+            self._refresh_access_token(stale_token=self.access_token)
         uri = self._versioned_base_url(version) + path.lstrip('/')
 
         logger.debug('\turi: {}'.format(uri))
@@ -164,11 +254,12 @@ class Session(requests.Session):
             logger.debug('\t{}: {}'.format(k, v))
         logger.debug('END request details.')
 
+        used_token = self.access_token
         response = self._request_with_retry(method, uri, **kwargs)
 
         try:
             if response.status_code == 401 and response.json().get("reason") == "invalid-token":
-                self._refresh_access_token()
+                self._refresh_access_token(stale_token=used_token)
                 response = self._request_with_retry(method, uri, **kwargs)
         except AttributeError:
             # Catch AttributeErrors and log response
@@ -203,14 +294,32 @@ class Session(requests.Session):
             elif response.status_code == 409:
                 logger.debug('%s %s %s', response.status_code, method, path)
                 raise Conflict(path, response)
+            elif response.status_code == 413:
+                logger.error('%s %s %s', response.status_code, method, path)
+                raise PayloadTooLarge(path, response)
             elif response.status_code == 425:
                 logger.debug('%s %s %s', response.status_code, method, path)
                 msg = 'Cant execute at this time. Try again later. Error: {}'.format(response.text)
                 raise WorkflowNotReadyException(msg)
+            elif response.status_code == 429:
+                logger.warning('%s %s %s', response.status_code, method, path)
+                raise TooManyRequests(response.text, retry_after=self._retry_after(response))
             else:
                 logger.error('%s %s %s', response.status_code, method, path)
                 raise CitrineException(response.text)
 
+    @staticmethod
+    def _retry_after(response: Response) -> float | None:
+        """Read how long a response asks to wait before retrying, in seconds, if it does."""
+        value = (response.headers.get('Retry-After') or '').strip()
+        if value.isdigit():  # A number of seconds
+            return float(value)
+        try:  # Or an HTTP date, which is always in GMT
+            when = parsedate_to_datetime(value).replace(tzinfo=timezone.utc)
+        except (TypeError, ValueError):
+            return None
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
     @staticmethod
     def _extract_response_stacktrace(response: Response) -> str | None:
         try:
@@ -269,12 +378,26 @@ class Session(requests.Session):
     @staticmethod
     def cursor_paged_resource(base_method: Callable[..., dict], path: str,
                               forward: bool = True, per_page: int = 100,
-                              version: str = 'v2', **kwargs) -> Iterator[dict]:
+                              version: str = 'v2', prefetch: int = 0,
+                              **kwargs) -> Iterator[dict]:
         """
         Returns a flat generator of results for an API query.
 
-        Results are fetched in chunks of size `per_page` and loaded lazily.
+        Results are fetched in chunks of size `per_page` and loaded lazily.  If `prefetch` is
+        positive, up to that many subsequent chunks are requested on a background thread while
+        the caller consumes the current one.
         """
+        pages = Session._cursor_pages(base_method, path, forward=forward, per_page=per_page,
+                                      version=version, **kwargs)
+        if prefetch:
+            pages = read_ahead(pages, depth=prefetch)
+        for page in pages:
+            yield from page
+
+    @staticmethod
+    def _cursor_pages(base_method: Callable[..., dict], path: str, *,
+                      forward: bool, per_page: int, version: str,
+                      **kwargs) -> Iterator[list[dict]]:
         params = kwargs.get('params', {})
         params['forward'] = forward
         params['ascending'] = forward
@@ -282,8 +405,7 @@ class Session(requests.Session):
         kwargs['params'] = params
         while True:
             response_json = base_method(path, version=version, **kwargs)
-            for obj in response_json['contents']:
-                yield obj
+            yield response_json['contents']
             cursor = response_json.get('next')
             if cursor is None:
                 break
@@ -310,6 +432,134 @@ class Session(requests.Session):
         return self.checked_request('GET', path, **kwargs)
 
 
+class AsyncSession:
+    """
+    An asyncio front end for :class:`Session`, backed by a pool of worker threads.
+
+    Every request is dispatched through a wrapped :class:`Session`, so token refresh, retries
+    and the mapping of HTTP status codes onto Citrine exceptions behave exactly as they do for
+    synchronous calls.  This is not a native asyncio HTTP client: each request is a blocking
+    call run on a worker thread with `loop.run_in_executor`, and holds that thread until it
+    completes.  Many requests can be awaited from a single event loop, but at most
+    :attr:`max_workers` are in flight at once; the rest wait for a free thread.
+
+    Parameters
+    ----------
+    refresh_token: str
+        Unique key that allows a user to access the Citrine Platform.
+        Default: environ.get('CITRINE_API_KEY')
+    scheme: str
+        Networking protocol; usually https.  Default: https
+    host: str
+        Host URL, generally '<your_site>.citrine-platform.com'.
+        Default: environ.get('CITRINE_API_HOST')
+    port: str | None
+        Optional networking port.  Default: None
+    max_workers: int
+        The most worker threads, which is the maximum number of requests that may be in flight
+        at once.  This is also the size of the connection pool of a session created here.
+        Threads and connections are only opened as requests need them, so a high limit costs
+        little while few requests are made.  Default: 256
+    session: Session | None
+        An existing session to wrap.  If provided, the connection arguments are ignored, and
+        its connection pool should hold at least `max_workers` connections.
+
+    """
+
+    def __init__(self,
+                 refresh_token: str = None,
+                 *,
+                 scheme: str = None,
+                 host: str = None,
+                 port: str | None = None,
+                 max_workers: int = 256,
+                 session: Session | None = None):
+        if session is None:
+            session = Session(refresh_token=refresh_token, scheme=scheme, host=host, port=port,
+                              pool_maxsize=max_workers)
+        self.session: Session = session
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='citrine-async')
+        self._max_workers = max_workers
+
+    @property
+    def max_workers(self) -> int:
+        """The number of worker threads, and so of requests that may be in flight at once."""
+        return self._max_workers
+
+    async def __aenter__(self) -> 'AsyncSession':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Shut down the worker threads and release the underlying connections."""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    async def aclose(self) -> None:
+        """
+        Shut down the worker threads and release the connections, without blocking the loop.
+
+        Shutting down waits for requests still in flight, so it is run on another thread.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def checked_request(self, method: str, path: str,
+                              version: str = 'v1', **kwargs) -> requests.Response:
+        """Check response status code and throw an exception if relevant."""
+        return await self._run(self.session.checked_request, method, path,
+                               version=version, **kwargs)
+
+    async def get_resource(self, path: str, **kwargs) -> dict:
+        """GET a particular resource as JSON."""
+        return await self._run(self.session.get_resource, path, **kwargs)
+
+    async def post_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """POST to a particular resource as JSON."""
+        return await self._run(self.session.post_resource, path, json=json, **kwargs)
+
+    async def put_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """PUT data given by some JSON at a particular resource."""
+        return await self._run(self.session.put_resource, path, json=json, **kwargs)
+
+    async def patch_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """PATCH data given by some JSON at a particular resource."""
+        return await self._run(self.session.patch_resource, path, json=json, **kwargs)
+
+    async def delete_resource(self, path: str, **kwargs) -> dict:
+        """DELETE a particular resource as JSON."""
+        return await self._run(self.session.delete_resource, path, **kwargs)
+
+    @staticmethod
+    async def cursor_paged_resource(base_method: Callable[..., Awaitable[dict]], path: str,
+                                    forward: bool = True, per_page: int = 100,
+                                    version: str = 'v2', **kwargs) -> AsyncIterator[dict]:
+        """
+        Returns a flat asynchronous generator of results for an API query.
+
+        Results are fetched in chunks of size `per_page` and loaded lazily.
+        """
+        params = kwargs.get('params', {})
+        params['forward'] = forward
+        params['ascending'] = forward
+        params['per_page'] = per_page
+        kwargs['params'] = params
+        while True:
+            response_json = await base_method(path, version=version, **kwargs)
+            for obj in response_json['contents']:
+                yield obj
+            cursor = response_json.get('next')
+            if cursor is None:
+                break
+            params['cursor'] = cursor
+
+
 class BearerAuth(requests.auth.AuthBase):
     """A lightweight Auth class to support Bearer tokens."""
 
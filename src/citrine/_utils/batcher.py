@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterable
+from logging import getLogger
 
 from citrine.resources.data_concepts import DataConcepts
 
-from gemd.util import make_index, writable_sort_order
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.util import writable_sort_order
+
+logger = getLogger(__name__)
 
 
 class Batcher(ABC):
@@ -14,6 +18,16 @@ class Batcher(ABC):
     def batch(self, objects: Iterable[DataConcepts], batch_size: int) -> list[list[DataConcepts]]:
         """Collect a list of DataConcepts into batches according to some batching algorithm."""
 
+    def levels(self, batches: list[list[DataConcepts]]) -> list[list[list[DataConcepts]]]:
+        """
+        Group batches into levels that may be submitted concurrently.
+
+        Every batch in a level may only depend on objects in earlier levels (or in itself), so
+        the batches of one level can be written in any order once the previous levels are
+        complete.  By default, every batch is its own level.
+        """
+        return [[batch] for batch in batches]
+
     @staticmethod
     def by_type() -> 'BatchByType':
         """Return a BatchByType batcher."""
@@ -31,6 +45,39 @@ class BatchByType(Batcher):
     def batch(self, objects: Iterable[DataConcepts], batch_size: int) -> list[list[DataConcepts]]:
         """Collect object batches by type, following an order that will satisfy prereqs."""
         batches = list()
+        for typ_group in self._type_groups(objects):
+            num_batches = len(typ_group) // batch_size
+            for batch_num in range(num_batches + 1):
+                batch = typ_group[batch_num * batch_size: (batch_num + 1) * batch_size]
+                batches.append(batch)
+        for i in reversed(range(len(batches) - 1)):
+            if len(batches[i]) + len(batches[i + 1]) <= batch_size:
+                batches[i].extend(batches[i + 1])
+                del batches[i + 1]
+
+        return batches
+
+    def by_order(self, objects: Iterable[DataConcepts]) -> list[list[DataConcepts]]:
+        """
+        Collect objects into groups of equal `writable_sort_order`, in load order.
+
+        Objects in a group never reference each other, so each group may be split into batches
+        of any size, which may be submitted in any order.
+        """
+        groups = list()
+        previous = None
+        for typ_group in self._type_groups(objects):
+            order = writable_sort_order(typ_group[0])
+            if order == previous:
+                groups[-1].extend(typ_group)
+            else:
+                groups.append(list(typ_group))
+            previous = order
+        return groups
+
+    @staticmethod
+    def _type_groups(objects: Iterable[DataConcepts]) -> list[list[DataConcepts]]:
+        """Collect unique objects by type, sorted by `writable_sort_order`."""
         by_type = defaultdict(list)
         seen = {}
         for obj in objects:
@@ -41,76 +88,199 @@ class BatchByType(Batcher):
                 by_type[obj.typ].append(obj)
                 for scope in obj.uids:
                     seen[obj.to_link(scope)] = obj
-        typ_groups = sorted(list(by_type.values()), key=lambda x: writable_sort_order(x[0]))
-        for typ_group in typ_groups:
-            num_batches = len(typ_group) // batch_size
-            for batch_num in range(num_batches + 1):
-                batch = typ_group[batch_num * batch_size: (batch_num + 1) * batch_size]
-                batches.append(batch)
-        for i in reversed(range(len(batches) - 1)):
-            if len(batches[i]) + len(batches[i + 1]) <= batch_size:
-                batches[i].extend(batches[i + 1])
-                del batches[i + 1]
+        return sorted(list(by_type.values()), key=lambda x: writable_sort_order(x[0]))
 
-        return batches
+    def levels(self, batches: list[list[DataConcepts]]) -> list[list[list[DataConcepts]]]:
+        """
+        Group consecutive batches that hold objects of a single, shared sort order.
+
+        Objects only reference objects of a lower `writable_sort_order`, so such batches are
+        independent of each other.  A batch spanning several sort orders is its own level.
+        """
+        levels = list()
+        previous = None
+        for batch in batches:
+            orders = {writable_sort_order(obj) for obj in batch}
+            if len(orders) == 1 and orders == previous:
+                levels[-1].append(batch)
+            else:
+                levels.append([batch])
+            previous = orders if len(orders) == 1 else None
+        return levels
 
 
 class BatchByDependency(Batcher):
     """Batching by clusters where nothing references anything outside the cluster."""
 
     def batch(self, objects: Iterable[DataConcepts], batch_size: int) -> list[list[DataConcepts]]:
-        """Collect object batches that are internally consistent for dry_run object tests."""
-        # Collect shallow dependences, UID references, and type-based clusters
-        depends = dict()
-        obj_set = set(objects)
-        index = make_index(objects)
-        by_type = defaultdict(list)
+        """
+        Collect object batches that are internally consistent for dry_run object tests.
+
+        Every batch contains the dependencies of each of its objects, so a dependency that is
+        shared by several batches is repeated in each of them.  Objects are indexed by position,
+        and batches are grown from the most dependent objects outwards, adding the objects that
+        share their dependencies.  Each list of dependants is scanned only once over the whole
+        call, so the running time grows linearly with the number of objects.
+
+        An object whose dependencies, including their own dependencies, don't fit in a batch
+        alongside it gets a batch larger than `batch_size`, and a warning is logged.  A
+        ValueError is raised if an object directly references more than `batch_size` objects.
+        """
+        # Index the unique objects; references may be objects or links to them
+        nodes = list()
+        by_identity = dict()
+        by_link = dict()  # Keyed by (scope, id), which matches a LinkByUID
         for obj in objects:  # Don't worry about replicates since we'd have them anyway
-            depends[obj] = obj.all_dependencies()
-            by_type[obj.typ].append(obj)
-
-        # Deep dependencies w/ objects only, build inverse index
-        # This takes a second loop because we need to build up all derefs first
-        supported_by = defaultdict(list)
-        type_groups = sorted(list(by_type.values()), key=lambda x: writable_sort_order(x[0]))
-        for type_group in type_groups:
-            for obj in type_group:
-                # Collect objects of interest that we are supposed to load
-                # Note depends contains both objects & links; obj_set is everything in the call
-                local_set = {index.get(x, x) for x in depends[obj] if index.get(x, x) in obj_set}
-                full_set = set(local_set)
-                if len(full_set) > batch_size:
-                    raise ValueError(f"Object {obj.name} has more than {batch_size} dependencies.")
-
-                for subobj in local_set:
-                    full_set.update(depends[subobj])
-                depends[obj] = sorted(list(full_set),
-                                      key=lambda x: writable_sort_order(x))
-                for dependant in reversed(depends[obj]):
-                    supported_by[dependant].append(obj)
-
-        # Build self-consistent clusters
-        queued = set()
+            if id(obj) not in by_identity:
+                by_identity[id(obj)] = len(nodes)
+                for key in obj.uids.items():
+                    by_link.setdefault(key, len(nodes))
+                nodes.append(obj)
+
+        def resolve(ref) -> int | None:
+            """Find the index of a referenced object, if it is one of those being batched."""
+            if isinstance(ref, LinkByUID):
+                return by_link.get(ref)
+            if id(ref) in by_identity:
+                return by_identity[id(ref)]
+            return next((by_link[key] for key in ref.uids.items() if key in by_link), None)
+
+        # Deep dependencies, computed in load order so every dependency is finished first
+        orders = [writable_sort_order(obj) for obj in nodes]
+        closure: list[tuple[int, ...]] = [()] * len(nodes)
+        oversized = 0
+        for i in sorted(range(len(nodes)), key=orders.__getitem__):
+            local = {resolve(ref) for ref in nodes[i].all_dependencies()} - {None, i}
+            if len(local) > batch_size:
+                raise ValueError(f"Object {nodes[i].name} has more than {batch_size} "
+                                 f"dependencies.")
+            full = set(local)
+            for dep in local:
+                full.update(closure[dep])
+            if len(full) >= batch_size:
+                oversized += 1
+            closure[i] = tuple(sorted(full, key=orders.__getitem__))
+        if oversized:
+            logger.warning(f"{oversized} objects have more dependencies than fit in a batch of "
+                           f"{batch_size} alongside them; their batches will be larger.")
+
+        # Inverse index, listing the most dependent objects first so that whole histories are
+        # pulled into a cluster together; `cursor` skips dependants that are already clustered
+        seeds = sorted(range(len(nodes)), key=lambda x: -orders[x])
+        supported_by = [[] for _ in nodes]
+        for i in seeds:
+            for dep in closure[i]:
+                supported_by[dep].append(i)
+        cursor = [0] * len(nodes)
+        queued = [False] * len(nodes)
+
+        # Build self-consistent clusters, starting from the most dependent objects
         clusters = list()
-        for type_group in reversed(type_groups):  # Later objects have more dependencies
-            for obj in type_group:
-                if obj in queued:
-                    continue  # It's already in a cluster
-                to_be_checked = depends[obj]
-                cluster = {obj} | set(depends[obj])
-                while to_be_checked:
-                    parent = to_be_checked.pop()
-                    for candidate in reversed(supported_by[parent]):
-                        if candidate in queued or candidate in cluster:
-                            continue  # It's already in a cluster
-                        candidate_set = {candidate} | set(depends[candidate])
-                        if len(cluster | candidate_set) > batch_size:
-                            continue  # It wouldn't fit
-
-                        to_be_checked.extend(candidate_set - cluster)
-                        cluster |= candidate_set
-
-                clusters.append(list(cluster))
-                queued.update(cluster)
+        for seed in seeds:
+            if queued[seed]:
+                continue  # It's already in a cluster
+            cluster = {seed, *closure[seed]}
+            to_be_checked = list(closure[seed])
+            while to_be_checked and len(cluster) < batch_size:
+                parent = to_be_checked.pop()
+                candidates = supported_by[parent]
+                while cursor[parent] < len(candidates):
+                    candidate = candidates[cursor[parent]]
+                    if not queued[candidate] and candidate not in cluster:
+                        new = [x for x in (candidate, *closure[candidate]) if x not in cluster]
+                        if len(cluster) + len(new) > batch_size:
+                            break  # It wouldn't fit; a later cluster will pick it up
+                        cluster.update(new)
+                        to_be_checked.extend(new)
+                    cursor[parent] += 1
+
+            for member in cluster:
+                queued[member] = True
+            clusters.append([nodes[x] for x in sorted(cluster)])
 
         return clusters
+
+    def levels(self, batches: list[list[DataConcepts]]) -> list[list[list[DataConcepts]]]:
+        """Every cluster contains its own dependencies, so all of them form a single level."""
+        return [batches] if batches else []
+
+
+class BatchRecord:
+    """
+    The outcome of submitting one batch.
+
+    Parameters
+    ----------
+    count: int
+        The number of objects in the batch.
+    nbytes: int
+        The size of the serialized objects in the batch, in bytes.
+    seconds: float
+        How long the request took.
+    succeeded: bool
+        Whether the batch was accepted.  A rejected batch is split and resubmitted.
+
+    """
+
+    def __init__(self, *, count: int, nbytes: int, seconds: float, succeeded: bool = True):
+        self.count = count
+        self.nbytes = nbytes
+        self.seconds = seconds
+        self.succeeded = succeeded
+
+    def __repr__(self):
+        return f'<BatchRecord count={self.count} nbytes={self.nbytes} ' \
+               f'seconds={self.seconds:.3f} succeeded={self.succeeded}>'
+
+
+class BatchSizer:
+    """
+    Choose how many objects go into each batch, adapting to how the server responds.
+
+    A batch holds at most `size` objects and at most `max_bytes` of serialized data (a single
+    object that is larger than `max_bytes` is sent on its own).  `size` starts at
+    `initial_size`, doubles (up to `max_size`) while full batches return in less than half of
+    `target_seconds`, and drops to at most half of a batch that takes longer than `target_seconds`
+    or is rejected.
+    Every submission is recorded in `history`.
+
+    Parameters
+    ----------
+    initial_size: int
+        The number of objects in the first batch.  Default: 50
+    max_size: int
+        The largest number of objects to put in a batch.  Default: 1000
+    max_bytes: int
+        The largest serialized size of a batch, in bytes.  Default: 2,000,000
+    target_seconds: float
+        The desired duration of a single request.  Default: 10.0
+
+    """
+
+    def __init__(self,
+                 *,
+                 initial_size: int = 50,
+                 max_size: int = 1000,
+                 max_bytes: int = 2_000_000,
+                 target_seconds: float = 10.0):
+        if not 1 <= initial_size <= max_size:
+            raise ValueError(f"Batch sizes must satisfy 1 <= initial_size <= max_size; "
+                             f"got {initial_size} and {max_size}.")
+        self.size = initial_size
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.target_seconds = target_seconds
+        self.history: list[BatchRecord] = []
+
+    def fits(self, count: int, nbytes: int) -> bool:
+        """Whether a batch of `count` objects and `nbytes` bytes is within the limits."""
+        return count <= self.size and nbytes <= self.max_bytes
+
+    def record(self, *, count: int, nbytes: int, seconds: float, succeeded: bool = True) -> None:
+        """Record the outcome of a batch and adjust the batch size accordingly."""
+        self.history.append(BatchRecord(count=count, nbytes=nbytes, seconds=seconds,
+                                        succeeded=succeeded))
+        if not succeeded or seconds > self.target_seconds:
+            self.size = min(self.size, max(1, count // 2))
+        elif count >= self.size and seconds < self.target_seconds / 2:
+            self.size = min(self.max_size, self.size * 2)
@@ -1,14 +1,22 @@
 import os
 from abc import ABCMeta
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Any, TypeVar
 from urllib.parse import quote, urlencode, urlparse
 from uuid import UUID
 from warnings import warn
 
 from gemd.entity.link_by_uid import LinkByUID
 
+T = TypeVar('T')
+
+_END_OF_ITERATION = object()
+
 
 def get_object_id(object_or_id):
     """Extract the citrine id from a data concepts object or LinkByUID."""
@@ -96,6 +104,104 @@ def object_to_link_by_uid(json: dict) -> dict:
         return json
 
 
+def _uids_to_link(uids: dict) -> dict:
+    """Build the LinkByUID dictionary that `object_to_link_by_uid` would for these uids."""
+    from citrine.resources.data_concepts import CITRINE_SCOPE
+    scope = CITRINE_SCOPE if CITRINE_SCOPE in uids else next(iter(uids))
+    return {'id': uids[scope], 'scope': scope, 'type': LinkByUID.typ}
+
+
+def _scrub_and_link(value: Any) -> Any:
+    """Apply `scrub_none` and then `object_to_link` to a serialized value, in one pass."""
+    if isinstance(value, dict):
+        uids = value.get('uids')
+        if uids is not None and value.get('type') not in (None, LinkByUID.typ):
+            if isinstance(uids, dict) and uids:
+                return _uids_to_link(uids)
+            return scrub_none(value)  # An object without ids is kept whole
+        return {key: _scrub_and_link(entry) for key, entry in value.items() if entry is not None}
+    elif isinstance(value, list):
+        return [None if entry is None else _scrub_and_link(entry) for entry in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def _payload_fields(klass: type) -> tuple:
+    """List the serialized fields of a class, as (attribute, path, property) triples."""
+    from citrine._serialization import properties
+    return tuple((name, tuple(prop.serialization_path.split('.')), prop)
+                 for name, prop in properties.Object(klass).fields.items() if prop.serializable)
+
+
+def _payload_value(prop, value: Any) -> Any:
+    """Serialize a property value for registration, writing referenced objects as links."""
+    from gemd.entity.base_entity import BaseEntity
+    from citrine._serialization import properties
+    from citrine._serialization.serializable import Serializable
+    if isinstance(prop, properties.Optional):
+        if value is None:
+            return None
+        prop = prop.prop
+    if isinstance(prop, properties.LinkOrElse):
+        if isinstance(value, LinkByUID):
+            return value.as_dict()
+        if isinstance(value, prop.klass) and isinstance(value, Serializable) \
+                and isinstance(value, BaseEntity) and value.uids:
+            return _uids_to_link(value.uids)
+    elif isinstance(prop, properties.List) and isinstance(value, (list, set, tuple)):
+        return [_payload_value(prop.element_type, element) for element in value]
+    elif isinstance(prop, properties.SpecifiedMixedList) and isinstance(value, (list, tuple)) \
+            and len(value) <= len(prop.element_types):
+        values = list(value) + [element_type.default
+                                for element_type in prop.element_types[len(value):]]
+        return [_payload_value(element_type, element)
+                for element_type, element in zip(prop.element_types, values)]
+    elif isinstance(prop, properties.Union):
+        for element_type in prop.element_types:
+            try:
+                return _payload_value(element_type, value)
+            except ValueError:
+                pass
+    return _scrub_and_link(prop.serialize(value))
+
+
+def registration_payload(model: Any) -> dict:
+    """
+    Serialize a data model object for registration.
+
+    The result is equivalent to ``replace_objects_with_links(scrub_none(model.dump()))``, but
+    it is built in a single pass: fields holding ``None`` are skipped rather than serialized and
+    then deleted, and referenced objects are written as links without serializing them (and
+    everything they reference) first.
+
+    Parameters
+    ----------
+    model: DataConcepts
+        The data model object to serialize.
+
+    Returns
+    -------
+    dict
+        The serialized object, with None values removed and referenced objects replaced by links.
+
+    """
+    from citrine._serialization.serializable import Serializable
+    if not isinstance(model, Serializable) or not _payload_fields(type(model)) or \
+            type(model)._post_dump is not Serializable._post_dump:
+        return {key: _scrub_and_link(value) for key, value in model.dump().items()
+                if value is not None}
+
+    payload = {}
+    for name, path, prop in _payload_fields(type(model)):
+        value = _payload_value(prop, getattr(model, name))
+        target = payload
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        if value is not None:
+            target[path[-1]] = value
+    return payload
+
+
 def rewrite_s3_links_locally(url: str, s3_endpoint_url: str = None) -> str:
     """
     Rewrite s3 links from localstack.
@@ -320,3 +426,137 @@ def resource_path(*,
     new_url = base._replace(path='/'.join(path), query=query).geturl()
 
     return format_escaped_url(new_url, *action, **kwargs, uid=uid)
+
+
+def read_ahead(iterable: Iterable[T], *, depth: int = 1) -> Iterator[T]:
+    """
+    Iterate over an iterable while a background thread works ahead of the consumer.
+
+    The background thread is started on the first call to `next` and advances `iterable` until
+    `depth` items are waiting to be consumed.  Items are yielded in their original order.  If
+    advancing `iterable` raises an exception, it is re-raised to the consumer at the position
+    it occurred.  Closing the returned generator stops the background thread at the next item.
+
+    Parameters
+    ----------
+    iterable: Iterable[T]
+        The items to produce, typically a generator that makes one request per item.
+    depth: int
+        The maximum number of items to buffer ahead of the consumer.  Default: 1
+
+    Returns
+    -------
+    Iterator[T]
+        The items of `iterable`.
+
+    """
+    if depth < 1:
+        raise ValueError(f"Read-ahead depth must be at least 1; got {depth}.")
+    buffer = Queue(maxsize=depth)
+    stop = Event()
+
+    def consume():
+        Thread(target=_drain_into, args=(iterable, buffer, stop),
+               name='citrine-read-ahead', daemon=True).start()
+        try:
+            while True:
+                failed, item = buffer.get()
+                if failed:
+                    raise item
+                if item is _END_OF_ITERATION:
+                    return
+                yield item
+        finally:
+            stop.set()
+
+    return consume()
+
+
+def merge_concurrently(sources: Iterable[Iterable[T]],
+                       *,
+                       max_workers: int,
+                       preserve_order: bool = False,
+                       buffer_size: int = 1000) -> Iterator[T]:
+    """
+    Iterate over several iterables at once, merging their items into a single iterator.
+
+    Each source is advanced on a worker thread, with at most `max_workers` sources in progress
+    at a time.  The items of any one source are always yielded in their original order.  If
+    advancing a source raises an exception, it is re-raised to the consumer, and closing the
+    returned generator stops all of the workers.
+
+    Parameters
+    ----------
+    sources: Iterable[Iterable[T]]
+        The iterables to merge, typically lazy generators that make one request per page.
+    max_workers: int
+        The maximum number of sources to advance concurrently.
+    preserve_order: bool
+        If True, yield every item of the first source, then every item of the second, and so
+        on, while later sources are read ahead in the background.  If False (the default),
+        items are yielded as soon as they are available, interleaving the sources.
+    buffer_size: int
+        The maximum number of items to buffer for the consumer (per source, if
+        `preserve_order` is True).  Default: 1000
+
+    Returns
+    -------
+    Iterator[T]
+        The items of every source.
+
+    """
+    if max_workers < 1:
+        raise ValueError(f"At least one worker is required; got {max_workers}.")
+    sources = list(sources)
+    stop = Event()
+    if preserve_order:
+        buffers = [Queue(maxsize=buffer_size) for _ in sources]
+    else:
+        buffers = [Queue(maxsize=buffer_size)] * len(sources)
+
+    def consume():
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='citrine-merge')
+        for source, buffer in zip(sources, buffers):
+            executor.submit(_drain_into, source, buffer, stop)
+        try:
+            remaining = len(sources)
+            while remaining:
+                failed, item = buffers[len(sources) - remaining].get()
+                if failed:
+                    raise item
+                if item is _END_OF_ITERATION:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return consume()
+
+
+def _drain_into(source: Iterable[Any], buffer: Queue, stop: Event) -> None:
+    """
+    Put every item of `source` into `buffer`, followed by an end marker.
+
+    Entries are (failed, item) pairs; if advancing `source` raises, the exception is put into
+    the buffer as a failed entry instead of the end marker.  Gives up as soon as `stop` is set.
+    """
+    try:
+        for item in source:
+            if not _put_unless_stopped(buffer, (False, item), stop):
+                return
+    except Exception as e:
+        _put_unless_stopped(buffer, (True, e), stop)
+    else:
+        _put_unless_stopped(buffer, (False, _END_OF_ITERATION), stop)
+
+
+def _put_unless_stopped(buffer: Queue, entry: Any, stop: Event) -> bool:
+    while not stop.is_set():
+        try:
+            buffer.put(entry, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
@@ -0,0 +1,118 @@
+import json
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+from gemd.entity.base_entity import BaseEntity
+
+
+class RegistrationJournal:
+    """
+    An on-disk record of registered objects, so that an interrupted registration can resume.
+
+    Pass the same journal file to every attempt of a `register_all` call.  Each batch that the
+    server acknowledges is appended to the file, along with the uids and tags it returned for
+    each object.  When the call is repeated, objects that were already registered are skipped,
+    and their uids and tags are restored onto the local objects from the journal instead.
+
+    Objects are matched to the journal by their type, name and the uids they had when they were
+    passed in, and by their position among the objects that share all three, so the objects must
+    be rebuilt the same way, and in the same order, for each attempt.  Objects that are missing
+    from the journal are registered as usual.
+
+    Parameters
+    ----------
+    path: str | Path
+        The location of the journal file.  It is created if it does not exist.
+
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self._registered = dict()
+        self._pending = dict()
+        if self.path.exists():
+            content = self.path.read_bytes()
+            offset = 0
+            for number, line in enumerate(content.splitlines(keepends=True), start=1):
+                try:
+                    entries = json.loads(line)
+                except json.JSONDecodeError:
+                    if offset + len(line) < len(content):
+                        raise ValueError(f"Line {number} of journal {self.path} is corrupt.")
+                    with open(self.path, 'r+b') as fh:
+                        fh.truncate(offset)  # The last write was interrupted; discard it
+                    break
+                for entry in entries:
+                    self._registered[entry['key']] = (entry['uids'], entry['tags'])
+                offset += len(line)
+            else:
+                if content and not content.endswith(b'\n'):
+                    with open(self.path, 'ab') as fh:
+                        fh.write(b'\n')  # Only the line ending was lost
+
+    def __len__(self):
+        return len(self._registered)
+
+    @staticmethod
+    def _identity(obj: BaseEntity) -> str:
+        """Describe an object by what it looks like before it is prepared for registration."""
+        return json.dumps([obj.typ, obj.name, sorted(obj.uids.items())])
+
+    def restore(self, objects: Iterable[BaseEntity]) -> tuple[list[BaseEntity], list[BaseEntity]]:
+        """
+        Restore the uids and tags of objects that the journal records as registered.
+
+        Objects are matched before any uids are assigned to them, so this must be called before
+        the objects are prepared for registration.
+
+        Parameters
+        ----------
+        objects: Iterable[BaseEntity]
+            The objects about to be registered.
+
+        Returns
+        -------
+        tuple[list[BaseEntity], list[BaseEntity]]
+            The objects that still need to be registered, and those restored from the journal.
+
+        """
+        remaining = list()
+        restored = list()
+        seen = set()
+        occurrences = Counter()
+        for obj in objects:
+            if id(obj) in seen:
+                continue  # A repeat in the iterable
+            seen.add(id(obj))
+            identity = self._identity(obj)
+            # Objects that look alike are told apart by their order
+            key = f"{identity}#{occurrences[identity]}"
+            occurrences[identity] += 1
+            if key in self._registered:
+                uids, tags = self._registered[key]
+                obj.uids.update(uids)
+                if tags is not None:
+                    obj.tags = list(tags)
+                restored.append(obj)
+            else:
+                self._pending[id(obj)] = key
+                remaining.append(obj)
+        return remaining, restored
+
+    def record(self, batch: Iterable[BaseEntity]):
+        """
+        Append a registered batch of objects, as passed to `restore`, to the journal.
+
+        Parameters
+        ----------
+        batch: Iterable[BaseEntity]
+            Local objects that have been registered and updated with the returned uids and tags.
+
+        """
+        entries = [{'key': self._pending.pop(id(obj)), 'uids': obj.uids, 'tags': obj.tags}
+                   for obj in batch if id(obj) in self._pending]
+        if not entries:
+            return
+        with open(self.path, 'a') as fh:
+            fh.write(json.dumps(entries) + '\n')
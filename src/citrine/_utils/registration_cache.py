@@ -0,0 +1,179 @@
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.link_by_uid import LinkByUID
+
+from citrine._utils.functions import scrub_none
+from citrine.resources.data_concepts import CITRINE_SCOPE, CITRINE_TAG_PREFIX
+
+
+def _content_link(value):
+    """Like `object_to_link`, but linking by a uid the client controls when there is one."""
+    if isinstance(value, dict):
+        uids = value.get('uids')
+        if 'type' in value and value['type'] != LinkByUID.typ and isinstance(uids, dict) and uids:
+            scope = next((scope for scope in uids if scope != CITRINE_SCOPE), CITRINE_SCOPE)
+            return {'type': LinkByUID.typ, 'scope': scope, 'id': uids[scope]}
+        return {key: _content_link(entry) for key, entry in value.items()}
+    elif isinstance(value, (tuple, list)):
+        return [_content_link(entry) for entry in value]
+    return value
+
+
+class RegistrationCache:
+    """
+    A local SQLite record of what was last registered, so unchanged objects can be skipped.
+
+    For every registered object, the cache stores a hash of its serialized content along with
+    the uids and tags the platform returned, under each of the object's uids.  When a later
+    `register_all` call is passed the same cache, objects whose content hashes the same as
+    when they were last registered are not sent; their uids and tags are restored from the
+    cache instead.  The number of objects skipped by the most recent call is kept in `skipped`.
+
+    Objects are found in the cache by their uids outside the Citrine scope, so only objects
+    that carry their own identifiers (e.g., from a LIMS) can be skipped.  The cache only knows
+    about registrations made through it; objects changed on the platform by other means are
+    not detected.
+
+    Parameters
+    ----------
+    path: str | Path
+        The location of the SQLite database file.  It is created if it does not exist.
+
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self.skipped = 0
+        self._pending = dict()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS registered ("
+                "scope TEXT NOT NULL, id TEXT NOT NULL, digest TEXT NOT NULL, "
+                "uids TEXT NOT NULL, tags TEXT, PRIMARY KEY (scope, id))"
+            )
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM registered").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    @staticmethod
+    def digest(obj: BaseEntity) -> str:
+        """
+        Hash the content of an object as it would be sent for registration.
+
+        Citrine IDs and platform-generated tags are left out, and referenced objects are linked
+        by their own uids where possible, since Citrine IDs and tags are assigned by the client
+        or the platform rather than being part of the object's content.
+
+        Parameters
+        ----------
+        obj: BaseEntity
+            The object to hash.
+
+        Returns
+        -------
+        str
+            The hex-encoded SHA-256 digest of the object's content.
+
+        """
+        content = {key: _content_link(value) for key, value in scrub_none(obj.dump()).items()}
+        content['uids'] = {scope: uid for scope, uid in content.get('uids', {}).items()
+                           if scope != CITRINE_SCOPE}
+        content['tags'] = [tag for tag in content.get('tags', [])
+                           if not tag.startswith(f"{CITRINE_TAG_PREFIX}::")]
+        encoded = json.dumps(content, sort_keys=True, separators=(',', ':')).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _lookup(self, obj: BaseEntity) -> tuple | None:
+        """Find the cached digest, uids and tags of an object by any of its own uids."""
+        for scope, uid in obj.uids.items():
+            if scope != CITRINE_SCOPE:
+                row = self._connection.execute(
+                    "SELECT digest, uids, tags FROM registered WHERE scope = ? AND id = ?",
+                    (scope, uid)
+                ).fetchone()
+                if row is not None:
+                    return row
+        return None
+
+    def filter(self, objects: Iterable[BaseEntity]) -> tuple[list[BaseEntity], list[BaseEntity]]:
+        """
+        Separate objects that changed since they were last registered from those that did not.
+
+        The Citrine IDs of previously registered objects are restored before their content is
+        hashed, so this should be called once Citrine IDs have been assigned to new objects.
+
+        Parameters
+        ----------
+        objects: Iterable[BaseEntity]
+            The objects about to be registered.
+
+        Returns
+        -------
+        tuple[list[BaseEntity], list[BaseEntity]]
+            The new or changed objects, and the unchanged objects, which were restored from the
+            cache.
+
+        """
+        objects = list(objects)
+        found = list()
+        for obj in objects:  # Restore all the uids first, since they appear in links
+            row = self._lookup(obj)
+            if row is not None:
+                obj.uids.update(json.loads(row[1]))
+            found.append(row)
+
+        changed = list()
+        unchanged = list()
+        for obj, row in zip(objects, found):
+            digest = self.digest(obj)
+            if row is not None and row[0] == digest:
+                tags = json.loads(row[2])
+                if tags is not None:
+                    obj.tags = tags
+                unchanged.append(obj)
+            else:
+                self._pending[id(obj)] = digest
+                changed.append(obj)
+        self.skipped = len(unchanged)
+        return changed, unchanged
+
+    def record(self, batch: Iterable[BaseEntity]):
+        """
+        Store a registered batch of objects, as passed to `filter`, in the cache.
+
+        Parameters
+        ----------
+        batch: Iterable[BaseEntity]
+            Local objects that have been registered and updated with the returned uids and tags.
+
+        """
+        rows = list()
+        for obj in batch:
+            digest = self._pending.pop(id(obj), None)
+            if digest is not None:
+                uids = json.dumps(obj.uids)
+                tags = json.dumps(obj.tags)
+                rows.extend((scope, uid, digest, uids, tags) for scope, uid in obj.uids.items()
+                            if scope != CITRINE_SCOPE)
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO registered (scope, id, digest, uids, tags) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
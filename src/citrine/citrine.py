@@ -1,6 +1,8 @@
 from os import environ
 
-from citrine._session import Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+
+from citrine._session import AsyncSession, Session
 from citrine.resources.catalyst import CatalystResource
 from citrine.resources.project import ProjectCollection
 from citrine.resources.team import TeamCollection
@@ -22,6 +24,16 @@ class Citrine:
         Default: environ.get('CITRINE_API_HOST')
     port: str | None
         Optional networking port.  Default: None
+    pool_maxsize: int
+        The maximum number of connections kept open to the platform.  Raise this when sharing
+        the client between many threads.  Default: requests' default, 10
+    pool_block: bool
+        Whether a request should wait for a free connection once `pool_maxsize` connections
+        are in use.  Default: requests' default, False
+    trusted_build: bool
+        Whether to build objects returned by the platform without validating the types of
+        their values, which is faster for large listings.  Objects built or modified by your
+        own code are still validated.  Default: False
 
     """
 
@@ -30,7 +42,10 @@ class Citrine:
                  *,
                  scheme: str = None,
                  host: str = None,
-                 port: str | None = None):
+                 port: str | None = None,
+                 pool_maxsize: int = DEFAULT_POOLSIZE,
+                 pool_block: bool = DEFAULT_POOLBLOCK,
+                 trusted_build: bool = False):
         if api_key is None:
             api_key = environ.get('CITRINE_API_KEY')
         if scheme is None:
@@ -45,7 +60,10 @@ class Citrine:
         self.session: Session = Session(refresh_token=api_key,
                                         scheme=scheme,
                                         host=host,
-                                        port=port
+                                        port=port,
+                                        pool_maxsize=pool_maxsize,
+                                        pool_block=pool_block,
+                                        trusted_build=trusted_build
                                         )
 
     @property
@@ -67,3 +85,75 @@ class Citrine:
     def catalyst(self) -> CatalystResource:
         """Return a resource representing Catalyst."""
         return CatalystResource(self.session)
+
+
+class AsyncCitrine:
+    """The asyncio entry point for interacting with the Citrine Platform.
+
+    This only holds an :class:`~citrine._session.AsyncSession`, whose `get_resource`,
+    `post_resource`, `put_resource` and `cursor_paged_resource` coroutines are the asynchronous
+    interface; see it for how requests are run.  There are no asynchronous counterparts of the
+    collections of :class:`Citrine`.  It may be used as an asynchronous context manager, which
+    releases its worker threads and connections on exit without blocking the event loop.
+
+    Parameters
+    ----------
+    api_key: str
+        Unique key that allows a user to access the Citrine Platform.
+        Default: environ.get('CITRINE_API_KEY')
+    scheme: str
+        Networking protocol; usually https.  Default: https
+    host: str
+        Host URL, generally '<your_site>.citrine-platform.com'.
+        Default: environ.get('CITRINE_API_HOST')
+    port: str | None
+        Optional networking port.  Default: None
+    max_workers: int
+        The most worker threads, which is the maximum number of requests that may be in flight
+        at once.  Default: 256
+
+    """
+
+    def __init__(self,
+                 api_key: str = None,
+                 *,
+                 scheme: str = None,
+                 host: str = None,
+                 port: str | None = None,
+                 max_workers: int = 256):
+        if api_key is None:
+            api_key = environ.get('CITRINE_API_KEY')
+        if scheme is None:
+            scheme = 'https'
+
+        if host is None:
+            host = environ.get('CITRINE_API_HOST')
+            if host is None:
+                raise ValueError("No host passed and environmental "
+                                 "variable CITRINE_API_HOST not set.")
+
+        self.session: AsyncSession = AsyncSession(refresh_token=api_key,
+                                                  scheme=scheme,
+                                                  host=host,
+                                                  port=port,
+                                                  max_workers=max_workers
+                                                  )
+
+    @property
+    def max_workers(self) -> int:
+        """The number of worker threads, and so of requests that may be in flight at once."""
+        return self.session.max_workers
+
+    async def __aenter__(self) -> 'AsyncCitrine':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Release the worker threads and connections held by the session."""
+        self.session.close()
+
+    async def aclose(self) -> None:
+        """Release the worker threads and connections, without blocking the event loop."""
+        await self.session.aclose()
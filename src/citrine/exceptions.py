@@ -136,6 +136,12 @@ class BadRequest(NonRetryableHttpException):
     pass
 
 
+class PayloadTooLarge(NonRetryableHttpException):
+    """The request body was too large for the server to accept. (http status 413)."""
+
+    pass
+
+
 class WorkflowConflictException(NonRetryableHttpException):
     """There is a conflict preventing the workflow from being executed. (http status 409)."""
 
@@ -152,6 +158,15 @@ class WorkflowNotReadyException(RetryableException):
     pass
 
 
+class TooManyRequests(RetryableException):
+    """The server is receiving too many requests, and asks to wait. (http status 429)."""
+
+    def __init__(self, message: str, *, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+        """:float | None: how long the server asked to wait, in seconds, if it did"""
+
+
 class PollingTimeoutError(NonRetryableException):
     """Polling for an asynchronous result has exceeded the timeout."""
 
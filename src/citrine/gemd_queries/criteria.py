@@ -46,12 +46,7 @@ class Criteria(PolymorphicSerializable):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        classes: list[type[Criteria]] = [
-            AndOperator, OrOperator,
-            PropertiesCriteria, NameCriteria, MaterialRunClassificationCriteria,
-            MaterialTemplatesCriteria, TagsCriteria, ConnectivityClassCriteria
-        ]
-        return {klass.typ: klass for klass in classes}[data['type']]
+        return cls._subtypes[data['type']]
 
 
 class AndOperator(Serializable['AndOperator'], Criteria):
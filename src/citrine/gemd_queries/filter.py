@@ -13,11 +13,7 @@ class PropertyFilterType(PolymorphicSerializable):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        classes: list[type[PropertyFilterType]] = [
-            NominalCategoricalFilter,
-            AllRealFilter, AllIntegerFilter
-        ]
-        return {klass.typ: klass for klass in classes}[data['type']]
+        return cls._subtypes[data['type']]
 
 
 class AllRealFilter(Serializable['AllRealFilter'], PropertyFilterType):
@@ -66,15 +66,7 @@ class Column(PolymorphicSerializable['Column']):
         """Return the subtype."""
         if "type" not in data:
             raise ValueError("Can only get types from dicts with a 'type' key")
-        types: list[type[Serializable]] = [
-            IdentityColumn,
-            MeanColumn, StdDevColumn, QuantileColumn, OriginalUnitsColumn,
-            MostLikelyCategoryColumn, MostLikelyProbabilityColumn,
-            FlatCompositionColumn, ComponentQuantityColumn,
-            NthBiggestComponentNameColumn, NthBiggestComponentQuantityColumn,
-            MolecularStructureColumn, ConcatColumn
-        ]
-        res = next((x for x in types if x.typ == data["type"]), None)
+        res = cls._subtypes.get(data["type"])
         if res is None:
             raise ValueError("Unrecognized type: {}".format(data["type"]))
         return res
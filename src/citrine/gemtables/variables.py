@@ -69,17 +69,7 @@ class Variable(PolymorphicSerializable['Variable']):
         """Return the subtype."""
         if "type" not in data:
             raise ValueError("Can only get types from dicts with a 'type' key")
-        types: list[type[Serializable]] = [
-            TerminalMaterialInfo, AttributeByTemplate, AttributeByTemplateAfterProcessTemplate,
-            AttributeByTemplateAndObjectTemplate, LocalAttribute, LocalAttributeAndObject,
-            IngredientIdentifierByProcessTemplateAndName, IngredientLabelByProcessAndName,
-            IngredientLabelsSetByProcessAndName, IngredientQuantityByProcessAndName,
-            TerminalMaterialIdentifier, AttributeInOutput,
-            IngredientIdentifierInOutput, IngredientLabelsSetInOutput, IngredientQuantityInOutput,
-            LocalIngredientIdentifier, LocalIngredientLabelsSet, LocalIngredientQuantity,
-            XOR,
-        ]
-        res = next((x for x in types if x.typ == data["type"]), None)
+        res = cls._subtypes.get(data["type"])
         if res is None:
             raise ValueError("Unrecognized type: {}".format(data["type"]))
 
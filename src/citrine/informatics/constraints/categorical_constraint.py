@@ -31,3 +31,7 @@ class AcceptableCategoriesConstraint(Serializable['AcceptableCategoriesConstrain
 
     def __str__(self):
         return '<AcceptableCategoriesConstraint {!r}>'.format(self.descriptor_key)
+
+
+# Kept for backwards compatibility.
+Constraint._subtypes['Categorical'] = AcceptableCategoriesConstraint
@@ -17,20 +17,4 @@ class Constraint(PolymorphicSerializable['Constraint']):
     @classmethod
     def get_type(cls, data):
         """Return the subtype."""
-        from .ingredient_count_constraint import IngredientCountConstraint
-        from .ingredient_fraction_constraint import IngredientFractionConstraint
-        from .label_fraction_constraint import LabelFractionConstraint
-        from .scalar_range_constraint import ScalarRangeConstraint
-        from .integer_range_constraint import IntegerRangeConstraint
-        from .categorical_constraint import AcceptableCategoriesConstraint
-        from .ingredient_ratio_constraint import IngredientRatioConstraint
-        return {
-            'Categorical': AcceptableCategoriesConstraint,  # Kept for backwards compatibility.
-            'AcceptableCategoriesConstraint': AcceptableCategoriesConstraint,
-            'IngredientCountConstraint': IngredientCountConstraint,
-            'IngredientFractionConstraint': IngredientFractionConstraint,
-            'LabelFractionConstraint': LabelFractionConstraint,
-            'ScalarRange': ScalarRangeConstraint,
-            'IntegerRange': IntegerRangeConstraint,
-            'IngredientRatio': IngredientRatioConstraint,
-        }[data['type']]
+        return cls._subtypes[data['type']]
@@ -38,7 +38,7 @@ class DataSource(PolymorphicSerializable['DataSource']):
         """Return the subtype."""
         if "type" not in data:
             raise ValueError("Can only get types from dicts with a 'type' key")
-        res = next((x for x in cls._subclass_list() if x.typ == data["type"]), None)
+        res = cls._subtypes.get(data["type"])
         if res is None:
             raise ValueError(f"Unrecognized type: {data['type']}")
         return res
@@ -39,14 +39,7 @@ class Descriptor(PolymorphicSerializable['Descriptor']):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        return {
-            "Categorical": CategoricalDescriptor,
-            "Formulation": FormulationDescriptor,
-            "Inorganic": ChemicalFormulaDescriptor,
-            "Organic": MolecularStructureDescriptor,
-            "Real": RealDescriptor,
-            "Integer": IntegerDescriptor,
-        }[data["type"]]
+        return cls._subtypes[data["type"]]
 
     def _equals(self, other, attrs):
         """Check to see if the attrs from the other instance match this instance.
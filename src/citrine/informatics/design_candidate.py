@@ -40,13 +40,7 @@ class DesignVariable(PolymorphicSerializable["DesignVariable"]):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        return {
-            "R": MeanAndStd,
-            "C": TopCategories,
-            "M": Mixture,
-            "F": ChemicalFormula,
-            "S": MolecularStructure
-        }[data["type"]]
+        return cls._subtypes[data["type"]]
 
 
 class MeanAndStd(Serializable["MeanAndStd"], DesignVariable):
@@ -18,19 +18,11 @@ class DesignSubspace(PolymorphicSerializable["DesignSubspace"], DesignSpace):
     @classmethod
     def get_type(cls, data) -> type['DesignSubspace']:
         """Return the subtype."""
-        from .data_source_design_space import DataSourceDesignSpace
-        from .formulation_design_space import FormulationDesignSpace
-
-        type_dict = {
-            'FormulationDesignSpace': FormulationDesignSpace,
-            'DataSourceDesignSpace': DataSourceDesignSpace,
-        }
-
-        typ = type_dict.get(data['type'])
+        typ = cls._subtypes.get(data['type'])
         if typ is not None:
             return typ
         else:
             raise ValueError(
                 '{} is not a valid design subspace type. '
-                'Must be in {}.'.format(data['type'], type_dict.keys())
+                'Must be in {}.'.format(data['type'], cls._subtypes.keys())
             )
@@ -58,13 +58,7 @@ class TopLevelDesignSpace(PolymorphicSerializable['TopLevelDesignSpace'], Asynch
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        from .product_design_space import ProductDesignSpace
-        from .hierarchical_design_space import HierarchicalDesignSpace
-
-        return {
-            'ProductDesignSpace': ProductDesignSpace,
-            'HierarchicalDesignSpace': HierarchicalDesignSpace
-        }[data['data']['instance']['type']]
+        return cls._subtypes[data['data']['instance']['type']]
 
     @property
     def is_locked(self) -> bool:
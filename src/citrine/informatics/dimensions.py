@@ -18,11 +18,7 @@ class Dimension(PolymorphicSerializable['Dimension']):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        return {
-            'ContinuousDimension': ContinuousDimension,
-            'IntegerDimension': IntegerDimension,
-            'EnumeratedDimension': EnumeratedDimension
-        }[data['type']]
+        return cls._subtypes[data["type"]]
 
 
 class ContinuousDimension(Serializable['ContinuousDimension'], Dimension):
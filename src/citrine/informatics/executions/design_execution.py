@@ -43,34 +43,46 @@ class DesignExecution(Resource["DesignExecution"], Execution):
 
     @classmethod
     def _build_candidates(cls, subset_collection: Iterable[dict]) -> Iterable[DesignCandidate]:
-        for candidate in subset_collection:
-            yield DesignCandidate.build(candidate)
+        return DesignCandidate.build_many(subset_collection)
 
-    def candidates(self, *, per_page: int = 100) -> Iterable[DesignCandidate]:
-        """Fetch the Design Candidates for the particular execution, paginated."""
+    def candidates(self, *, per_page: int = 100,
+                   prefetch: int = 0) -> Iterable[DesignCandidate]:
+        """
+        Fetch the Design Candidates for the particular execution, paginated.
+
+        Set `prefetch` to request that many pages ahead on a background thread while the
+        current page is being consumed.
+        """
         path = self._path() + '/candidates'
 
         fetcher = partial(self._fetch_page, path=path, fetch_func=self._session.get_resource)
 
         return self._paginator.paginate(page_fetcher=fetcher,
                                         collection_builder=self._build_candidates,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        prefetch=prefetch)
 
     @classmethod
     def _build_hierarchical_candidates(
             cls, subset_collection: Iterable[dict]) -> Iterable[HierarchicalDesignCandidate]:
-        for candidate in subset_collection:
-            yield HierarchicalDesignCandidate.build(candidate)
+        return HierarchicalDesignCandidate.build_many(subset_collection)
+
+    def hierarchical_candidates(self, *, per_page: int = 100,
+                                prefetch: int = 0) -> Iterable[DesignCandidate]:
+        """
+        Fetch the Design Candidates for the particular execution, paginated.
 
-    def hierarchical_candidates(self, *, per_page: int = 100) -> Iterable[DesignCandidate]:
-        """Fetch the Design Candidates for the particular execution, paginated."""
+        Set `prefetch` to request that many pages ahead on a background thread while the
+        current page is being consumed.
+        """
         path = self._path() + '/candidate-histories'
 
         fetcher = partial(self._fetch_page, path=path, fetch_func=self._session.get_resource)
 
         return self._paginator.paginate(page_fetcher=fetcher,
                                         collection_builder=self._build_hierarchical_candidates,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        prefetch=prefetch)
 
     def predict(self,
                 predict_request: PredictRequest) -> DesignCandidate:
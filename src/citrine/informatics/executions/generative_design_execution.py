@@ -26,8 +26,7 @@ class GenerativeDesignExecution(Resource["GenerativeDesignExecution"], Execution
     def _build_results(
         cls, subset_collection: Iterable[dict]
     ) -> Iterable[GenerativeDesignResult]:
-        for generation_result in subset_collection:
-            yield GenerativeDesignResult.build(generation_result)
+        return GenerativeDesignResult.build_many(subset_collection)
 
     def results(self, *, per_page: int = 100) -> Iterable[GenerativeDesignResult]:
         """Fetch the Generative Design Results for the particular execution, paginated."""
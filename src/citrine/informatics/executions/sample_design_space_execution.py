@@ -41,8 +41,7 @@ class SampleDesignSpaceExecution(Resource['SampleDesignSpaceExecution'], Executi
     def _build_results(
         cls, subset_collection: Iterable[dict]
     ) -> Iterable[SampleSearchSpaceResultCandidate]:
-        for sample_result in subset_collection:
-            yield SampleSearchSpaceResultCandidate.build(sample_result)
+        return SampleSearchSpaceResultCandidate.build_many(subset_collection)
 
     def results(
         self,
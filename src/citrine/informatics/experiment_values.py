@@ -22,14 +22,7 @@ class ExperimentValue(PolymorphicSerializable['ExperimentValue']):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        return {
-            "RealValue": RealExperimentValue,
-            "IntegerValue": IntegerExperimentValue,
-            "CategoricalValue": CategoricalExperimentValue,
-            "MixtureValue": MixtureExperimentValue,
-            "InorganicValue": ChemicalFormulaExperimentValue,
-            "OrganicValue": MolecularStructureExperimentValue,
-        }[data["type"]]
+        return cls._subtypes[data["type"]]
 
     def __str__(self):
         return f"<{self.__class__.__name__} {self.value!r}>"
@@ -20,10 +20,7 @@ class Objective(PolymorphicSerializable['Objective']):
     @classmethod
     def get_type(cls, data):
         """Return the subtype."""
-        return {
-            'ScalarMax': ScalarMaxObjective,
-            'ScalarMin': ScalarMinObjective
-        }[data['type']]
+        return cls._subtypes[data["type"]]
 
 
 class ScalarMaxObjective(Serializable['ScalarMaxObjective'], Objective):
@@ -36,17 +36,7 @@ class PredictorEvaluationMetric(PolymorphicSerializable["PredictorEvaluationMetr
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        t = data["type"]
-        return {
-            "RMSE": RMSE,
-            "RSquared": RSquared,
-            "NDME": NDME,
-            "StandardRMSE": StandardRMSE,
-            "PVA": PVA,
-            "F1": F1,
-            "AreaUnderROC": AreaUnderROC,
-            "CoverageProbability": CoverageProbability,
-        }[t]
+        return cls._subtypes[data["type"]]
 
 
 class RMSE(Serializable["RMSE"], PredictorEvaluationMetric):
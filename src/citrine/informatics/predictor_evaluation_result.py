@@ -26,11 +26,7 @@ class MetricValue(PolymorphicSerializable["MetricValue"]):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        return {
-            "RealMetricValue": RealMetricValue,
-            "RealPredictedVsActual": RealPredictedVsActual,
-            "CategoricalPredictedVsActual": CategoricalPredictedVsActual
-        }[data["type"]]
+        return cls._subtypes[data["type"]]
 
 
 class RealMetricValue(Serializable["RealMetricValue"], MetricValue):
@@ -162,10 +158,7 @@ class PredictorEvaluationResult(PolymorphicSerializable["PredictorEvaluationResu
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        return {
-            "CrossValidationResult": CrossValidationResult,
-            "HoldoutSetResult": HoldoutSetResult
-        }[data["type"]]
+        return cls._subtypes[data["type"]]
 
     @property
     def evaluator(self) -> PredictorEvaluator:
@@ -16,10 +16,7 @@ class PredictorEvaluator(PolymorphicSerializable["PredictorEvaluator"]):
     @classmethod
     def get_type(cls, data) -> type[Serializable]:
         """Return the subtype."""
-        return {
-            "CrossValidationEvaluator": CrossValidationEvaluator,
-            "HoldoutSetEvaluator": HoldoutSetEvaluator
-        }[data["type"]]
+        return cls._subtypes[data["type"]]
 
     def __eq__(self, other):
         if isinstance(other, Serializable):
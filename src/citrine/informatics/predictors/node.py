@@ -17,33 +17,11 @@ class PredictorNode(PolymorphicSerializable["PredictorNode"], Predictor):
     @classmethod
     def get_type(cls, data) -> type['PredictorNode']:
         """Return the subtype."""
-        from .auto_ml_predictor import AutoMLPredictor
-        from .attribute_accumulation_predictor import AttributeAccumulationPredictor
-        from .chemical_formula_featurizer import ChemicalFormulaFeaturizer
-        from .expression_predictor import ExpressionPredictor
-        from .ingredient_fractions_predictor import IngredientFractionsPredictor
-        from .ingredients_to_formulation_predictor import IngredientsToFormulationPredictor
-        from .label_fractions_predictor import LabelFractionsPredictor
-        from .mean_property_predictor import MeanPropertyPredictor
-        from .molecular_structure_featurizer import MolecularStructureFeaturizer
-        from .simple_mixture_predictor import SimpleMixturePredictor
-        type_dict = {
-            "AnalyticExpression": ExpressionPredictor,
-            "AttributeAccumulation": AttributeAccumulationPredictor,
-            "AutoML": AutoMLPredictor,
-            "ChemicalFormulaFeaturizer": ChemicalFormulaFeaturizer,
-            "IngredientFractions": IngredientFractionsPredictor,
-            "IngredientsToSimpleMixture": IngredientsToFormulationPredictor,
-            "LabelFractions": LabelFractionsPredictor,
-            "MeanProperty": MeanPropertyPredictor,
-            "MoleculeFeaturizer": MolecularStructureFeaturizer,
-            "SimpleMixture": SimpleMixturePredictor,
-        }
-        typ = type_dict.get(data['type'])
+        typ = cls._subtypes.get(data['type'])
         if typ is not None:
             return typ
         else:
             raise ValueError(
                 '{} is not a valid predictor node type. '
-                'Must be in {}.'.format(data['type'], type_dict.keys())
+                'Must be in {}.'.format(data['type'], cls._subtypes.keys())
             )
@@ -22,11 +22,7 @@ class Score(PolymorphicSerializable['Score']):
     @classmethod
     def get_type(cls, data):
         """Return the subtype."""
-        return {
-            'MLI': LIScore,
-            'MEI': EIScore,
-            'MEV': EVScore
-        }[data['type']]
+        return cls._subtypes[data["type"]]
 
 
 class LIScore(Serializable['LIScore'], Score):
@@ -1,6 +1,9 @@
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import partial
 from gemd.enumeration.base_enumeration import BaseEnumeration
 from logging import getLogger
-from time import time, sleep
+from typing import Any, TypeVar
 from uuid import UUID
 
 from citrine._rest.resource import Resource
@@ -9,8 +12,10 @@ from citrine._serialization import properties
 from citrine._session import Session
 from citrine._utils.functions import format_escaped_url
 from citrine.exceptions import PollingTimeoutError, JobFailureError
+from citrine.jobs.polling import Backoff, Poller, _choose_backoff, background_poller
 
 logger = getLogger(__name__)
+T = TypeVar('T')
 
 
 class JobSubmissionResponse(Resource['JobSubmissionResponse']):
@@ -91,19 +96,190 @@ class JobStatusResponse(Resource['JobStatusResponse']):
         self._status = value
 
 
+class JobPoller(Poller):
+    """
+    Poll the status of many jobs from one loop, with a bounded rate of status requests.
+
+    Each job that is added gets a future, which is resolved once the job finishes: with its
+    JobStatusResponse, or with a JobFailureError if it failed, or with a PollingTimeoutError
+    if it didn't finish within the timeout.  A job that fails only resolves its own future,
+    and the other jobs are still polled.  A job whose future is cancelled is no longer polled.
+
+    Each job is polled on its own schedule, which by default starts fast and backs off.  If
+    the server responds that there are too many requests, no job is polled again until it
+    says to.
+
+    Parameters
+    ----------
+    session: Session
+        The session to poll with.
+    team_id: UUID | str
+        The team the jobs were submitted to.
+    timeout: float
+        How long to poll each job before giving up, in seconds from when it's added.  Note
+        that this has no effect on the jobs themselves, which can also time out server-side.
+    polling_delay: float | None
+        A fixed time to wait between polls of the same job, in seconds, instead of backing off.
+    backoff: Backoff | None
+        How long to wait between polls of the same job.  Defaults to the process-wide default
+        (see `citrine.jobs.polling.set_default_backoff`).
+    max_rate: float
+        The most status requests to make per second, over all of the jobs.
+    raise_errors: bool
+        Whether a `Failure` response should resolve the job's future with a JobFailureError,
+        rather than with the response.
+
+    Examples
+    --------
+    Wait for many jobs, and handle each one as it finishes:
+
+    .. code:: python
+
+        poller = JobPoller(session, team_id=team_id)
+        for job in jobs:
+            poller.add(job)
+        for future in poller.as_completed():
+            try:
+                status = future.result()
+            except JobFailureError as e:
+                print(f"{e.job_id} failed: {e.failure_reasons}")
+
+    """
+
+    def __init__(self,
+                 session: Session,
+                 *,
+                 team_id: UUID | str,
+                 timeout: float = 2 * 60,
+                 polling_delay: float | None = None,
+                 backoff: Backoff | None = None,
+                 max_rate: float = 10.0,
+                 raise_errors: bool = True):
+        super().__init__(backoff=_choose_backoff(backoff, polling_delay), max_rate=max_rate)
+        self.session = session
+        self.team_id = team_id
+        self.timeout = timeout
+        self.raise_errors = raise_errors
+
+    def add(self, job: JobSubmissionResponse | UUID | str) -> "Future[JobStatusResponse]":
+        """
+        Start polling a job.
+
+        Parameters
+        ----------
+        job: JobSubmissionResponse | UUID | str
+            The job submission object or job ID that was given from a job submission.
+
+        Returns
+        -------
+        Future[JobStatusResponse]
+            A future resolved once the job finishes.  Adding a job that is already being
+            polled returns its existing future.
+
+        """
+        job_id = _job_id(job)
+        return self.submit(_job_check(self.session, job_id, team_id=self.team_id,
+                                      raise_errors=self.raise_errors),
+                           key=job_id, timeout=self.timeout, name='Job',
+                           on_timeout=partial(_job_timeout_error, job_id, self.timeout))
+
+
+def _job_id(job: JobSubmissionResponse | UUID | str) -> UUID | str:
+    return job.job_id if isinstance(job, JobSubmissionResponse) else job
+
+
+def _job_check(session: Session,
+               job_id: UUID | str,
+               *,
+               team_id: UUID | str,
+               raise_errors: bool = True) -> Callable[[], tuple[bool, JobStatusResponse]]:
+    """Make a function that polls a job once, for a Poller."""
+    path = format_escaped_url('teams/{}/execution/job-status', team_id)
+    params = {'job_id': job_id}
+
+    def check() -> tuple[bool, JobStatusResponse]:
+        response = session.get_resource(path=path, params=params)
+        status: JobStatusResponse = JobStatusResponse.build(response)
+        if status.status == JobStatus.FAILURE:
+            logger.debug(f'Job terminated with Failure status: {status.dump()}')
+            if raise_errors:
+                raise _job_failure_error(job_id, status)
+        elif status.status != JobStatus.SUCCESS:
+            return False, status
+        return True, status
+    return check
+
+
+def _job_timeout_error(job_id: UUID | str | list[UUID | str],
+                       timeout: float) -> PollingTimeoutError:
+    """Describe a job, or a list of jobs waited on one after another, that timed out."""
+    logger.error(f'Job exceeded user timeout of {timeout} seconds. '
+                 f'Note job on server is unaffected by this timeout.')
+    if not isinstance(job_id, list):
+        return PollingTimeoutError('Job {} timed out.'.format(job_id))
+    return PollingTimeoutError('Jobs {} timed out.'.format(', '.join(map(str, job_id))))
+
+
+def _job_future(session: Session,
+                job: JobSubmissionResponse | UUID | str,
+                *,
+                team_id: UUID | str,
+                timeout: float = 2 * 60,
+                then: Callable[[JobStatusResponse], T] | None = None,
+                poller: Poller | None = None) -> "Future[T]":
+    """
+    Wait for a job in the background, returning a future of its outcome.
+
+    The job is polled by the shared background poller, unless given another poller.  A job
+    that fails resolves the future with a JobFailureError.  Otherwise, the future's result is
+    `then` applied to the job's final status, or the status itself if there is no `then`.
+    """
+    job_id = _job_id(job)
+    check = _job_check(session, job_id, team_id=team_id)
+    if then is not None:
+        check = _then(check, then)
+    return (poller or background_poller()).submit(
+        check, timeout=timeout, name='Job',
+        on_timeout=partial(_job_timeout_error, job_id, timeout))
+
+
+def _then(check: Callable[[], tuple[bool, Any]],
+          then: Callable[[Any], T]) -> Callable[[], tuple[bool, T]]:
+    """Make a check whose result, once finished, is `then` applied to the result of `check`."""
+    def check_then() -> tuple[bool, T]:
+        done, result = check()
+        return (True, then(result)) if done else (False, None)
+    return check_then
+
+
+def _job_failure_error(job_id: UUID | str, status: JobStatusResponse) -> JobFailureError:
+    """Describe why a job with a `Failure` status failed, logging its failed tasks."""
+    failure_reasons = []
+    for task in status.tasks:
+        if task.status == JobStatus.FAILURE:
+            logger.error(f'Task {task.id} failed with reason "{task.failure_reason}"')
+            failure_reasons.append(task.failure_reason)
+    return JobFailureError(
+        message=f'Job {job_id} terminated with Failure status. '
+                f'Failure reasons: {failure_reasons}',
+        job_id=job_id,
+        failure_reasons=failure_reasons)
+
+
 def _poll_for_job_completion(session: Session,
                              job: JobSubmissionResponse | UUID | str,
                              *,
                              team_id: UUID | str,
                              timeout: float = 2 * 60,
-                             polling_delay: float = 2.0,
+                             polling_delay: float | None = None,
+                             backoff: Backoff | None = None,
                              raise_errors: bool = True,
                              ) -> JobStatusResponse:
     """
     Polls for job completion given a timeout.
 
     This polls for job completion given the Job ID, failing appropriately if the job result
-    was not successful.
+    was not successful.  To wait for many jobs at once, use a JobPoller.
 
     Parameters
     ----------
@@ -114,7 +290,10 @@ def _poll_for_job_completion(session: Session,
         to 2 minutes. Note that this number has no effect on the underlying job
         itself, which can also time out server-side.
     polling_delay:
-        How long to delay between each polling retry attempt.
+        A fixed delay between each polling retry attempt, instead of backing off.
+    backoff:
+        How long to delay between each polling retry attempt.  Defaults to the process-wide
+        default (see `citrine.jobs.polling.set_default_backoff`).
     raise_errors:
         Whether a `Failure` response should raise a JobFailureError.
 
@@ -125,41 +304,9 @@ def _poll_for_job_completion(session: Session,
         information from the completed job.
 
     """
-    if isinstance(job, JobSubmissionResponse):
-        job_id = job.job_id
-    else:
-        job_id = job  # pragma: no cover
-    path = format_escaped_url('teams/{}/execution/job-status', team_id)
-    params = {'job_id': job_id}
-    start_time = time()
-    while True:
-        response = session.get_resource(path=path, params=params)
-        status: JobStatusResponse = JobStatusResponse.build(response)
-        if status.status in [JobStatus.SUCCESS, JobStatus.FAILURE]:
-            break
-        elif time() - start_time < timeout:
-            logger.info(
-                f'Job still in progress, polling status again in {polling_delay:.2f} seconds.'
-            )
-
-            sleep(polling_delay)
-        else:
-            logger.error(f'Job exceeded user timeout of {timeout} seconds. '
-                         f'Note job on server is unaffected by this timeout.')
-            logger.debug('Last status: {}'.format(status.dump()))
-            raise PollingTimeoutError('Job {} timed out.'.format(job_id))
-    if status.status == JobStatus.FAILURE:
-        logger.debug(f'Job terminated with Failure status: {status.dump()}')
-        if raise_errors:
-            failure_reasons = []
-            for task in status.tasks:
-                if task.status == JobStatus.FAILURE:
-                    logger.error(f'Task {task.id} failed with reason "{task.failure_reason}"')
-                    failure_reasons.append(task.failure_reason)
-            raise JobFailureError(
-                message=f'Job {job_id} terminated with Failure status. '
-                        f'Failure reasons: {failure_reasons}',
-                job_id=job_id,
-                failure_reasons=failure_reasons)
-
-    return status
+    poller = JobPoller(session, team_id=team_id, timeout=timeout, polling_delay=polling_delay,
+                       backoff=backoff, raise_errors=raise_errors)
+    future = poller.add(job)
+    for _ in poller.as_completed():
+        pass
+    return future.result()
@@ -0,0 +1,380 @@
+"""How long to wait between polls of platform work that hasn't finished yet, and polling it."""
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future
+from heapq import heappop, heappush
+from itertools import count
+from logging import getLogger
+from random import random
+from threading import Condition, Lock, Thread
+from time import sleep, time
+from typing import Any, TYPE_CHECKING, TypeVar
+from uuid import UUID
+
+from citrine.exceptions import TooManyRequests
+from citrine._session import deferring_retry_after
+
+if TYPE_CHECKING:  # pragma: no cover
+    from citrine._rest.asynchronous_object import AsynchronousObject
+    from citrine._rest.collection import Collection
+
+logger = getLogger(__name__)
+T = TypeVar('T')
+
+
+class Backoff:
+    """
+    A polling schedule that starts fast and backs off exponentially, up to a cap.
+
+    The n-th wait is `initial * factor ** (n - 1)`, capped at `maximum`, and then shortened by
+    a random fraction of up to `jitter`, so that many pollers started together spread out.
+    A delay the server asks for (e.g., with a Retry-After header) is waited for in full.
+
+    Parameters
+    ----------
+    initial: float
+        The first wait, in seconds.
+    factor: float
+        How much longer each wait is than the one before.
+    maximum: float
+        The longest wait, in seconds.
+    jitter: float
+        The largest fraction by which a wait is randomly shortened, between 0 and 1.
+
+    """
+
+    def __init__(self, *,
+                 initial: float = 0.5,
+                 factor: float = 1.5,
+                 maximum: float = 15.0,
+                 jitter: float = 0.1):
+        if initial < 0 or maximum < initial:
+            raise ValueError(f"Backoff needs 0 <= initial <= maximum, not {initial} and {maximum}")
+        if factor < 1:
+            raise ValueError(f"Backoff factor must be at least 1, not {factor}")
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"Backoff jitter must be between 0 and 1, not {jitter}")
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+        self.jitter = jitter
+
+    @classmethod
+    def constant(cls, delay: float) -> 'Backoff':
+        """A schedule that always waits `delay` seconds, as a fixed polling delay does."""
+        return cls(initial=delay, factor=1.0, maximum=delay, jitter=0.0)
+
+    def delay(self, attempt: int, *, retry_after: float | None = None) -> float:
+        """
+        How long to wait after the `attempt`-th poll of something, counting from 1.
+
+        Parameters
+        ----------
+        attempt: int
+            How many times it has been polled.
+        retry_after: float | None
+            How long the server asked to wait, in seconds, if it did.
+
+        Returns
+        -------
+        float
+            How long to wait before the next poll, in seconds.
+
+        """
+        try:
+            wait = min(self.initial * self.factor ** max(attempt - 1, 0), self.maximum)
+        except OverflowError:  # Long past the cap
+            wait = self.maximum
+        wait *= 1 - self.jitter * random()
+        return max(wait, retry_after or 0.0)
+
+    def __repr__(self):
+        return (f"Backoff(initial={self.initial}, factor={self.factor}, "
+                f"maximum={self.maximum}, jitter={self.jitter})")
+
+
+_default_backoff = Backoff()
+
+
+def get_default_backoff() -> Backoff:
+    """The backoff used to poll when a call isn't given a backoff or a fixed delay."""
+    return _default_backoff
+
+
+def set_default_backoff(backoff: Backoff) -> None:
+    """
+    Set the backoff used to poll, process-wide, when a call isn't given one or a fixed delay.
+
+    Parameters
+    ----------
+    backoff: Backoff
+        The new default, e.g. `Backoff(initial=1.0, maximum=60.0)` to poll long trainings less
+        often, or `Backoff.constant(2.0)` to poll at a fixed rate.
+
+    """
+    global _default_backoff
+    if not isinstance(backoff, Backoff):
+        raise TypeError(f"Expected a Backoff, not {type(backoff).__name__}")
+    _default_backoff = backoff
+
+
+def _choose_backoff(backoff: Backoff | None, fixed_delay: float | None) -> Backoff:
+    """Pick a call's backoff: the one it was given, else its fixed delay, else the default."""
+    if backoff is not None:
+        return backoff
+    if fixed_delay is not None:
+        return Backoff.constant(fixed_delay)
+    return _default_backoff
+
+
+class _Polled:
+    """One piece of work being polled, with its future and schedule."""
+
+    __slots__ = ('key', 'check', 'future', 'deadline', 'backoff', 'polls', 'name', 'on_timeout')
+
+    def __init__(self, *, key: Hashable, check: Callable[[], tuple[bool, Any]], future: Future,
+                 deadline: float, backoff: Backoff, name: str,
+                 on_timeout: Callable[[], Exception]):
+        self.key = key
+        self.check = check
+        self.future = future
+        self.deadline = deadline
+        self.backoff = backoff
+        self.polls = 0
+        self.name = name
+        self.on_timeout = on_timeout
+
+
+class Poller:
+    """
+    Poll many pieces of unfinished platform work from one loop, with a bounded request rate.
+
+    Each piece of work is given as a `check` function, which polls it once and returns whether
+    it has finished, with its result if it has.  Each gets a future, which is resolved with its
+    result once it finishes, or with the error its check raised, or with the error from
+    `on_timeout` if it didn't finish within its timeout.  Work that fails only resolves its
+    own future, and a future that is cancelled stops its work being polled.  If the server
+    responds that there are too many requests, nothing is polled again until it says to.
+
+    The work can be polled from the caller's thread, with `as_completed`, or from a daemon
+    thread, once `start` is called, in which case work may be submitted from any thread.
+
+    Parameters
+    ----------
+    backoff: Backoff | None
+        How long to wait between polls of the same work, unless it's submitted with its own.
+        Defaults to the process-wide default, as it is when the work is submitted.
+    max_rate: float
+        The most polls to make per second, over all of the work.
+
+    """
+
+    def __init__(self, *, backoff: Backoff | None = None, max_rate: float = 10.0):
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, not {max_rate}")
+        self.backoff = backoff
+        self.max_rate = max_rate
+        self._condition = Condition()
+        self._pending: dict[Hashable, _Polled] = {}
+        self._schedule: list[tuple[float, int, _Polled]] = []  # A heap of polls by due time
+        self._order = count()
+        self._next_request = 0.0
+        self._thread: Thread | None = None
+
+    def __len__(self) -> int:
+        """The amount of work that hasn't finished yet."""
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, check: Callable[[], tuple[bool, T]], *,
+               timeout: float,
+               on_timeout: Callable[[], Exception],
+               key: Hashable | None = None,
+               backoff: Backoff | None = None,
+               name: str = 'Work') -> "Future[T]":
+        """
+        Start polling a piece of work.
+
+        Parameters
+        ----------
+        check: Callable[[], tuple[bool, T]]
+            Poll the work once, returning whether it has finished and, if so, its result.
+        timeout: float
+            How long to poll before giving up, in seconds from now.
+        on_timeout: Callable[[], Exception]
+            Make the error to resolve the future with if the work times out.
+        key: Hashable | None
+            Identifies the work, so that submitting it again while it's being polled returns
+            its existing future.  By default, every submission is new.
+        backoff: Backoff | None
+            How long to wait between polls, if not this poller's backoff.
+        name: str
+            What to call the work in log messages.
+
+        Returns
+        -------
+        Future[T]
+            A future resolved once the work finishes.
+
+        """
+        with self._condition:
+            if key is not None and key in self._pending:
+                return self._pending[key].future
+            now = time()
+            polled = _Polled(key=object() if key is None else key, check=check, future=Future(),
+                             deadline=now + timeout,
+                             backoff=backoff or self.backoff or _default_backoff,
+                             name=name, on_timeout=on_timeout)
+            self._pending[polled.key] = polled
+            heappush(self._schedule, (now, next(self._order), polled))
+            self._condition.notify()
+            return polled.future
+
+    def as_completed(self) -> Iterator[Future]:
+        """
+        Poll until all of the work has finished, yielding each future as its work finishes.
+
+        Work may be submitted while iterating, and is polled along with the rest.  This can't
+        be used once the poller has been started in the background.
+
+        Yields
+        ------
+        Future
+            The future of finished work, whose `result()` is its result, or raises the error
+            it finished with.
+
+        """
+        if self._thread is not None:
+            raise RuntimeError("This poller is polling in the background")
+        while True:
+            with self._condition:
+                wait, polled = self._take_due()
+            if polled is not None:
+                if self._poll(polled):
+                    yield polled.future
+            elif wait is None:
+                return
+            else:
+                sleep(wait)
+
+    def start(self) -> None:
+        """Start polling in a daemon thread, if this poller hasn't been started already."""
+        with self._condition:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name='citrine-poller', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                wait, polled = self._take_due()
+                if polled is None:
+                    self._condition.wait(wait)  # Or until more work is submitted
+                    continue
+            self._poll(polled)
+
+    def _take_due(self) -> tuple[float | None, _Polled | None]:
+        """
+        Take the work due to be polled soonest, if it's due now.
+
+        If no work is due, return how long until some is, or None if there is none.  This must
+        be called holding the lock.
+        """
+        while self._schedule:
+            due, _, polled = self._schedule[0]
+            if polled.future.cancelled():
+                heappop(self._schedule)
+                del self._pending[polled.key]
+                continue
+            wait = max(due, self._next_request) - time()
+            if wait > 0:
+                return wait, None
+            heappop(self._schedule)
+            self._next_request = time() + 1 / self.max_rate
+            return 0.0, polled
+        return None, None
+
+    def _poll(self, polled: _Polled) -> bool:
+        """Poll some work, and resolve its future or schedule its next poll; True if resolved."""
+        try:
+            return self._poll_once(polled)
+        except Exception as e:  # E.g., from on_timeout or the backoff; don't stop the loop
+            return self._resolve(polled, exception=e)
+
+    def _poll_once(self, polled: _Polled) -> bool:
+        retry_after = None
+        try:
+            with deferring_retry_after():
+                done, result = polled.check()
+        except TooManyRequests as e:
+            done, result, retry_after = False, None, e.retry_after
+        except Exception as e:
+            return self._resolve(polled, exception=e)
+        if done:
+            return self._resolve(polled, result=result)
+
+        now = time()
+        if now >= polled.deadline:
+            return self._resolve(polled, exception=polled.on_timeout())
+        polled.polls += 1
+        # Poll once more at the deadline, rather than waiting past it
+        delay = min(polled.backoff.delay(polled.polls, retry_after=retry_after),
+                    polled.deadline - now)
+        logger.info(f'{polled.name} still in progress, polling status again in '
+                    f'{delay:.2f} seconds.')
+        with self._condition:
+            if retry_after is not None:
+                self._next_request = max(self._next_request, now + retry_after)
+            heappush(self._schedule, (now + delay, next(self._order), polled))
+        return False
+
+    def _resolve(self, polled: _Polled, *,
+                 result: Any = None,
+                 exception: Exception | None = None) -> bool:
+        with self._condition:
+            self._pending.pop(polled.key, None)
+        if not polled.future.set_running_or_notify_cancel():
+            return False  # It was cancelled while being polled
+        if exception is not None:
+            polled.future.set_exception(exception)
+        else:
+            polled.future.set_result(result)
+        return True
+
+
+_background_poller: Poller | None = None
+_background_lock = Lock()
+
+
+def background_poller() -> Poller:
+    """The poller shared by every call that waits in the background, started on first use."""
+    global _background_poller
+    with _background_lock:
+        if _background_poller is None:
+            _background_poller = Poller()
+            _background_poller.start()
+        return _background_poller
+
+
+class ConditionTimeoutError(RuntimeError):
+    """Error that is raised when timeout is reached but the checked condition is still False."""
+
+    pass
+
+
+def asynchronous_object_check(
+    collection: "Collection[AsynchronousObject]",
+    uid: UUID | str
+) -> Callable[[], tuple[bool, "AsynchronousObject"]]:
+    """Make a function that fetches an asynchronous object once, for a Poller."""
+    def check() -> tuple[bool, "AsynchronousObject"]:
+        current_resource = collection.get(uid)
+        return not current_resource.in_progress(), current_resource
+    return check
+
+
+def asynchronous_object_timeout(uid: UUID | str, timeout: float) -> ConditionTimeoutError:
+    """Make the error for an asynchronous object that is still in progress after `timeout`."""
+    return ConditionTimeoutError(
+        "Timeout of {timeout_length} seconds "
+        "reached, but task {uid} is still in progress".format(timeout_length=timeout, uid=uid)
+    )
@@ -1,12 +1,20 @@
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from functools import partial
 from pprint import pprint
 
 from citrine._rest.collection import Collection
 from citrine._rest.asynchronous_object import AsynchronousObject
+from citrine.exceptions import TooManyRequests
 from citrine.informatics.executions.design_execution import DesignExecution
 from citrine.informatics.executions.generative_design_execution import GenerativeDesignExecution
 from citrine.informatics.executions.sample_design_space_execution import SampleDesignSpaceExecution
 from citrine.informatics.executions import PredictorEvaluation
+from citrine.jobs.polling import Backoff, Poller, _choose_backoff, \
+    asynchronous_object_check, asynchronous_object_timeout
+from citrine.jobs.polling import ConditionTimeoutError  # noqa: F401
+from citrine._session import deferring_retry_after
 
 
 ExecutionType = PredictorEvaluation \
@@ -15,12 +23,6 @@ ExecutionType = PredictorEvaluation \
     | SampleDesignSpaceExecution
 
 
-class ConditionTimeoutError(RuntimeError):
-    """Error that is raised when timeout is reached but the checked condition is still False."""
-
-    pass
-
-
 def _print_string_status(
     status: str, start_time: float, line_start: str = "", line_end: str = "\r"
 ):
@@ -37,12 +39,14 @@ def wait_for_asynchronous_object(
     collection: Collection[AsynchronousObject],
     print_status_info: bool = False,
     timeout: float = 1800.0,
-    interval: float = 3.0
+    interval: float | None = None,
+    backoff: Backoff | None = None
 ) -> AsynchronousObject:
     """
     Wait until an asynchronous object has finished.
 
-    This could be a module, workflow, workflow execution, or report.
+    This could be a module, workflow, workflow execution, or report.  It is fetched once per
+    poll, and polls start fast and back off, unless given a fixed interval.
 
     Parameters
     ----------
@@ -54,8 +58,11 @@ def wait_for_asynchronous_object(
         Whether to print status info, by default False
     timeout : float
         Maximum time spent waiting, in seconds, by default 1800.0
-    interval: float
-        Inquiry interval in seconds, by default 3.0
+    interval: float | None
+        A fixed inquiry interval in seconds, instead of backing off
+    backoff: Backoff | None
+        How long to wait between inquiries, by default the process-wide default
+        (see `citrine.jobs.polling.set_default_backoff`)
 
     Returns
     -------
@@ -68,24 +75,28 @@ def wait_for_asynchronous_object(
         If fails to finish within timeout
 
     """
+    backoff = _choose_backoff(backoff, interval)
     start = time.time()
+    polls = 0
+    while True:
+        retry_after = None
+        try:
+            with deferring_retry_after():
+                current_resource = collection.get(resource.uid)
+        except TooManyRequests as e:
+            retry_after = e.retry_after
+        else:
+            if print_status_info:
+                _print_string_status(current_resource.status, start)
+            if not current_resource.in_progress():
+                break
+        elapsed = time.time() - start
+        if elapsed >= timeout:
+            raise asynchronous_object_timeout(resource.uid, timeout)
+        polls += 1
+        # Check once more at the timeout, rather than waiting past it
+        time.sleep(min(backoff.delay(polls, retry_after=retry_after), timeout - elapsed))
 
-    def is_finished():
-        current_resource = collection.get(resource.uid)
-        if print_status_info:
-            _print_string_status(current_resource.status, start)
-        return not current_resource.in_progress()
-
-    while not is_finished() and (time.time() - start < timeout):
-        time.sleep(interval)
-    if not is_finished():
-        raise ConditionTimeoutError(
-            "Timeout of {timeout_length} seconds "
-            "reached, but task {uid} is still in progress".format(
-                timeout_length=timeout, uid=resource.uid)
-        )
-
-    current_resource = collection.get(resource.uid)
     if print_status_info and hasattr(current_resource, 'status_detail'):
         print("\nStatus info:")
         pprint([detail.msg for detail in current_resource.status_detail])
@@ -98,7 +109,8 @@ def wait_while_validating(
     module: AsynchronousObject,
     print_status_info: bool = False,
     timeout: float = 1800.0,
-    interval: float = 3.0,
+    interval: float | None = None,
+    backoff: Backoff | None = None,
 ) -> AsynchronousObject:
     """
     Wait until module is validated.
@@ -114,7 +126,9 @@ def wait_while_validating(
     timeout : float, optional
         Maximum time spent inquiring in seconds, by default 1800.0
     interval : float, optional
-        Inquiry interval in seconds, by default 3.0
+        A fixed inquiry interval in seconds, instead of backing off
+    backoff : Backoff, optional
+        How long to wait between inquiries, by default the process-wide default
 
     Returns
     -------
@@ -129,7 +143,7 @@ def wait_while_validating(
     """
     return wait_for_asynchronous_object(resource=module, collection=collection,
                                         print_status_info=print_status_info, timeout=timeout,
-                                        interval=interval)
+                                        interval=interval, backoff=backoff)
 
 
 def wait_while_executing(
@@ -138,7 +152,8 @@ def wait_while_executing(
     execution: ExecutionType,
     print_status_info: bool = False,
     timeout: float = 1800.0,
-    interval: float = 3.0
+    interval: float | None = None,
+    backoff: Backoff | None = None
 ) -> ExecutionType:
     """
     Wait until execution is finished.
@@ -152,7 +167,9 @@ def wait_while_executing(
     timeout : float, optional
         Maximum time spent inquiring in seconds, by default 1800.0
     interval : float, optional
-        Inquiry interval in seconds, by default 3.0
+        A fixed inquiry interval in seconds, instead of backing off
+    backoff : Backoff, optional
+        How long to wait between inquiries, by default the process-wide default
     collection : Collection[ExecutionType]
         Collection containing executions
 
@@ -169,4 +186,66 @@ def wait_while_executing(
     """
     return wait_for_asynchronous_object(resource=execution, collection=collection,
                                         print_status_info=print_status_info, timeout=timeout,
-                                        interval=interval)
+                                        interval=interval, backoff=backoff)
+
+
+def wait_for_all(
+    resources: Iterable[AsynchronousObject],
+    collection: Collection[AsynchronousObject],
+    *,
+    timeout: float = 1800.0,
+    interval: float | None = None,
+    backoff: Backoff | None = None,
+    max_rate: float = 10.0
+) -> Iterator[Future]:
+    """
+    Wait until many asynchronous objects have finished, yielding a future for each as it finishes.
+
+    The objects are polled together from one loop, each on its own schedule, which starts fast
+    and backs off unless given a fixed interval.  Each is fetched once per poll, and is no
+    longer polled once it has left its in-progress statuses.  Polling starts when iteration
+    does, and the timeout is counted from then.  A resource that times out, or that can't be
+    fetched, doesn't stop the others from being waited on: its future raises the error instead.
+
+    .. code:: python
+
+        executions = [workflow.design_executions.trigger(score) for score in scores]
+        for future in wait_for_all(executions, workflow.design_executions):
+            try:
+                execution = future.result()
+            except ConditionTimeoutError as e:
+                print(e)
+            else:
+                print(execution.uid, execution.status)
+
+    Parameters
+    ----------
+    resources: Iterable[AsynchronousObject]
+        The modules, executions, or evaluations to monitor.  Any given more than once are
+        polled, and yielded, once.
+    collection: Collection[AsynchronousObject]
+        Collection containing the resources
+    timeout: float
+        Maximum time spent waiting on each resource, in seconds, by default 1800.0
+    interval: float | None
+        A fixed inquiry interval for each resource in seconds, instead of backing off
+    backoff: Backoff | None
+        How long to wait between inquiries of each resource, by default the process-wide
+        default (see `citrine.jobs.polling.set_default_backoff`)
+    max_rate: float
+        The most inquiries to make per second, over all of the resources
+
+    Yields
+    ------
+    Future
+        A future for each resource, in the order they finish.  Its `result()` is the resource
+        after it has finished, or raises `ConditionTimeoutError` if it failed to finish within
+        timeout, or the error raised while fetching it.
+
+    """
+    poller = Poller(backoff=_choose_backoff(backoff, interval), max_rate=max_rate)
+    for resource in resources:
+        poller.submit(asynchronous_object_check(collection, resource.uid), key=resource.uid,
+                      timeout=timeout, name=type(resource).__name__,
+                      on_timeout=partial(asynchronous_object_timeout, resource.uid, timeout))
+    yield from poller.as_completed()
@@ -2,7 +2,9 @@
 import re
 from abc import abstractmethod, ABC
 from collections.abc import Iterable, Iterator
-from typing import List, TypeVar
+from concurrent.futures import Future
+from itertools import islice
+from typing import List, TYPE_CHECKING, TypeVar
 from uuid import UUID, uuid4
 
 from gemd.entity.dict_serializable import DictSerializable, DictSerializableMeta
@@ -12,19 +14,29 @@ from gemd.json import GEMDJson
 from gemd.util import recursive_foreach, set_uuids
 
 from citrine._rest.collection import Collection
+from citrine._rest.resource import ResourceTypeEnum
+from citrine._serialization.interning import interning
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 from citrine._serialization.properties import List as PropertyList, UUID as PropertyUUID
 from citrine._serialization.properties import Mapping, Object, Optional, String
 from citrine._serialization.serializable import Serializable
 from citrine._session import Session
-from citrine._utils.functions import format_escaped_url, replace_objects_with_links, scrub_none
+from citrine._utils.functions import format_escaped_url, merge_concurrently, \
+    registration_payload
+from citrine._utils.journal import RegistrationJournal
 from citrine.exceptions import BadRequest
-from citrine.jobs.job import _poll_for_job_completion
+from citrine.jobs.job import _job_future, _poll_for_job_completion
 from citrine.resources.audit_info import AuditInfo
 from citrine.resources.response import Response
 
+if TYPE_CHECKING:   # pragma: no cover
+    from citrine._utils.batcher import BatchSizer
+    from citrine._utils.registration_cache import RegistrationCache
+
 CITRINE_SCOPE = 'id'
 CITRINE_TAG_PREFIX = 'citr_auto'
+_DEFAULT_PAGE_SIZE = 100
+BATCH_SIZE = 50
 
 
 class DataConceptsMeta(DictSerializableMeta):
@@ -37,6 +49,7 @@ class DataConceptsMeta(DictSerializableMeta):
         if resolved is not None:
             cls._typ_stash = resolved
         cls.typ = String("type")
+        cls.__dict__["typ"].__set_name__(cls, "typ")
 
 
 class DataConcepts(
@@ -251,11 +264,52 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             A data model object built from the dictionary.
 
         """
-        return self.get_type().build(data)
+        with interning(), self._building():
+            return self.get_type().build(data)
+
+    def build_many(self, data: Iterable[dict]) -> list[ResourceType]:
+        """
+        Build an object of type ResourceType from each of several serialized dictionaries.
+
+        This is an internal method, and should not be called directly by users.  It gives the
+        same objects as calling `build` on each dictionary, but faster, and with their repeated
+        links and strings shared.
+
+        Parameters
+        ----------
+        data: Iterable[dict]
+            Serialized data model objects, such as a page of results.
+
+        Returns
+        -------
+        list[ResourceType]
+            The data model objects built from the dictionaries.
+
+        """
+        with interning(), self._building():
+            return self.get_type().build_many(data)
+
+    def _build_pages(self, raw_objects: Iterable[dict], *,
+                     per_page: int | None) -> Iterator[ResourceType]:
+        """
+        Build objects a page at a time, sharing repeated links and strings across pages.
+
+        If `per_page` is None, the server picks the page size, so objects are built in chunks of
+        the default page size instead; never more than a page is read ahead of the caller.
+        """
+        table = {}
+        raw_objects = iter(raw_objects)
+        while page := list(islice(raw_objects, per_page or _DEFAULT_PAGE_SIZE)):
+            with interning(table):
+                built = self.build_many(page)
+            yield from built
 
     def list(self, *,
              per_page: int | None = 100,
-             forward: bool = True) -> Iterator[ResourceType]:
+             forward: bool = True,
+             prefetch: int = 0,
+             max_workers: int | None = None,
+             preserve_order: bool = False) -> Iterator[ResourceType]:
         """
         Get all visible elements of the collection.
 
@@ -271,6 +325,18 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             or experiencing latency from large payload sizes.
         forward: bool
             Set to False to reverse the order of results (i.e., return in descending order)
+        prefetch: int
+            The number of pages to request ahead on a background thread while the current page
+            is being consumed.  Default is 0, which requests each page only when it is needed.
+        max_workers: int, optional
+            Only used when this collection spans the whole team (dataset_id is None).  If set,
+            each readable dataset is listed with its own cursor, up to this many at a time, and
+            the results are merged.  The readable datasets are looked up when iteration begins.
+            The `list_by_*` searches take this argument too.  Default is None, which walks a
+            single cursor over the team.
+        preserve_order: bool
+            When listing datasets in parallel, yield all of one dataset's objects before moving
+            on to the next, rather than yielding objects as soon as they arrive.  Default: False
 
         Returns
         -------
@@ -278,16 +344,13 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             Every object in this collection.
 
         """
-        params = {}
-        if self.dataset_id is not None:
-            params['dataset_id'] = str(self.dataset_id)
-        raw_objects = self.session.cursor_paged_resource(
-            self.session.get_resource,
-            self._get_path(ignore_dataset=True),
-            forward=forward,
-            per_page=per_page,
-            params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._list_by_cursor(self._get_path(ignore_dataset=True),
+                                    params={},
+                                    forward=forward,
+                                    per_page=per_page,
+                                    prefetch=prefetch,
+                                    max_workers=max_workers,
+                                    preserve_order=preserve_order)
 
     def register(self, model: ResourceType, *, dry_run=False):
         """
@@ -326,7 +389,7 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         temp_scope = str(uuid4())
         scope = temp_scope if dry_run else CITRINE_SCOPE
         set_uuids(model, scope=scope)
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
+        dumped_data = registration_payload(model)
 
         data = self.session.post_resource(path, dumped_data, params=params)
         registered = self.build(data)
@@ -358,7 +421,11 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
                      *,
                      dry_run: bool = False,
                      status_bar: bool = False,
-                     include_nested: bool = False) -> List[ResourceType]:
+                     include_nested: bool = False,
+                     max_workers: int = 1,
+                     batch_sizer: 'BatchSizer | None' = None,
+                     journal: RegistrationJournal | None = None,
+                     cache: 'RegistrationCache | None' = None) -> List[ResourceType]:
         """
         Register multiple GEMD objects to each of their appropriate collections.
 
@@ -393,6 +460,26 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             Whether to just register the objects passed in the list, or include nested objects
             (e.g., obj.process, obj.spec.template, ...).  Default: false
 
+        max_workers: int
+            The maximum number of batches to submit concurrently.  Only batches that do not
+            depend on each other are sent at the same time.  Default: 1
+
+        batch_sizer: BatchSizer, optional
+            If provided, batches are sized adaptively by object count and serialized size,
+            and batches rejected as too large are split and retried.  The size and duration
+            of every batch is recorded in `batch_sizer.history`.  Default: fixed batches of 50
+
+        journal: RegistrationJournal, optional
+            If provided, acknowledged batches are recorded in the journal file, and objects that
+            an earlier, interrupted attempt registered are restored from it instead of being sent
+            again.  Cannot be combined with `dry_run`.  Default: None
+
+        cache: RegistrationCache, optional
+            If provided, objects whose content is unchanged since they were last registered
+            through the cache are skipped, and their uids and tags restored from it.  The number
+            skipped is reported in `cache.skipped`.  Cannot be combined with `dry_run`.
+            Default: None
+
         Returns
         -------
         list[DataConcepts]
@@ -408,7 +495,53 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             models,
             dry_run=dry_run,
             status_bar=status_bar,
-            include_nested=include_nested
+            include_nested=include_nested,
+            max_workers=max_workers,
+            batch_sizer=batch_sizer,
+            journal=journal,
+            cache=cache
+        )
+
+    def register_stream(self,
+                        models: Iterable[ResourceType],
+                        *,
+                        batch_size: int = BATCH_SIZE,
+                        status_bar: bool = False) -> Iterator[ResourceType]:
+        """
+        Register GEMD objects from an iterable in rolling batches, yielding the results.
+
+        Only `batch_size` objects are held at a time, so `models` may be a generator over
+        arbitrarily many objects, but they must already be in load order: everything an object
+        references must already be on the platform or appear earlier in `models`.  Nothing is
+        registered until iteration begins.  See `GEMDResourceCollection.register_stream`.
+
+        Parameters
+        ----------
+        models: Iterable[DataConcepts]
+            The data model objects to register, in load order. Can be different types.
+
+        batch_size: int
+            The number of objects to send in each request.  Default: 50
+
+        status_bar: bool
+            Whether to display a status bar using the tqdm module to track progress in
+            registration. Requires installing the optional tqdm module. Default: false
+
+        Yields
+        ------
+        DataConcepts
+            The registered version of each object, batch by batch.
+
+        """
+        # avoiding a circular import
+        from citrine.resources.gemd_resource import GEMDResourceCollection
+        gemd_collection = GEMDResourceCollection(team_id=self.team_id,
+                                                 dataset_id=self.dataset_id,
+                                                 session=self.session)
+        return gemd_collection.register_stream(
+            models,
+            batch_size=batch_size,
+            status_bar=status_bar
         )
 
     def update(self, model: ResourceType) -> ResourceType:
@@ -433,7 +566,7 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
                      dry_run: bool = False,
                      wait_for_response: bool = True,
                      timeout: float = 2 * 60,
-                     polling_delay: float = 1.0,
+                     polling_delay: float | None = None,
                      return_model: bool = False) -> UUID | ResourceType | None:
         """
         Update a particular element of the collection with data validation.
@@ -456,8 +589,9 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         timeout: float
             How long to poll for the result before giving up. This is expressed in
             (fractional) seconds.
-        polling_delay: float
-            How long to delay between each polling retry attempt.
+        polling_delay: float | None
+            A fixed delay between each polling retry attempt.  By default,
+            polling backs off, starting fast.
         return_model: bool
             Whether or not to return an updated version of the resource
             If wait_for_response is False, then this argument has no effect
@@ -478,21 +612,7 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             method.
 
         """
-        temp_scope = str(uuid4())
-        GEMDJson(scope=temp_scope).dumps(model)  # This apparent no-op populates uids
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
-        recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
-
-        scope = CITRINE_SCOPE
-        id = dumped_data['uids'][scope]
-        if self.dataset_id is None:
-            raise RuntimeError("Must specify a dataset in order to update "
-                               "a data model object with data validation.")
-
-        url = self._get_path(action=[scope, id, "async"])
-        response_json = self.session.put_resource(url, dumped_data, params={'dry_run': dry_run})
-
-        job_id = response_json["job_id"]
+        job_id, link = self._submit_async_update(model, dry_run=dry_run)
 
         if wait_for_response:
             self.poll_async_update_job(job_id=job_id, timeout=timeout,
@@ -500,15 +620,69 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
 
             # That worked, return nothing or return the object
             if return_model:
-                return self.get(LinkByUID(scope=scope, id=id))
+                return self.get(link)
             else:
                 return None
         else:
             # TODO: use JobSubmissionResponse here instead
             return job_id
 
+    def async_update_future(self, model: ResourceType, *,
+                            dry_run: bool = False,
+                            timeout: float = 2 * 60,
+                            return_model: bool = False) -> "Future[ResourceType | None]":
+        """
+        Start updating an element of the collection with data validation, returning a future.
+
+        This submits the same update as
+        :func:`~citrine.resources.DataConceptsCollection.async_update`, and then waits for it
+        in the background, so that many updates can be made at once.
+
+        Parameters
+        ----------
+        model: ResourceType
+            The DataConcepts object.
+        dry_run: bool
+            Whether to actually update the item or run a dry run of the update operation.
+            Dry run is intended to be used for validation. Default: false
+        timeout: float
+            How long to poll for the result before giving up. This is expressed in
+            (fractional) seconds.
+        return_model: bool
+            Whether or not the future's result should be an updated version of the resource
+
+        Returns
+        -------
+        Future[ResourceType | None]
+            A future whose `result()` waits for the update, and is None, or the updated
+            resource if return_model is True.  In the case of a failure validating or
+            processing the update, `result()` raises a JobFailureError.
+
+        """
+        job_id, link = self._submit_async_update(model, dry_run=dry_run)
+        return _job_future(self.session, job_id, team_id=self.team_id, timeout=timeout,
+                           then=lambda _: self.get(link) if return_model else None)
+
+    def _submit_async_update(self, model: ResourceType, *,
+                             dry_run: bool) -> tuple[UUID, LinkByUID]:
+        """Submit an update with data validation, returning its job ID and the model's link."""
+        temp_scope = str(uuid4())
+        GEMDJson(scope=temp_scope).dumps(model)  # This apparent no-op populates uids
+        dumped_data = registration_payload(model)
+        recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
+
+        scope = CITRINE_SCOPE
+        id = dumped_data['uids'][scope]
+        if self.dataset_id is None:
+            raise RuntimeError("Must specify a dataset in order to update "
+                               "a data model object with data validation.")
+
+        url = self._get_path(action=[scope, id, "async"])
+        response_json = self.session.put_resource(url, dumped_data, params={'dry_run': dry_run})
+        return response_json["job_id"], LinkByUID(scope=scope, id=id)
+
     def poll_async_update_job(self, job_id: UUID, *, timeout: float = 2 * 60,
-                              polling_delay: float = 1.0) -> None:
+                              polling_delay: float | None = None) -> None:
         """
         Poll for the result of the async_update call.
 
@@ -528,7 +702,8 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             How long to poll for the result before giving up. This is expressed in
             (fractional) seconds.
         polling_delay:
-            How long to delay between each polling retry attempt.
+            A fixed delay between each polling retry attempt.  By default,
+            polling backs off, starting fast.
 
         Returns
         -------
@@ -568,7 +743,8 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         return self.build(data)
 
     def list_by_name(self, name: str, *, exact: bool = False,
-                     forward: bool = True, per_page: int = 100) -> Iterator[ResourceType]:
+                     forward: bool = True, per_page: int = 100,
+                     prefetch: int = 0) -> Iterator[ResourceType]:
         """
         Get all objects with specified name in this dataset.
 
@@ -585,6 +761,9 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             Controls the number of results fetched with each http request to the backend.
             Typically, this is set to a sensible default and should not be modified. Consider
             modifying this value only if you find this method is unacceptably latent.
+        prefetch: int
+            The number of pages to request ahead on a background thread while the current page
+            is being consumed.  Default is 0, which requests each page only when it is needed.
 
         Returns
         -------
@@ -601,10 +780,14 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             self._get_path(ignore_dataset=True, action="filter-by-name"),
             forward=forward,
             per_page=per_page,
+            prefetch=prefetch,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._build_pages(raw_objects, per_page=per_page)
 
-    def list_by_tag(self, tag: str, *, per_page: int = 100) -> Iterator[ResourceType]:
+    def list_by_tag(self, tag: str, *, per_page: int = 100,
+                    prefetch: int = 0,
+                    max_workers: int | None = None,
+                    preserve_order: bool = False) -> Iterator[ResourceType]:
         """
         Get all objects bearing a tag prefixed with `tag` in the collection.
 
@@ -623,6 +806,13 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             Controls the number of results fetched with each http request to the backend.
             Typically, this is set to a sensible default and should not be modified. Consider
             modifying this value only if you find this method is unacceptably latent.
+        prefetch: int
+            The number of pages to request ahead on a background thread while the current page
+            is being consumed.  Default is 0, which requests each page only when it is needed.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -630,15 +820,12 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             Every object in this collection.
 
         """
-        params = {'tags': [tag]}
-        if self.dataset_id is not None:
-            params['dataset_id'] = str(self.dataset_id)
-        raw_objects = self.session.cursor_paged_resource(
-            self.session.get_resource,
-            self._get_path(ignore_dataset=True),
-            per_page=per_page,
-            params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._list_by_cursor(self._get_path(ignore_dataset=True),
+                                    params={'tags': [tag]},
+                                    per_page=per_page,
+                                    prefetch=prefetch,
+                                    max_workers=max_workers,
+                                    preserve_order=preserve_order)
 
     def delete(self, uid: UUID | str | LinkByUID | BaseEntity, *, dry_run: bool = False):
         """
@@ -660,7 +847,9 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         return Response(status_code=200)  # delete succeeded
 
     def _get_relation(self, relation: str, uid: UUID | str | LinkByUID | BaseEntity,
-                      forward: bool = True, per_page: int = 100) -> Iterator[ResourceType]:
+                      forward: bool = True, per_page: int = 100,
+                      max_workers: int | None = None,
+                      preserve_order: bool = False) -> Iterator[ResourceType]:
         """
         Generic method for searching this collection by relation to another object.
 
@@ -678,6 +867,11 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         per_page
             The number of results to retrieve in each request to the backend. Typically
             this is an unnecessary parameter.
+        max_workers
+            If set and dataset_id is None, search each readable dataset separately, up to
+            this many at a time.
+        preserve_order
+            When searching datasets in parallel, keep each dataset's results together.
         Returns
         -------
         Iterator[ResourceType]
@@ -685,21 +879,62 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             provided uid and scope.
 
         """
-        params = {}
-        if self.dataset_id is not None:
-            params['dataset_id'] = str(self.dataset_id)
         link = _make_link_by_uid(uid)
-        raw_objects = self.session.cursor_paged_resource(
-            self.session.get_resource,
-            format_escaped_url('teams/{}/{}/{}/{}/{}',
-                               self.team_id,
-                               relation,
-                               link.scope,
-                               link.id,
-                               self._collection_key.replace('_', '-')
-                               ),
-            forward=forward,
-            per_page=per_page,
-            params=params,
-            version='v1')
-        return (self.build(raw) for raw in raw_objects)
+        return self._list_by_cursor(format_escaped_url('teams/{}/{}/{}/{}/{}',
+                                                       self.team_id,
+                                                       relation,
+                                                       link.scope,
+                                                       link.id,
+                                                       self._collection_key.replace('_', '-')
+                                                       ),
+                                    params={},
+                                    forward=forward,
+                                    per_page=per_page,
+                                    version='v1',
+                                    max_workers=max_workers,
+                                    preserve_order=preserve_order)
+
+    def _list_by_cursor(self, path: str, *,
+                        params: dict,
+                        forward: bool = True,
+                        per_page: int = 100,
+                        prefetch: int = 0,
+                        version: str = 'v2',
+                        max_workers: int | None = None,
+                        preserve_order: bool = False) -> Iterator[ResourceType]:
+        """
+        Build every object returned by a cursor-paged, team-level endpoint.
+
+        The search is restricted to this collection's dataset, if it has one.  Otherwise, if
+        `max_workers` is set, the readable datasets of the team are searched concurrently,
+        one cursor per dataset, and their results merged.
+        """
+        def cursor(dataset_id: UUID | str | None):
+            dataset_params = dict(params)
+            if dataset_id is not None:
+                dataset_params['dataset_id'] = str(dataset_id)
+            return self.session.cursor_paged_resource(
+                self.session.get_resource,
+                path,
+                forward=forward,
+                per_page=per_page,
+                prefetch=prefetch,
+                version=version,
+                params=dataset_params)
+
+        def merged():
+            # avoiding a circular import
+            from citrine.resources.team import TeamResourceIDs
+            dataset_ids = TeamResourceIDs(session=self.session,
+                                          team_id=self.team_id,
+                                          resource_type=ResourceTypeEnum.DATASET.value
+                                          ).list_readable()
+            yield from merge_concurrently([cursor(dataset_id) for dataset_id in dataset_ids],
+                                          max_workers=max_workers,
+                                          preserve_order=preserve_order)
+
+        if self.dataset_id is not None or max_workers is None:
+            raw_objects = cursor(self.dataset_id)
+        else:
+            raw_objects = merged()  # The datasets are only looked up once iteration begins
+        return self._build_pages(raw_objects, per_page=per_page)
@@ -7,7 +7,7 @@ from uuid import uuid4
 from gemd.json import GEMDJson
 from gemd.util import recursive_foreach
 
-from citrine._utils.functions import get_object_id, replace_objects_with_links, scrub_none
+from citrine._utils.functions import get_object_id, registration_payload
 from citrine._serialization.properties import List, Object, Optional, String
 from gemd.entity.file_link import FileLink
 from citrine.exceptions import BadRequest
@@ -88,7 +88,7 @@ class DataObjectCollection(DataConceptsCollection[DataObjectResourceType], ABC):
             forward=forward,
             per_page=per_page,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._build_pages(raw_objects, per_page=per_page)
 
     @staticmethod
     def _get_attribute_bounds_search_body(attribute_bounds):
@@ -127,16 +127,15 @@ class DataObjectCollection(DataConceptsCollection[DataObjectResourceType], ABC):
 
         temp_scope = str(uuid4())
         GEMDJson(scope=temp_scope).dumps(model)  # This apparent no-op populates uids
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
+        dumped_data = registration_payload(model)
         recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
 
         request_data = {"dataObject": dumped_data}
         if object_template is not None:
-            request_data["objectTemplate"] = \
-                replace_objects_with_links(scrub_none(object_template.dump()))
+            request_data["objectTemplate"] = registration_payload(object_template)
         if ingredient_process_template is not None:
             request_data["ingredientProcessTemplate"] = \
-                replace_objects_with_links(scrub_none(ingredient_process_template.dump()))
+                registration_payload(ingredient_process_template)
         try:
             self.session.put_resource(path, request_data)
             return []
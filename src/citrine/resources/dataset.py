@@ -10,7 +10,10 @@ from citrine._rest.collection import Collection
 from citrine._rest.resource import Resource, ResourceTypeEnum
 from citrine._serialization import properties
 from citrine._session import Session
+from citrine._utils.batcher import BatchSizer
 from citrine._utils.functions import scrub_none
+from citrine._utils.journal import RegistrationJournal
+from citrine._utils.registration_cache import RegistrationCache
 from citrine.exceptions import NotFound
 from citrine.resources.api_error import ApiError
 from citrine.resources.condition_template import ConditionTemplateCollection
@@ -18,7 +21,7 @@ from citrine.resources.data_concepts import DataConcepts
 from citrine.resources.delete import _poll_for_async_batch_delete_result
 from citrine.resources.file_link import FileCollection
 from citrine.resources.ingestion import IngestionCollection
-from citrine.resources.gemd_resource import GEMDResourceCollection
+from citrine.resources.gemd_resource import BATCH_SIZE, GEMDResourceCollection
 from citrine.resources.ingredient_run import IngredientRunCollection
 from citrine.resources.ingredient_spec import IngredientSpecCollection
 from citrine.resources.material_run import MaterialRunCollection
@@ -218,7 +221,11 @@ class Dataset(Resource['Dataset']):
                      *,
                      dry_run: bool = False,
                      status_bar: bool = False,
-                     include_nested: bool = False) -> list[DataConcepts]:
+                     include_nested: bool = False,
+                     max_workers: int = 1,
+                     batch_sizer: BatchSizer | None = None,
+                     journal: RegistrationJournal | None = None,
+                     cache: RegistrationCache | None = None) -> list[DataConcepts]:
         """
         Register multiple GEMD objects to each of their appropriate collections.
 
@@ -249,6 +256,26 @@ class Dataset(Resource['Dataset']):
             Whether to just register the objects passed in the list, or include nested objects
             (e.g., obj.process, obj.spec.template, ...).  Default: false
 
+        max_workers: int
+            The maximum number of batches to submit concurrently.  Only batches that do not
+            depend on each other are sent at the same time.  Default: 1
+
+        batch_sizer: BatchSizer, optional
+            If provided, batches are sized adaptively by object count and serialized size,
+            and batches rejected as too large are split and retried.  The size and duration
+            of every batch is recorded in `batch_sizer.history`.  Default: fixed batches of 50
+
+        journal: RegistrationJournal, optional
+            If provided, acknowledged batches are recorded in the journal file, and objects that
+            an earlier, interrupted attempt registered are restored from it instead of being sent
+            again.  Cannot be combined with `dry_run`.  Default: None
+
+        cache: RegistrationCache, optional
+            If provided, objects whose content is unchanged since they were last registered
+            through the cache are skipped, and their uids and tags restored from it.  The number
+            skipped is reported in `cache.skipped`.  Cannot be combined with `dry_run`.
+            Default: None
+
         Returns
         -------
         list[DataConcepts]
@@ -259,7 +286,48 @@ class Dataset(Resource['Dataset']):
             models,
             dry_run=dry_run,
             status_bar=status_bar,
-            include_nested=include_nested
+            include_nested=include_nested,
+            max_workers=max_workers,
+            batch_sizer=batch_sizer,
+            journal=journal,
+            cache=cache
+        )
+
+    def register_stream(self,
+                        models: Iterable[DataConcepts],
+                        *,
+                        batch_size: int = BATCH_SIZE,
+                        status_bar: bool = False) -> Iterator[DataConcepts]:
+        """
+        Register GEMD objects from an iterable in rolling batches, yielding the results.
+
+        Only `batch_size` objects are held at a time, so `models` may be a generator over
+        arbitrarily many objects, but they must already be in load order: everything an object
+        references must already be on the platform or appear earlier in `models`.  Nothing is
+        registered until iteration begins.  See `GEMDResourceCollection.register_stream`.
+
+        Parameters
+        ----------
+        models: Iterable[DataConcepts]
+            The data model objects to register, in load order. Can be different types.
+
+        batch_size: int
+            The number of objects to send in each request.  Default: 50
+
+        status_bar: bool
+            Whether to display a status bar using the tqdm module to track progress in
+            registration. Requires installing the optional tqdm module. Default: false
+
+        Yields
+        ------
+        DataConcepts
+            The registered version of each object, batch by batch.
+
+        """
+        return self.gemd.register_stream(
+            models,
+            batch_size=batch_size,
+            status_bar=status_bar
         )
 
     def update(self, model: DataConcepts) -> DataConcepts:
@@ -291,7 +359,7 @@ class Dataset(Resource['Dataset']):
             prompt_to_confirm: bool = True,
             remove_templates: bool = True,
             timeout: float = 2 * 60,
-            polling_delay: float = 1.0
+            polling_delay: float | None = None
     ):
         """
         Delete all the GEMD objects from within a single Dataset.
@@ -310,8 +378,9 @@ class Dataset(Resource['Dataset']):
             Amount of time to wait on the job (in seconds) before giving up.
             Note that this number has no effect on the underlying job itself,
             which can also time out server-side.
-        polling_delay: float
-            How long to delay between each polling retry attempt.
+        polling_delay: float | None
+            A fixed delay between each polling retry attempt.  By default,
+            polling backs off, starting fast.
         Returns
         -------
         list[tuple[LinkByUID, ApiError]]
@@ -350,7 +419,7 @@ class Dataset(Resource['Dataset']):
             id_list: list[LinkByUID | UUID | str | BaseEntity],
             *,
             timeout: float = 2 * 60,
-            polling_delay: float = 1.0
+            polling_delay: float | None = None
     ) -> list[tuple[LinkByUID, ApiError]]:
         """
         Remove a set of GEMD objects.
@@ -383,8 +452,9 @@ class Dataset(Resource['Dataset']):
             to 2 minutes. Note that this number has no effect on the underlying job
             itself, which can also time out server-side.
 
-        polling_delay: float
-            How long to delay between each polling retry attempt.
+        polling_delay: float | None
+            A fixed delay between each polling retry attempt.  By default,
+            polling backs off, starting fast.
 
         Returns
         -------
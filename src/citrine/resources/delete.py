@@ -17,7 +17,7 @@ def _async_gemd_batch_delete(
         session: Session,
         dataset_id: UUID | None = None,
         timeout: float = 2 * 60,
-        polling_delay: float = 1.0
+        polling_delay: float | None = None
 ) -> list[tuple[LinkByUID, ApiError]]:
     """
     Shared implementation of Async GEMD Batch deletion.
@@ -50,8 +50,9 @@ def _async_gemd_batch_delete(
         to 2 minutes. Note that this number has no effect on the underlying job
         itself, which can also time out server-side.
 
-    polling_delay: float
-        How long to delay between each polling retry attempt.
+    polling_delay: float | None
+        A fixed delay between each polling retry attempt.  By default,
+        polling backs off, starting fast.
 
     Returns
     -------
@@ -92,7 +93,7 @@ def _poll_for_async_batch_delete_result(
         session: Session,
         job_id: str,
         timeout: float,
-        polling_delay: float
+        polling_delay: float | None
 ) -> list[tuple[LinkByUID, ApiError]]:
     """
     Poll for the result of an asynchronous batch delete (or a deletion of dataset contents).
@@ -113,8 +114,9 @@ def _poll_for_async_batch_delete_result(
         Note that this number has no effect on the underlying job itself,
         which can also time out server-side.
 
-    polling_delay: float
-        How long to delay between each polling retry attempt.
+    polling_delay: float | None
+        A fixed delay between each polling retry attempt.  By default,
+        polling backs off, starting fast.
 
     Returns
     -------
@@ -94,27 +94,31 @@ class DesignSpaceCollection(Collection[TopLevelDesignSpace]):
         entity = self.session.put_resource(url, {}, version=self._api_version)
         return self.build(entity)
 
-    def _list_base(self, *, per_page: int = 100, archived: bool | None = None):
+    def _list_base(self, *, per_page: int = 100, archived: bool | None = None,
+                   lazy: bool = False):
         filters = {}
         if archived is not None:
             filters["archived"] = archived
 
         fetcher = partial(self._fetch_page, additional_params=filters, version="v4")
         return self._paginator.paginate(page_fetcher=fetcher,
-                                        collection_builder=self._build_collection_elements,
+                                        collection_builder=partial(self._build_collection_elements,
+                                                                   lazy=lazy),
                                         per_page=per_page)
 
-    def list_all(self, *, per_page: int = 20) -> Iterable[TopLevelDesignSpace]:
+    def list_all(self, *, per_page: int = 20, lazy: bool = False) -> Iterable[TopLevelDesignSpace]:
         """List all design spaces."""
-        return self._list_base(per_page=per_page)
+        return self._list_base(per_page=per_page, lazy=lazy)
 
-    def list(self, *, per_page: int = 20) -> Iterable[TopLevelDesignSpace]:
+    def list(self, *, per_page: int = 20, lazy: bool = False) -> Iterable[TopLevelDesignSpace]:
         """List non-archived design spaces."""
-        return self._list_base(per_page=per_page, archived=False)
+        return self._list_base(per_page=per_page, archived=False, lazy=lazy)
 
-    def list_archived(self, *, per_page: int = 20) -> Iterable[TopLevelDesignSpace]:
+    def list_archived(self, *,
+                      per_page: int = 20,
+                      lazy: bool = False) -> Iterable[TopLevelDesignSpace]:
         """List archived design spaces."""
-        return self._list_base(per_page=per_page, archived=True)
+        return self._list_base(per_page=per_page, archived=True, lazy=lazy)
 
     def create_default(self,
                        *,
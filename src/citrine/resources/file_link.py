@@ -85,6 +85,7 @@ class FileLinkMeta(DictSerializableMeta):
     def __init__(cls, *args, **kwargs):
         super().__init__(*args, **kwargs)
         cls.typ = properties.String('type', default="file_link", deserializable=False)
+        cls.__dict__["typ"].__set_name__(cls, "typ")
 
 
 def _get_ids_from_url(url: str) -> tuple[UUID | None, UUID | None]:
@@ -1,24 +1,30 @@
 """Collection class for generic GEMD objects and templates."""
+import json
 import re
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from time import perf_counter
 from uuid import UUID, uuid4
 
 from gemd.entity.base_entity import BaseEntity
 from gemd.entity.link_by_uid import LinkByUID
 from gemd.util import recursive_flatmap, recursive_foreach, set_uuids, \
     make_index, substitute_objects
+from requests.exceptions import RetryError
 from tqdm.auto import tqdm
 
+from citrine.exceptions import PayloadTooLarge
 from citrine.resources.api_error import ApiError
 from citrine.resources.data_concepts import DataConcepts, DataConceptsCollection, \
-    CITRINE_SCOPE, CITRINE_TAG_PREFIX
+    BATCH_SIZE, CITRINE_SCOPE, CITRINE_TAG_PREFIX
 from citrine.resources.delete import _async_gemd_batch_delete
 from citrine._session import Session
-from citrine._utils.batcher import Batcher
-from citrine._utils.functions import replace_objects_with_links, scrub_none
-
-
-BATCH_SIZE = 50
+from citrine._utils.batcher import Batcher, BatchRecord, BatchSizer
+from citrine._utils.functions import registration_payload
+from citrine._utils.journal import RegistrationJournal
+from citrine._utils.registration_cache import RegistrationCache
 
 
 class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
@@ -65,7 +71,11 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
                      *,
                      dry_run=False,
                      status_bar=False,
-                     include_nested=False) -> list[DataConcepts]:
+                     include_nested=False,
+                     max_workers: int = 1,
+                     batch_sizer: BatchSizer | None = None,
+                     journal: RegistrationJournal | None = None,
+                     cache: RegistrationCache | None = None) -> list[DataConcepts]:
         """
         Register multiple GEMD objects to each of their appropriate collections.
 
@@ -100,83 +110,338 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
             Whether to just register the objects passed in the list, or include nested objects
             (e.g., obj.process, obj.spec.template, ...).  Default: false
 
+        max_workers: int
+            The maximum number of batches to submit concurrently.  Only batches that do not
+            depend on each other are sent at the same time; each group of such batches is
+            finished before the next is started.  Once a batch fails, no more are sent, and the
+            batches already sent are finished and applied before its error is raised.
+            Default: 1
+
+        batch_sizer: BatchSizer | None
+            If provided, batches are sized by object count and serialized size, adapting to the
+            observed request latency, and batches rejected as too large (413) or timing out
+            (504) are split and retried.  The size and duration of every batch is recorded in
+            `batch_sizer.history`.  For a dry run, the current size of `batch_sizer` is used as
+            a fixed batch size.  Default: None, which uses fixed batches of 50 objects.
+
+        journal: RegistrationJournal | None
+            If provided, every acknowledged batch is recorded in the journal file, and objects
+            that it records as registered by an earlier, interrupted attempt are not sent again;
+            their uids and tags are restored from the journal instead.  Cannot be combined with
+            `dry_run`.  Default: None
+
+        cache: RegistrationCache | None
+            If provided, objects whose content is unchanged since they were last registered
+            through the cache are not sent; their uids and tags are restored from the cache
+            instead, and the number skipped is reported in `cache.skipped`.  Cannot be combined
+            with `dry_run`.  Default: None
+
         Returns
         -------
         list[DataConcepts]
-            The registered versions
+            The registered versions.  Objects restored from the journal or the cache are returned
+            as passed.
 
         """
         if self.dataset_id is None:
             raise RuntimeError("Must specify a dataset in order to register a data model object.")
-        path = self._get_path()
+        if dry_run and (journal is not None or cache is not None):
+            raise ValueError("A dry run cannot use a journal or a cache.")
         params = {'dry_run': dry_run}
 
         if include_nested:
             models = recursive_flatmap(models, lambda o: [o], unidirectional=False)
 
+        if journal is not None:
+            # Match objects before they are assigned uids, which differ between attempts
+            models, resources = journal.restore(models)
+        else:
+            resources = list()
+
         temp_scope = str(uuid4())
         scope = temp_scope if dry_run else CITRINE_SCOPE
         set_uuids(models, scope=scope)
+        if cache is not None:
+            models, unchanged = cache.filter(models)
+            resources.extend(unchanged)
 
-        resources = list()
         result_index = dict()
         if dry_run:
             batcher = Batcher.by_dependency()
         else:
             batcher = Batcher.by_type()
 
+        if batch_sizer is not None and not dry_run:
+            groups = [[batch] for batch in batcher.by_order(models)]
+        else:
+            size = BATCH_SIZE if batch_sizer is None else batch_sizer.size
+            groups = batcher.levels(batcher.batch(models, size))
         if status_bar:
             desc = "Verifying GEMDs" if dry_run else "Registering GEMDs"
-            iterator = tqdm(batcher.batch(models, BATCH_SIZE), leave=False, desc=desc)
+            total = sum(len(batch) for level in groups for batch in level)
+            progress = tqdm(total=total, leave=False, desc=desc)
         else:
-            iterator = batcher.batch(models, BATCH_SIZE)
-
-        for batch in iterator:
-            objects = [replace_objects_with_links(scrub_none(model.dump())) for model in batch]
-            response_data = self.session.put_resource(
-                path + '/batch',
-                json={'objects': objects},
-                params=params
-            )
-            registered = [self.build(obj) for obj in response_data['objects']]
-            result_index.update(make_index(registered))
-            substitute_objects(registered, result_index, inplace=True)
-
-            if not dry_run:
-                # Platform may add a CITRINE_SCOPE uid and citr_auto tags; update locals
-                for obj in batch:
-                    result = result_index[obj.to_link()]
-                    obj.uids.update({k: v for k, v in result.uids.items()})
-                    if result.tags is not None:
-                        obj.tags = list(result.tags)
-            else:
-                # Remove of the tags/uids the platform spuriously added
-                # this might leave objects with just the temp ids, which we want to strip later
-                for obj in batch:
-                    result = result_index[obj.to_link()]
-                    if CITRINE_SCOPE not in obj.uids:
-                        citr_id = result.uids.pop(CITRINE_SCOPE, None)
-                        result_index.pop(LinkByUID(scope=CITRINE_SCOPE, id=citr_id), None)
-                    if result.tags is not None:
-                        todo = [tag for tag in result.tags
-                                if re.match(f"^{CITRINE_TAG_PREFIX}::", tag)]
-                        for tag in todo:  # Covering this block would require dark art
-                            if tag not in obj.tags:
-                                result.tags.remove(tag)
-
-            resources.extend(registered)
-
+            progress = None
+
+        def ingest(batch: list[DataConcepts], response_data: dict) -> None:
+            resources.extend(self._ingest_batch_response(batch,
+                                                         response_data,
+                                                         result_index=result_index,
+                                                         dry_run=dry_run))
+            if journal is not None:
+                journal.record(batch)
+            if cache is not None:
+                cache.record(batch)
+            if progress is not None:
+                progress.update(len(batch))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in groups:
+                if batch_sizer is not None and not dry_run:
+                    self._submit_adaptively(level[0],
+                                            batch_sizer=batch_sizer,
+                                            executor=executor,
+                                            max_workers=max_workers,
+                                            params=params,
+                                            ingest=ingest)
+                    continue
+                batches = iter(level)
+                in_flight = deque()
+                failure = None
+                while True:
+                    # At most max_workers batches are queued, and none once one has failed
+                    while failure is None and len(in_flight) < max_workers \
+                            and (batch := next(batches, None)) is not None:
+                        # Each payload is only built once its batch is about to be sent
+                        objects = [registration_payload(model) for model in batch]
+                        nbytes = None if batch_sizer is None else \
+                            sum(len(json.dumps(obj)) for obj in objects)
+                        in_flight.append((batch, nbytes,
+                                          executor.submit(self._put_batch, objects,
+                                                          params=params)))
+                    if not in_flight:
+                        break
+                    # Responses are processed in batch order, so results match a sequential
+                    # run.  Every batch that was written is ingested before a failure is
+                    # raised, so a retry doesn't register it again.
+                    batch, nbytes, future = in_flight.popleft()
+                    if future.cancelled():
+                        continue
+                    try:
+                        response_data, seconds = future.result()
+                    except Exception as e:
+                        if failure is None:
+                            failure = e
+                            for *_, waiting in in_flight:
+                                waiting.cancel()  # Unless it has already started
+                        continue
+                    if batch_sizer is not None:
+                        batch_sizer.history.append(
+                            BatchRecord(count=len(batch), nbytes=nbytes, seconds=seconds))
+                    ingest(batch, response_data)
+                if failure is not None:
+                    raise failure
+
+        if progress is not None:
+            progress.close()
         if dry_run:  # No-op if not dry-run
             recursive_foreach(list(models) + list(resources),
                               lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
         return resources
 
+    def register_stream(self,
+                        models: Iterable[DataConcepts],
+                        *,
+                        batch_size: int = BATCH_SIZE,
+                        status_bar: bool = False) -> Iterator[DataConcepts]:
+        """
+        Register GEMD objects from an iterable in rolling batches, yielding the results.
+
+        Unlike `register_all`, the objects are neither collected, sorted nor crawled for nested
+        objects, so only `batch_size` objects are held at a time and `models` may be a generator
+        over arbitrarily many objects.  In exchange, the objects must already be in load order:
+        every object that an object references must either already be on the platform, or
+        appear earlier in `models` (templates, then specs, then runs, with each process before
+        the materials and ingredients that reference it).
+
+        Objects without a Citrine ID are assigned one as they are consumed, and the local objects
+        are updated with the uids & _citr_auto:: tags returned from the server.
+
+        Objects are registered as the results are consumed: nothing is written until iteration
+        begins, and stopping early leaves the remaining objects unregistered.  Batches are not
+        self-consistent, so there is no dry run; use `register_all` to validate objects.
+
+        Parameters
+        ----------
+        models: Iterable[DataConcepts]
+            The data model objects to register, in load order. Can be different types.
+
+        batch_size: int
+            The number of objects to send in each request.  Default: 50
+
+        status_bar: bool
+            Whether to display a status bar using the tqdm module to track progress in
+            registration. Requires installing the optional tqdm module. Default: false
+
+        Yields
+        ------
+        DataConcepts
+            The registered version of each object, batch by batch.
+
+        """
+        if self.dataset_id is None:
+            raise RuntimeError("Must specify a dataset in order to register a data model object.")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive; got {batch_size}.")
+        return self._stream_batches(iter(models), batch_size=batch_size, status_bar=status_bar)
+
+    def _stream_batches(self,
+                        models: Iterator[DataConcepts],
+                        *,
+                        batch_size: int,
+                        status_bar: bool) -> Iterator[DataConcepts]:
+        """Register each batch of `models` in turn, yielding the registered objects."""
+        path = self._get_path() + '/batch'
+        progress = tqdm(leave=False, desc="Registering GEMDs") if status_bar else None
+        try:
+            while batch := list(islice(models, batch_size)):
+                for model in batch:
+                    if CITRINE_SCOPE not in model.uids:
+                        model.add_uid(CITRINE_SCOPE, str(uuid4()))
+                objects = [registration_payload(model) for model in batch]
+                response_data = self.session.put_resource(path,
+                                                          json={'objects': objects},
+                                                          params={'dry_run': False})
+                # Only this batch is indexed, so references to earlier batches remain links
+                yield from self._ingest_batch_response(batch,
+                                                       response_data,
+                                                       result_index=dict(),
+                                                       dry_run=False)
+                if progress is not None:
+                    progress.update(len(batch))
+        finally:
+            if progress is not None:
+                progress.close()
+
+    @staticmethod
+    def _registration_payload(model: DataConcepts) -> tuple[dict, int]:
+        """Serialize an object for registration, returning the payload and its size in bytes."""
+        payload = registration_payload(model)
+        return payload, len(json.dumps(payload))
+
+    def _put_batch(self, objects: list[dict], *, params: dict) -> tuple[dict, float]:
+        """Submit a serialized batch, returning the response and how long it took."""
+        start = perf_counter()
+        response_data = self.session.put_resource(
+            self._get_path() + '/batch',
+            json={'objects': objects},
+            params=params
+        )
+        return response_data, perf_counter() - start
+
+    def _submit_adaptively(self,
+                           group: list[DataConcepts],
+                           *,
+                           batch_sizer: BatchSizer,
+                           executor: ThreadPoolExecutor,
+                           max_workers: int,
+                           params: dict,
+                           ingest: Callable[[list[DataConcepts], dict], None]) -> None:
+        """
+        Register a group of mutually independent objects in batches chosen by `batch_sizer`.
+
+        Up to `max_workers` batches are carved off and submitted at a time.  A batch that is
+        rejected as too large (413) or that keeps timing out (504) is split by shrinking the
+        batch size and resubmitted; a single object that is rejected raises the error.  Any
+        error is raised once the batches submitted alongside it have finished and those that
+        succeeded have been ingested.
+        """
+        pending = deque([model, None] for model in group)
+
+        def carve() -> list[list]:
+            batch = list()
+            nbytes = 0
+            while pending:
+                if pending[0][1] is None:
+                    pending[0][1] = self._registration_payload(pending[0][0])
+                size = pending[0][1][1]
+                if batch and not batch_sizer.fits(len(batch) + 1, nbytes + size):
+                    break
+                batch.append(pending.popleft())
+                nbytes += size
+            return batch
+
+        while pending:
+            batches = list()
+            while pending and len(batches) < max_workers:
+                batches.append(carve())
+            futures = [executor.submit(self._put_batch, [obj for _, (obj, _) in batch],
+                                       params=params)
+                       for batch in batches]
+            rejected = list()
+            failure = None
+            for batch, future in zip(batches, futures):
+                count = len(batch)
+                nbytes = sum(size for _, (_, size) in batch)
+                try:
+                    response_data, seconds = future.result()
+                except (PayloadTooLarge, RetryError) as e:
+                    if count == 1:
+                        failure = failure or e
+                        continue
+                    batch_sizer.record(count=count, nbytes=nbytes, seconds=0.0, succeeded=False)
+                    rejected.extend(batch)
+                    continue
+                except Exception as e:
+                    failure = failure or e
+                    continue
+                batch_sizer.record(count=count, nbytes=nbytes, seconds=seconds)
+                ingest([model for model, _ in batch], response_data)
+            if failure is not None:
+                raise failure
+            pending.extendleft(reversed(rejected))
+
+    def _ingest_batch_response(self,
+                               batch: list[DataConcepts],
+                               response_data: dict,
+                               *,
+                               result_index: dict,
+                               dry_run: bool) -> list[DataConcepts]:
+        """Build the registered objects in a batch response and update the local objects."""
+        registered = [self.build(obj) for obj in response_data['objects']]
+        result_index.update(make_index(registered))
+        substitute_objects(registered, result_index, inplace=True)
+
+        if not dry_run:
+            # Platform may add a CITRINE_SCOPE uid and citr_auto tags; update locals
+            for obj in batch:
+                result = result_index[obj.to_link()]
+                obj.uids.update({k: v for k, v in result.uids.items()})
+                if result.tags is not None:
+                    obj.tags = list(result.tags)
+        else:
+            # Remove of the tags/uids the platform spuriously added
+            # this might leave objects with just the temp ids, which we want to strip later
+            for obj in batch:
+                result = result_index[obj.to_link()]
+                if CITRINE_SCOPE not in obj.uids:
+                    citr_id = result.uids.pop(CITRINE_SCOPE, None)
+                    result_index.pop(LinkByUID(scope=CITRINE_SCOPE, id=citr_id), None)
+                if result.tags is not None:
+                    todo = [tag for tag in result.tags
+                            if re.match(f"^{CITRINE_TAG_PREFIX}::", tag)]
+                    for tag in todo:  # Covering this block would require dark art
+                        if tag not in obj.tags:
+                            result.tags.remove(tag)
+
+        return registered
+
     def batch_delete(
             self,
             id_list: list[LinkByUID | UUID | str | BaseEntity],
             *,
             timeout: float = 2 * 60,
-            polling_delay: float = 1.0
+            polling_delay: float | None = None
     ) -> list[tuple[LinkByUID, ApiError]]:
         """
         Remove a set of GEMD objects.
@@ -1,5 +1,6 @@
 import json
 from collections.abc import Iterable
+from concurrent.futures import Future
 from logging import getLogger
 from typing import Any
 
@@ -13,7 +14,8 @@ from citrine._serialization.properties import UUID
 from citrine._session import Session
 from citrine._utils.functions import format_escaped_url, rewrite_s3_links_locally, \
     write_file_locally
-from citrine.jobs.job import JobSubmissionResponse, _poll_for_job_completion
+from citrine.jobs.job import (JobStatusResponse, JobSubmissionResponse, _job_future,
+                              _poll_for_job_completion)
 from citrine.resources.table_config import TableConfig, TableConfigCollection
 
 logger = getLogger(__name__)
@@ -254,7 +256,10 @@ class GemTableCollection(Collection[GemTable]):
             team_id=self.team_id,
             job=job,
             timeout=timeout)
+        return self._get_built_table(status)
 
+    def _get_built_table(self, status: JobStatusResponse) -> GemTable:
+        """Get the table built by a finished build job, logging any warnings from its build."""
         table_id = status.output['display_table_id']
         table_version = status.output['display_table_version']
         warning_blob = status.output.get('table_warnings')
@@ -296,6 +301,37 @@ class GemTableCollection(Collection[GemTable]):
         job = self.initiate_build(config, version=version)
         return self.get_by_build_job(job, timeout=timeout)
 
+    def build_from_config_future(self, config: TableConfig | str | UUID, *,
+                                 version: str | int = None,
+                                 timeout: float = 15 * 60) -> "Future[GemTable]":
+        """
+        Starts building a table from a table config, returning a future of the table.
+
+        The build job is submitted right away, and then waited for in the background, so that
+        many tables can be built at once.  The future's `result()` waits for the table, and
+        raises a JobFailureError if the build fails.
+
+        Parameters
+        ----------
+        config:
+            The persisted table config from which to build a table (or its ID).
+        version
+            The version of the table config; only necessary when config is a uid.
+        timeout
+            Amount of time to wait on build job (in seconds) before giving up. Defaults
+            to 15 minutes. Note that this number has no effect on the build job itself,
+            which can also time out server-side.
+
+        Returns
+        -------
+        Future[GemTable]
+            A future of the new table built from the supplied config.
+
+        """
+        job = self.initiate_build(config, version=version)
+        return _job_future(self.session, job, team_id=self.team_id, timeout=timeout,
+                           then=self._get_built_table)
+
     def build(self, data: dict) -> GemTable:
         """Build an individual Table from a dictionary."""
         table = GemTable.build(data)
@@ -1,4 +1,6 @@
-from collections.abc import Collection as TypingCollection, Iterator, Iterable
+from collections.abc import Collection as TypingCollection, Generator, Iterator, Iterable
+from concurrent.futures import Future
+from functools import partial
 from uuid import UUID
 
 from gemd.enumeration.base_enumeration import BaseEnumeration
@@ -8,7 +10,9 @@ from citrine._rest.resource import Resource
 from citrine._serialization import properties
 from citrine._session import Session
 from citrine.exceptions import CitrineException, BadRequest
-from citrine.jobs.job import JobSubmissionResponse, JobFailureError, _poll_for_job_completion
+from citrine.jobs.job import (JobStatusResponse, JobSubmissionResponse, JobFailureError,
+                              _job_check, _job_id, _job_timeout_error, _poll_for_job_completion)
+from citrine.jobs.polling import background_poller
 from citrine.resources.api_error import ApiError, ValidationError
 from citrine.resources.file_link import FileLink
 
@@ -174,6 +178,18 @@ class IngestionStatus(Resource['IngestionStatus']):
         return cls(uid=exception.uid, errors=exception.errors)
 
 
+def _awaited_jobs(job: JobSubmissionResponse | UUID | str
+                  ) -> Generator[UUID | str, JobStatusResponse, None]:
+    """
+    Yield each job that an ingestion's outcome waits on, being sent the status each ends with.
+
+    That is the ingestion job itself, then the table build it started, if there is one.
+    """
+    job_status = yield _job_id(job)
+    if job_status.output is not None and "table_build_job_id" in job_status.output:
+        yield job_status.output["table_build_job_id"]
+
+
 class Ingestion(Resource['Ingestion']):
     """
     [ALPHA] A job that uploads new information to the platform.
@@ -248,6 +264,82 @@ class Ingestion(Resource['Ingestion']):
 
         return status
 
+    def build_objects_future(self,
+                             *,
+                             build_table: bool = False,
+                             project: "Project | UUID | str | None" = None,  # noqa: F821
+                             delete_dataset_contents: bool = False,
+                             delete_templates: bool = True,
+                             timeout: float | None = None
+                             ) -> "Future[IngestionStatus]":
+        """
+        [ALPHA] Start a complete ingestion operation, returning a future of its outcome.
+
+        This initiates the same operation as `build_objects`, and then waits for it (and any
+        table build) in the background, so that many ingestions can be run at once.
+
+        Parameters
+        ----------
+        build_table: bool
+            Whether to build a table immediately after ingestion.  Default : False
+        project: Project | UUID | str | None
+            Which project to use for table build if build_table is True.
+        delete_dataset_contents: bool
+            Whether to delete objects prior to generating new gemd objects.  Default: False.
+        delete_templates: bool
+            Whether to delete all objects and templates (as opposed to not deleting
+            templates) when `delete_dataset_contents` is True.  Default: True
+        timeout: float | None
+            Amount of time to wait on the whole operation (in seconds) before giving up.
+            Defaults to 2 minutes, or 4 when building a table.  Note that this number has no
+            effect on the underlying jobs themselves, which can also time out server-side.
+
+        Returns
+        ----------
+        Future[IngestionStatus]
+            A future whose `result()` waits for the outcome of the ingestion, and raises an
+            IngestionException if it failed and `raise_errors` is set
+
+        """
+        future = Future()
+        try:
+            job = self.build_objects_async(build_table=build_table,
+                                           project=project,
+                                           delete_dataset_contents=delete_dataset_contents,
+                                           delete_templates=delete_templates)
+        except IngestionException as e:
+            if self.raise_errors:
+                raise e
+            future.set_result(IngestionStatus.from_exception(e))
+            return future
+
+        if timeout is None:
+            timeout = 4 * 60 if build_table else 2 * 60
+        jobs = _awaited_jobs(job)
+        job_ids = [next(jobs)]
+        job_check = _job_check(self.session, job_ids[-1], team_id=self.team_id,
+                               raise_errors=False)  # JobFailureError doesn't contain the error
+
+        def check() -> tuple[bool, IngestionStatus | None]:
+            nonlocal job_check
+            done, job_status = job_check()
+            if not done:
+                return False, None
+            try:
+                job_ids.append(jobs.send(job_status))
+            except StopIteration:
+                status = self.status()
+                if self.raise_errors and not status.success:
+                    raise IngestionException.from_status(status)
+                return True, status
+            job_check = _job_check(self.session, job_ids[-1], team_id=self.team_id,
+                                   raise_errors=False)
+            return False, None
+
+        return background_poller().submit(
+            check, timeout=timeout, name='Ingestion',
+            on_timeout=partial(_job_timeout_error, job_ids, timeout))
+
     def build_objects_async(self,
                             *,
                             build_table: bool = False,
@@ -342,21 +434,20 @@ class Ingestion(Resource['Ingestion']):
         if polling_delay is not None:
             kwargs["polling_delay"] = polling_delay
 
-        build_job_status = _poll_for_job_completion(
-            session=self.session,
-            team_id=self.team_id,
-            job=job,
-            raise_errors=False,  # JobFailureError doesn't contain the error
-            **kwargs
-        )
-        if build_job_status.output is not None and "table_build_job_id" in build_job_status.output:
-            _poll_for_job_completion(
+        jobs = _awaited_jobs(job)
+        job_id = next(jobs)
+        while True:
+            job_status = _poll_for_job_completion(
                 session=self.session,
                 team_id=self.team_id,
-                job=build_job_status.output["table_build_job_id"],
+                job=job_id,
                 raise_errors=False,  # JobFailureError doesn't contain the error
                 **kwargs
             )
+            try:
+                job_id = jobs.send(job_status)
+            except StopIteration:
+                break
         return self.status()
 
     def status(self) -> IngestionStatus:
@@ -395,6 +486,19 @@ class FailedIngestion(Ingestion):
         """[ALPHA] Satisfy the required interface for a failed ingestion."""
         return self.status()
 
+    def build_objects_future(self,
+                             *,
+                             build_table: bool = False,
+                             project: "Project | UUID | str | None" = None,  # noqa: F821
+                             delete_dataset_contents: bool = False,
+                             delete_templates: bool = True,
+                             timeout: float | None = None
+                             ) -> "Future[IngestionStatus]":
+        """[ALPHA] Satisfy the required interface for a failed ingestion."""
+        future = Future()
+        future.set_result(self.status())
+        return future
+
     def build_objects_async(self,
                             *,
                             build_table: bool = False,
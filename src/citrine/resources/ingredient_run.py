@@ -116,7 +116,10 @@ class IngredientRunCollection(ObjectRunCollection[IngredientRun]):
         return IngredientRun
 
     def list_by_spec(self,
-                     uid: UUID | str | LinkByUID | GEMDIngredientSpec
+                     uid: UUID | str | LinkByUID | GEMDIngredientSpec,
+                     *,
+                     max_workers: int | None = None,
+                     preserve_order: bool = False
                      ) -> Iterator[IngredientRun]:
         """
         Get the ingredient runs using the specified ingredient spec.
@@ -125,6 +128,10 @@ class IngredientRunCollection(ObjectRunCollection[IngredientRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDIngredientSpec
             A representation of the ingredient spec whose ingredient run usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -132,10 +139,14 @@ class IngredientRunCollection(ObjectRunCollection[IngredientRun]):
             The ingredient runs using the specified ingredient spec.
 
         """
-        return self._get_relation(relation='ingredient-specs', uid=uid)
+        return self._get_relation(relation='ingredient-specs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
 
     def list_by_process(self,
-                        uid: UUID | str | LinkByUID | GEMDProcessRun
+                        uid: UUID | str | LinkByUID | GEMDProcessRun,
+                        *,
+                        max_workers: int | None = None,
+                        preserve_order: bool = False
                         ) -> Iterator[IngredientRun]:
         """
         Get ingredients to a process.
@@ -144,6 +155,10 @@ class IngredientRunCollection(ObjectRunCollection[IngredientRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDProcessRun
             A representation of the process whose ingredients are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -151,10 +166,14 @@ class IngredientRunCollection(ObjectRunCollection[IngredientRun]):
             The ingredients to the specified process.
 
         """
-        return self._get_relation(relation='process-runs', uid=uid)
+        return self._get_relation(relation='process-runs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
 
     def list_by_material(self,
-                         uid: UUID | str | LinkByUID | GEMDMaterialRun
+                         uid: UUID | str | LinkByUID | GEMDMaterialRun,
+                         *,
+                         max_workers: int | None = None,
+                         preserve_order: bool = False
                          ) -> Iterator[IngredientRun]:
         """
         Get ingredients using the specified material.
@@ -163,6 +182,10 @@ class IngredientRunCollection(ObjectRunCollection[IngredientRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDMaterialRun
             A representation of the material whose ingredient run usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -170,4 +193,5 @@ class IngredientRunCollection(ObjectRunCollection[IngredientRun]):
             The ingredients using the specified material
 
         """
-        return self._get_relation(relation='material-runs', uid=uid)
+        return self._get_relation(relation='material-runs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
@@ -114,7 +114,10 @@ class IngredientSpecCollection(ObjectSpecCollection[IngredientSpec]):
         return IngredientSpec
 
     def list_by_process(self,
-                        uid: UUID | str | LinkByUID | GEMDProcessSpec
+                        uid: UUID | str | LinkByUID | GEMDProcessSpec,
+                        *,
+                        max_workers: int | None = None,
+                        preserve_order: bool = False
                         ) -> Iterator[IngredientSpec]:
         """
         Get ingredients to a process.
@@ -123,6 +126,10 @@ class IngredientSpecCollection(ObjectSpecCollection[IngredientSpec]):
         ----------
         uid: UUID | str | LinkByUID | GEMDProcessSpec
             A representation of the process spec whose ingredients are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -130,10 +137,14 @@ class IngredientSpecCollection(ObjectSpecCollection[IngredientSpec]):
             The ingredients to the specified process.
 
         """
-        return self._get_relation(relation='process-specs', uid=uid)
+        return self._get_relation(relation='process-specs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
 
     def list_by_material(self,
-                         uid: UUID | str | LinkByUID | GEMDMaterialSpec
+                         uid: UUID | str | LinkByUID | GEMDMaterialSpec,
+                         *,
+                         max_workers: int | None = None,
+                         preserve_order: bool = False
                          ) -> Iterator[IngredientSpec]:
         """
         Get ingredients using the specified material.
@@ -142,6 +153,10 @@ class IngredientSpecCollection(ObjectSpecCollection[IngredientSpec]):
         ----------
         uid: UUID | str | LinkByUID | GEMDMaterialSpec
             A representation of the material spec whose ingredient usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -149,4 +164,5 @@ class IngredientSpecCollection(ObjectSpecCollection[IngredientSpec]):
             The ingredients using the specified material
 
         """
-        return self._get_relation(relation='material-specs', uid=uid)
+        return self._get_relation(relation='material-specs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
@@ -175,7 +175,10 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
         )
 
     def list_by_spec(self,
-                     uid: UUID | str | LinkByUID | GEMDMaterialSpec
+                     uid: UUID | str | LinkByUID | GEMDMaterialSpec,
+                     *,
+                     max_workers: int | None = None,
+                     preserve_order: bool = False
                      ) -> Iterator[MaterialRun]:
         """
         Get the material runs using the specified material spec.
@@ -184,6 +187,10 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDMaterialSpec
             A representation of the material spec whose material run usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -191,10 +198,14 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
             The material runs using the specified material spec.
 
         """
-        return self._get_relation('material-specs', uid=uid)
+        return self._get_relation('material-specs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
 
     def list_by_template(self,
-                         uid: UUID | str | LinkByUID | GEMDMaterialTemplate
+                         uid: UUID | str | LinkByUID | GEMDMaterialTemplate,
+                         *,
+                         max_workers: int | None = None,
+                         preserve_order: bool = False
                          ) -> Iterator[MaterialRun]:
         """
         Get the material runs using the specified material template.
@@ -203,6 +214,10 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDMaterialTemplate
             A representation of the material template whose material run usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -215,6 +230,10 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
             dataset_id=self.dataset_id,
             session=self.session
         )
-        specs = spec_collection.list_by_template(uid=_make_link_by_uid(uid))
-        return (run for runs in (self.list_by_spec(spec) for spec in specs)
+        specs = spec_collection.list_by_template(uid=_make_link_by_uid(uid),
+                                                 max_workers=max_workers,
+                                                 preserve_order=preserve_order)
+        return (run for runs in (self.list_by_spec(spec, max_workers=max_workers,
+                                                   preserve_order=preserve_order)
+                                 for spec in specs)
                 for run in runs)
@@ -96,7 +96,10 @@ class MaterialSpecCollection(ObjectSpecCollection[MaterialSpec]):
         return MaterialSpec
 
     def list_by_template(self,
-                         uid: UUID | str | LinkByUID | GEMDMaterialTemplate
+                         uid: UUID | str | LinkByUID | GEMDMaterialTemplate,
+                         *,
+                         max_workers: int | None = None,
+                         preserve_order: bool = False
                          ) -> Iterator[MaterialSpec]:
         """
         Get the material specs using the specified material template.
@@ -105,6 +108,10 @@ class MaterialSpecCollection(ObjectSpecCollection[MaterialSpec]):
         ----------
         uid: UUID | str | LinkByUID | GEMDMaterialTemplate
             A representation of the material template whose material spec usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -112,7 +119,8 @@ class MaterialSpecCollection(ObjectSpecCollection[MaterialSpec]):
             The material specs using the specified material template.
 
         """
-        return self._get_relation('material-templates', uid=uid)
+        return self._get_relation('material-templates', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
 
     def get_by_process(self,
                        uid: UUID | str | LinkByUID | GEMDProcessSpec
@@ -107,7 +107,10 @@ class MeasurementRunCollection(ObjectRunCollection[MeasurementRun]):
         return MeasurementRun
 
     def list_by_spec(self,
-                     uid: UUID | str | LinkByUID | GEMDMeasurementSpec
+                     uid: UUID | str | LinkByUID | GEMDMeasurementSpec,
+                     *,
+                     max_workers: int | None = None,
+                     preserve_order: bool = False
                      ) -> Iterator[MeasurementRun]:
         """
         Get the measurement runs using the specified measurement spec.
@@ -116,6 +119,10 @@ class MeasurementRunCollection(ObjectRunCollection[MeasurementRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDMeasurementSpec
             A representation of the measurement spec whose measurement run usages are to be located
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -123,10 +130,14 @@ class MeasurementRunCollection(ObjectRunCollection[MeasurementRun]):
             The measurement runs using the specified measurement spec.
 
         """
-        return self._get_relation('measurement-specs', uid=uid)
+        return self._get_relation('measurement-specs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
 
     def list_by_material(self,
-                         uid: UUID | str | LinkByUID | GEMDMaterialRun
+                         uid: UUID | str | LinkByUID | GEMDMaterialRun,
+                         *,
+                         max_workers: int | None = None,
+                         preserve_order: bool = False
                          ) -> Iterator[MeasurementRun]:
         """
         Get measurements of the specified material.
@@ -135,6 +146,10 @@ class MeasurementRunCollection(ObjectRunCollection[MeasurementRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDMaterialRun
             A representation of the material whose measurements are to be queried.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -142,4 +157,5 @@ class MeasurementRunCollection(ObjectRunCollection[MeasurementRun]):
             The measurements of the specified material
 
         """
-        return self._get_relation(relation='material-runs', uid=uid)
+        return self._get_relation(relation='material-runs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
@@ -91,7 +91,10 @@ class MeasurementSpecCollection(ObjectSpecCollection[MeasurementSpec]):
         return MeasurementSpec
 
     def list_by_template(self,
-                         uid: UUID | str | LinkByUID | GEMDMeasurementTemplate
+                         uid: UUID | str | LinkByUID | GEMDMeasurementTemplate,
+                         *,
+                         max_workers: int | None = None,
+                         preserve_order: bool = False
                          ) -> Iterator[MeasurementSpec]:
         """
         Get the measurement specs using the specified measurement template.
@@ -101,6 +104,10 @@ class MeasurementSpecCollection(ObjectSpecCollection[MeasurementSpec]):
         uid: UUID | str | LinkByUID | GEMDMeasurementTemplate
             A representation of of the measurement template whose measurement spec usages are
             to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -108,4 +115,5 @@ class MeasurementSpecCollection(ObjectSpecCollection[MeasurementSpec]):
             The measurement specs using the specified measurement template.
 
         """
-        return self._get_relation('measurement-templates', uid=uid)
+        return self._get_relation('measurement-templates', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
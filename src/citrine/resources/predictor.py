@@ -1,5 +1,6 @@
 """Resources that represent collections of predictors."""
 from collections.abc import Iterable
+from concurrent.futures import Future
 from functools import partial
 from typing import Any
 from uuid import UUID
@@ -14,6 +15,8 @@ from citrine._session import Session
 from citrine.informatics.data_sources import DataSource
 from citrine.informatics.design_candidate import HierarchicalDesignMaterial
 from citrine.informatics.predictors import GraphPredictor
+from citrine.jobs.polling import asynchronous_object_check, asynchronous_object_timeout, \
+    background_poller
 from citrine.resources.status_detail import StatusDetail
 
 
@@ -283,6 +286,25 @@ class PredictorCollection(Collection[GraphPredictor]):
         else:
             return self.train(created_predictor.uid)
 
+    def register_future(self, predictor: GraphPredictor, *,
+                        timeout: float = 1800.0) -> "Future[GraphPredictor]":
+        """Register and train a Predictor, returning a future of the trained Predictor.
+
+        The predictor is registered and its training started right away, and then it is
+        waited for in the background, so that many predictors can be trained at once.  The
+        future's `result()` waits until training has finished, successfully or not, and is the
+        predictor as it is then; check its status to see whether training succeeded.  If
+        training hasn't finished within `timeout` seconds, it raises a ConditionTimeoutError.
+        """
+        trained = self.register(predictor, train=True)
+        if trained.failed():
+            future = Future()
+            future.set_result(trained)
+            return future
+        return background_poller().submit(
+            asynchronous_object_check(self, trained.uid), timeout=timeout, name='Predictor',
+            on_timeout=partial(asynchronous_object_timeout, trained.uid, timeout))
+
     def update(self, predictor: GraphPredictor, *, train: bool = True) -> GraphPredictor:
         """Update and optionally train a Predictor.
 
@@ -368,7 +390,8 @@ class PredictorCollection(Collection[GraphPredictor]):
         raise NotImplementedError("The restore() method is no longer supported. You most likely "
                                   "want restore_root(), or possibly restore_version().")
 
-    def _list_base(self, *, per_page: int = 100, archived: bool | None = None):
+    def _list_base(self, *, per_page: int = 100, archived: bool | None = None,
+                   lazy: bool = False):
         filters = {}
         if archived is not None:
             filters["archived"] = archived
@@ -377,20 +400,21 @@ class PredictorCollection(Collection[GraphPredictor]):
                           additional_params=filters,
                           version="v4")
         return self._paginator.paginate(page_fetcher=fetcher,
-                                        collection_builder=self._build_collection_elements,
+                                        collection_builder=partial(self._build_collection_elements,
+                                                                   lazy=lazy),
                                         per_page=per_page)
 
-    def list_all(self, *, per_page: int = 20) -> Iterable[GraphPredictor]:
+    def list_all(self, *, per_page: int = 20, lazy: bool = False) -> Iterable[GraphPredictor]:
         """List the most recent version of all predictors."""
-        return self._list_base(per_page=per_page)
+        return self._list_base(per_page=per_page, lazy=lazy)
 
-    def list(self, *, per_page: int = 20) -> Iterable[GraphPredictor]:
+    def list(self, *, per_page: int = 20, lazy: bool = False) -> Iterable[GraphPredictor]:
         """List the most recent version of all non-archived predictors."""
-        return self._list_base(per_page=per_page, archived=False)
+        return self._list_base(per_page=per_page, archived=False, lazy=lazy)
 
-    def list_archived(self, *, per_page: int = 20) -> Iterable[GraphPredictor]:
+    def list_archived(self, *, per_page: int = 20, lazy: bool = False) -> Iterable[GraphPredictor]:
         """List the most recent version of all archived predictors."""
-        return self._list_base(per_page=per_page, archived=True)
+        return self._list_base(per_page=per_page, archived=True, lazy=lazy)
 
     def list_versions(self,
                       uid: UUID | str = None,
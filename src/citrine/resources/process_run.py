@@ -90,7 +90,10 @@ class ProcessRunCollection(ObjectRunCollection[ProcessRun]):
         return ProcessRun
 
     def list_by_spec(self,
-                     uid: UUID | str | LinkByUID | GEMDProcessSpec
+                     uid: UUID | str | LinkByUID | GEMDProcessSpec,
+                     *,
+                     max_workers: int | None = None,
+                     preserve_order: bool = False
                      ) -> Iterator[ProcessRun]:
         """
         Get the process runs using the specified process spec.
@@ -99,6 +102,10 @@ class ProcessRunCollection(ObjectRunCollection[ProcessRun]):
         ----------
         uid: UUID | str | LinkByUID | GEMDProcessSpec
             A representation of the process spec whose process run usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -106,4 +113,5 @@ class ProcessRunCollection(ObjectRunCollection[ProcessRun]):
             The process runs using the specified process spec.
 
         """
-        return self._get_relation('process-specs', uid=uid)
+        return self._get_relation('process-specs', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
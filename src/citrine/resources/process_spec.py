@@ -91,7 +91,10 @@ class ProcessSpecCollection(ObjectSpecCollection[ProcessSpec]):
         return ProcessSpec
 
     def list_by_template(self,
-                         uid: UUID | str | LinkByUID | GEMDProcessTemplate
+                         uid: UUID | str | LinkByUID | GEMDProcessTemplate,
+                         *,
+                         max_workers: int | None = None,
+                         preserve_order: bool = False
                          ) -> Iterator[ProcessSpec]:
         """
         Get the process specs using the specified process template.
@@ -100,6 +103,10 @@ class ProcessSpecCollection(ObjectSpecCollection[ProcessSpec]):
         ----------
         uid: UUID | str | LinkByUID | GEMDProcessTemplate
             A representation of the process template whose process spec usages are to be located.
+        max_workers: int, optional
+            How many readable datasets to search at a time, as for `list`.  Default: None
+        preserve_order: bool
+            Keep each dataset's results together, as for `list`.  Default: False
 
         Returns
         -------
@@ -107,4 +114,5 @@ class ProcessSpecCollection(ObjectSpecCollection[ProcessSpec]):
             The process specs using the specified process template
 
         """
-        return self._get_relation('process-templates', uid=uid)
+        return self._get_relation('process-templates', uid=uid,
+                                  max_workers=max_workers, preserve_order=preserve_order)
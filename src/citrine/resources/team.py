@@ -516,7 +516,7 @@ class Team(Resource['Team']):
                           id_list: list[LinkByUID | UUID | str | BaseEntity],
                           *,
                           timeout: float = 2 * 60,
-                          polling_delay: float = 1.0) -> list[tuple[LinkByUID, ApiError]]:
+                          polling_delay: float | None = None) -> list[tuple[LinkByUID, ApiError]]:
         """
         Remove a set of GEMD objects.
 
@@ -539,8 +539,9 @@ class Team(Resource['Team']):
             Amount of time to wait on the job (in seconds) before giving up. Defaults
             to 2 minutes. Note that this number has no effect on the underlying job
             itself, which can also time out server-side.
-        polling_delay: float
-            How long to delay between each polling retry attempt (in seconds).
+        polling_delay: float | None
+            A fixed delay between each polling retry attempt (in seconds).  By default,
+            polling backs off, starting fast.
 
         Returns
         -------
@@ -0,0 +1,124 @@
+"""Tests of building many objects at once."""
+import pytest
+
+from citrine._serialization import properties
+from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
+from citrine._serialization.serializable import Serializable
+from citrine._serialization.trusted import trusted_build
+from citrine.resources.material_run import MaterialRun
+from tests.utils.factories import MaterialRunDataFactory
+
+
+class Leaf(Serializable['Leaf']):
+
+    name = properties.String('name')
+    size = properties.Optional(properties.Integer, 'size')
+
+
+class Renamed(Leaf):
+    """A class that modifies its data before it is built."""
+
+    @classmethod
+    def _pre_build(cls, data: dict) -> dict:
+        return {**data, 'name': data['name'].upper()}
+
+
+class Empty(Serializable['Empty']):
+    """A class with no fields."""
+
+
+class Animal(PolymorphicSerializable['Animal']):
+
+    @classmethod
+    def get_type(cls, data):
+        return cls._subtypes[data['type']]
+
+
+class Cat(Serializable['Cat'], Animal):
+
+    lives = properties.Integer('lives')
+    typ = properties.String('type', default='cat', deserializable=False)
+
+
+class Dog(Serializable['Dog'], Animal):
+
+    name = properties.String('name')
+    typ = properties.String('type', default='dog', deserializable=False)
+
+    @classmethod
+    def build(cls, data: dict) -> 'Dog':
+        dog = super().build(data)
+        dog.name = dog.name.title()
+        return dog
+
+
+class Pet(Animal):
+    """A base that builds its subtypes itself."""
+
+    @classmethod
+    def build(cls, data: dict):
+        return Cat.build(data)
+
+
+def test_build_many_serializable(monkeypatch):
+    """Building many objects should give the same objects as building each one."""
+    data = [{'name': 'a', 'size': 1}, {'name': 'b'}]
+    built = Leaf.build_many(data)
+    assert [vars(leaf) for leaf in built] == [vars(Leaf.build(item)) for item in data]
+    assert Leaf.build_many([]) == []
+    assert Leaf.build_many([built[0]])[0] is built[0]
+    assert [leaf.name for leaf in Renamed.build_many(iter(data))] == ['A', 'B']
+    with pytest.raises(AttributeError, match="has no fields"):
+        Empty.build_many([{}])
+    with trusted_build():
+        assert Leaf.build_many([{'name': 7}])[0].name == 7
+    with pytest.raises(ValueError, match="missing a required field: name"):
+        Leaf.build_many([{'name': 'a'}, {}])
+    with pytest.raises(ValueError, match="is not one of valid types"):
+        Leaf.build_many(['a'])
+
+    monkeypatch.setattr(properties, 'compiled_builder', lambda klass, trusted: None)
+    assert Leaf.build_many(data)[1].name == 'b'
+
+
+def test_build_many_polymorphic():
+    """Each payload should be built as its own type, including by types that override build."""
+    animals = Animal.build_many([{'type': 'cat', 'lives': 9}, {'type': 'dog', 'name': 'rex'},
+                                 {'type': 'cat', 'lives': 3}])
+    assert [type(animal) for animal in animals] == [Cat, Dog, Cat]
+    assert (animals[0].lives, animals[1].name, animals[2].lives) == (9, 'Rex', 3)
+    assert Dog.build_many([{'name': 'fido'}])[0].name == 'Fido'
+    assert isinstance(Pet.build_many([{'type': 'dog', 'lives': 1}])[0], Cat)
+
+
+def test_build_many_gemd():
+    """GEMD objects should be built as by build, sharing their repeated values."""
+    data = [MaterialRunDataFactory(name=f"run {i}", sample_type='virtual') for i in range(3)]
+    built = MaterialRun.build_many(data)
+    assert [run.dump() for run in built] == [MaterialRun.build(item).dump() for item in data]
+    assert built[0].sample_type is built[2].sample_type
+
+    context = {'context': [data[0]], 'object': {'type': 'link_by_uid', 'scope': 'id',
+                                                'id': data[0]['uids']['id']}}
+    assert MaterialRun.build_many([context])[0].name == 'run 0'
+    with pytest.raises(ValueError, match="MaterialRun passed a process_run dictionary"):
+        MaterialRun.build_many([{**data[0], 'type': 'process_run'}])
+
+
+def test_collection_builds_pages_with_build_many(monkeypatch):
+    """Paginated collections should build each page with their build_many."""
+    from uuid import uuid4
+
+    from citrine.resources.material_run import MaterialRunCollection
+    from tests.utils.session import FakeSession
+
+    calls = []
+    build_many = MaterialRun.build_many.__func__
+    monkeypatch.setattr(MaterialRun, 'build_many',
+                        classmethod(lambda cls, data: calls.append(data) or build_many(cls, data)))
+
+    collection = MaterialRunCollection(team_id=uuid4(), dataset_id=uuid4(), session=FakeSession())
+    page = [MaterialRunDataFactory(name=f"run {i}") for i in range(3)]
+    built = collection._build_collection_elements(page)
+    assert [run.name for run in built] == ['run 0', 'run 1', 'run 2']
+    assert calls == [page]
@@ -0,0 +1,133 @@
+"""Tests of the generated build and dump functions."""
+import pytest
+
+from citrine._serialization import properties
+from citrine._serialization.compiled import compiled_builder, compiled_dumper
+from citrine._serialization.serializable import Serializable
+
+
+class Nested(Serializable['Nested']):
+    """A class with nested paths, defaults and fields that are only read or only written."""
+
+    name = properties.String('name')
+    label = properties.Optional(properties.String, 'config.label')
+    size = properties.Integer('config.size', default=3)
+    tags = properties.List(properties.String, 'tags', default=[], deserializable=False)
+    secret = properties.String('secret', serializable=False, default='hidden')
+
+
+class Initialized(Serializable['Initialized']):
+    """A class that is built by calling its constructor."""
+
+    name = properties.String('name', use_init=True)
+    notes = properties.Optional(properties.String, 'notes')
+
+    def __init__(self, name):
+        self.name = name
+        self.initialized = True
+
+
+class Base(Serializable['Base']):
+
+    name = properties.String('name')
+
+    @property
+    def label(self):
+        return self._label
+
+    @label.setter
+    def label(self, value):
+        self._label = value.upper()
+
+
+class Derived(Base):
+    """A class with a field handled by its parent's accessors."""
+
+    label = properties.String('label', override=True)
+
+
+class Hidden(Nested):
+    """A class that replaces one of its parent's fields with a plain property."""
+
+    @property
+    def name(self):
+        return self.__dict__.get('_name')
+
+    @name.setter
+    def name(self, value):
+        self.__dict__['_name'] = value.lower()
+
+
+class Pathless(Serializable['Pathless']):
+
+    name = properties.String()
+
+
+def test_nested_round_trip():
+    """Generated functions should nest paths, apply defaults and skip one-way fields."""
+    obj = Nested.build({'name': 'a', 'config': {'label': 'b'}, 'tags': ['ignored']})
+    assert (obj.name, obj.label, obj.size, obj.tags, obj.secret) == ('a', 'b', 3, [], 'hidden')
+    assert obj.tags is not Nested.__dict__['tags'].default  # Copied, as by the setter
+    assert obj.dump() == {'name': 'a', 'config': {'label': 'b', 'size': 3}, 'tags': []}
+
+    obj = Nested.build({'name': 'a'})
+    assert (obj.label, obj.size) == (None, 3)
+    assert vars(obj) == vars(properties.Object(Nested)._deserialize_fields({'name': 'a'}))
+    assert compiled_builder(Nested) is compiled_builder(Nested)
+    assert compiled_dumper(Nested) is not None
+
+
+def test_missing_required_field():
+    """A missing required field should be reported the same way as by the descriptor path."""
+    with pytest.raises(ValueError, match="missing a required field: name"):
+        Nested.build({'config': {}})
+    with pytest.raises(ValueError, match="missing a required field: name"):
+        properties.Object(Nested)._deserialize_fields({'config': {}})
+
+
+def test_use_init():
+    """Classes marked use_init should be constructed, and bad signatures reported as before."""
+    obj = Initialized.build({'name': 'a', 'notes': 'b'})
+    assert (obj.name, obj.notes, obj.initialized) == ('a', 'b', True)
+    assert obj.dump() == {'name': 'a', 'notes': 'b'}
+
+    class Misnamed(Initialized):
+        def __init__(self, label):
+            pass
+
+    with pytest.raises(AttributeError, match="required arguments weren't"):
+        Misnamed.build({'name': 'a'})
+
+
+def test_descriptor_fallbacks():
+    """Fields that can't be stored directly should still go through their accessors."""
+    obj = Derived.build({'name': 'a', 'label': 'b'})
+    assert obj.label == 'B'
+    assert obj.dump() == {'name': 'a', 'label': 'B'}
+
+    obj = Hidden.build({'name': 'A'})
+    assert obj.name == 'a'
+    assert obj.dump()['name'] == 'a'
+
+
+def test_pathless_fields():
+    """Classes with fields that have no path should be left to the descriptor path."""
+    assert compiled_builder(Pathless) is None
+    assert compiled_dumper(Pathless) is None
+    with pytest.raises(AttributeError):
+        Pathless.build({'name': 'a'})
+    obj = Pathless.__new__(Pathless)
+    obj.name = 'a'
+    with pytest.raises(ValueError, match="No serialization path set"):
+        obj.dump()
+
+
+def test_matches_descriptor_path(monkeypatch):
+    """The generated functions should give the same results as looping over the fields."""
+    data = {'name': 'a', 'config': {'label': 'b'}}
+    generated = Nested.build(data)
+    monkeypatch.setattr(properties, 'compiled_builder', lambda klass, *args: None)
+    monkeypatch.setattr(properties, 'compiled_dumper', lambda klass, *args: None)
+    looped = Nested.build(data)
+    assert vars(looped) == vars(generated)
+    assert looped.dump() == generated.dump()
@@ -0,0 +1,108 @@
+"""Tests of sharing repeated links and strings among built objects."""
+import json
+from uuid import UUID
+
+from gemd.entity.attribute import Property
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.object import MaterialRun as GEMDMaterialRun, ProcessRun as GEMDProcessRun
+from gemd.entity.value import NominalReal
+
+from citrine._serialization import interning as interning_module
+from citrine._serialization.interning import intern_string, intern_values, interned, interning
+from citrine.resources.material_run import MaterialRunCollection
+from citrine.resources.measurement_run import MeasurementRun, MeasurementRunCollection
+from tests.utils.factories import MaterialRunDataFactory
+from tests.utils.session import FakeSession
+
+
+def copies(data):
+    """Copy a payload so that equal strings are distinct objects, as in a decoded response."""
+    return json.loads(json.dumps(data))
+
+
+def measurement_data(name: str) -> dict:
+    template = {'type': 'link_by_uid', 'scope': 'id', 'id': 'density-template'}
+    value = {'type': 'nominal_real', 'nominal': 1.0, 'units': 'g/cm^3'}
+    return copies({'type': 'measurement_run', 'name': name, 'uids': {'id': name},
+                   'tags': ['batch::1'],
+                   'material': {'type': 'link_by_uid', 'scope': 'id', 'id': 'material'},
+                   'properties': [{'type': 'property', 'name': 'density',
+                                   'template': template, 'value': value}]})
+
+
+def test_interning_scope():
+    """Contexts should share the active table, or use the one they are given."""
+    value = ''.join(['a', 'b'])
+    assert intern_string(value) is value
+    with interning() as table:
+        with interning() as inner:
+            assert inner is table
+        with interning({}) as other:
+            assert other is not table
+        first = intern_string(''.join(['a', 'b']))
+        assert intern_string(''.join(['a', 'b'])) is first
+    assert table == {'ab': 'ab'}
+
+
+def test_interning_size_limit(monkeypatch):
+    """Once a table is full, new values should be returned as they are."""
+    monkeypatch.setattr(interning_module, 'MAX_SIZE', 1)
+    with interning() as table:
+        intern_string('a')
+        value = ''.join(['b', 'c'])
+        assert intern_string(value) is value
+        assert intern_string(''.join(['a'])) == 'a'
+    assert list(table) == ['a']
+
+
+def test_intern_values():
+    """Links and strings held by gemd objects should be shared, including nested ones."""
+    process = GEMDProcessRun('mix', uids={'id': 'mix'})
+    material = GEMDMaterialRun('cake', process=process, tags=['a::b'])
+    prop = Property('density', value=NominalReal(1.0, 'g/cm^3'),
+                    template=LinkByUID('id', 'density-template'))
+    assert intern_values(prop) is prop
+    with interning():
+        link = intern_values(LinkByUID('id', 'density-template'))
+        assert intern_values(LinkByUID('id', 'density-template')) is link
+        assert intern_values(prop).template is link
+        other = intern_values(Property('density', value=NominalReal(2.0, 'g/cm^3'),
+                                       template=LinkByUID('id', 'density-template')))
+        assert other.template is link
+        assert other.value.units is prop.value.units
+        assert intern_values(material) is material  # Even though it refers to itself
+        assert intern_values(GEMDMaterialRun('cake', tags=['a::b'])).tags[0] is material.tags[0]
+
+
+def test_build_shares_links_and_strings():
+    """Objects built from one listing should share their repeated links, names and units."""
+    collection = MeasurementRunCollection(dataset_id=UUID(int=1), team_id=UUID(int=2),
+                                          session=FakeSession())
+    first, second = interned(collection.build(measurement_data(name)) for name in ('a', 'b'))
+    assert first.material is second.material
+    assert first.properties[0].template is second.properties[0].template
+    assert first.properties[0].name is second.properties[0].name
+    assert first.properties[0].value.units is second.properties[0].value.units
+    assert first.tags[0] is second.tags[0]
+
+    separate = MeasurementRun.build(measurement_data('c'))
+    assert separate.material is not first.material
+    assert separate.material == first.material
+    assert separate.dump() == MeasurementRun.build(measurement_data('c')).dump()
+
+
+def test_listing_shares_links():
+    """Every page of a listing should share one table."""
+    session = FakeSession()
+    runs = [MaterialRunDataFactory(name=f"run {i}", sample_type='experimental') for i in range(4)]
+    for run in runs:
+        run['spec'] = {'type': 'link_by_uid', 'scope': 'id', 'id': 'spec'}
+    session.set_responses({'contents': copies(runs[:2]), 'next': 'more'},
+                          {'contents': copies(runs[2:])})
+    collection = MaterialRunCollection(dataset_id=UUID(int=1), team_id=UUID(int=2),
+                                       session=session)
+    listed = list(collection.list(per_page=2))
+    assert len(listed) == 4
+    assert all(run.spec is listed[0].spec for run in listed)
+    assert all(run.sample_type is listed[0].sample_type for run in listed)
+    assert intern_string(''.join(['ex', 'perimental'])) is not listed[0].sample_type
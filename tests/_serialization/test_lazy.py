@@ -0,0 +1,61 @@
+"""Tests of deferred building of nested objects."""
+import pytest
+
+from citrine._serialization import properties
+from citrine._serialization.lazy import Deferred, lazy_build
+from citrine._serialization.serializable import Serializable
+
+
+class Leaf(Serializable['Leaf']):
+
+    name = properties.String('name')
+
+
+class Tree(Serializable['Tree']):
+
+    name = properties.String('name')
+    trunk = properties.Object(Leaf, 'trunk')
+    leaves = properties.List(properties.Object(Leaf), 'leaves', default=[])
+    tags = properties.List(properties.String, 'tags', default=[])
+
+
+DATA = {'name': 'oak', 'trunk': {'name': 'trunk'}, 'leaves': [{'name': 'a'}, {'name': 'b'}],
+        'tags': ['tall']}
+
+
+def test_lazy_build():
+    """Nested objects should be built on first read, and only once."""
+    with lazy_build():
+        tree = Tree.build(DATA)
+        missing = Tree.build({'name': 'elm', 'trunk': {'name': 'trunk'}})
+    stored = vars(tree)
+    assert isinstance(stored[Tree.__dict__['trunk']._key], Deferred)
+    assert isinstance(stored[Tree.__dict__['leaves']._key], Deferred)
+    assert stored[Tree.__dict__['tags']._key] == ['tall']  # Nothing to gain by deferring
+    assert missing.leaves == []  # Defaults are not deferred
+
+    assert tree.name == 'oak'
+    trunk = tree.trunk
+    assert isinstance(trunk, Leaf) and trunk.name == 'trunk'
+    assert tree.trunk is trunk
+    assert tree.dump() == Tree.build(DATA).dump()  # Dumping builds the rest
+
+
+def test_lazy_build_scope():
+    """Only objects built inside the context should be deferred."""
+    with lazy_build():
+        with lazy_build():
+            pass
+        inside = Tree.build(DATA)
+    outside = Tree.build(DATA)
+    assert isinstance(vars(inside)[Tree.__dict__['trunk']._key], Deferred)
+    assert isinstance(vars(outside)[Tree.__dict__['trunk']._key], Leaf)
+
+
+def test_lazy_build_errors():
+    """Invalid nested data should be reported when it is read."""
+    with lazy_build():
+        tree = Tree.build({**DATA, 'trunk': {'label': 'no name'}})
+    assert tree.name == 'oak'
+    with pytest.raises(ValueError, match="missing a required field: name"):
+        tree.trunk
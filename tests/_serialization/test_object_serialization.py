@@ -1,4 +1,5 @@
 import pytest
+from uuid import uuid4
 from typing import Any
 
 from citrine._serialization.serializable import Serializable
@@ -117,6 +118,40 @@ def test_override_read_only():
         obj.required = "1"
 
 
+def test_override_resolved_per_class():
+    """An inherited override property should defer to the accessors of each class's parent."""
+
+    class Lower:
+        @property
+        def label(self):
+            return self._label
+
+        @label.setter
+        def label(self, value):
+            self._label = value.lower()
+
+    class Upper:
+        @property
+        def label(self):
+            return self._label
+
+        @label.setter
+        def label(self, value):
+            self._label = value.upper()
+
+    class LowerLabel(Serializable['LowerLabel'], Lower):
+        label = String("label", override=True)
+
+    class UpperLabel(Serializable['UpperLabel'], Upper):
+        label = LowerLabel.__dict__['label']
+
+    for _ in range(2):  # The second pass uses the resolved accessors
+        lower, upper = LowerLabel(), UpperLabel()
+        lower.label, upper.label = "Label", "Label"
+        assert (lower.label, upper.label) == ("label", "LABEL")
+    assert set(LowerLabel.__dict__['label']._resolved) == {LowerLabel, UpperLabel}
+
+
 def test_init_props():
     """Test exceptions around use_init."""
 
@@ -148,3 +183,34 @@ def test_init_props():
 
     with pytest.raises(TypeError):
         GoodClass.build({"required": "magic_value", "optional": "value"})
+
+
+def test_stable_storage_keys():
+    """Values should be stored under names that are the same in every process."""
+    import pickle
+
+    class Named(Serializable['Named']):
+        label = String('label')
+        _Named__taken = None
+        taken = String('taken')
+
+    class Reused(Named):
+        alias = Named.__dict__['label']
+
+    obj = Named.build({'label': 'a', 'taken': 'b'})
+    assert Named.__dict__['label']._key == '_Named__label'
+    assert '_Named__label' in vars(obj)
+    assert Named.__dict__['taken']._key.startswith('__')  # The mangled name was in use
+    assert Reused.build({'label': 'c', 'taken': 'd'}).alias == 'c'
+
+    from citrine.informatics.descriptors import RealDescriptor
+    descriptor = RealDescriptor('x', lower_bound=0, upper_bound=1, units='')
+    assert all(not key.startswith('__') for key in vars(descriptor))
+    assert pickle.loads(pickle.dumps(descriptor)).dump() == descriptor.dump()
+
+    from citrine.informatics.design_candidate import DesignCandidateComment
+    comment = DesignCandidateComment.build({'message': 'hi', 'created': {'user': str(uuid4()),
+                                                                         'time': 1563533168000}})
+    assert all(not key.startswith('__') for key in vars(comment))
+    assert pickle.loads(pickle.dumps(comment)).dump() == comment.dump()
+    comment.note = 'Public classes still accept other attributes'
@@ -0,0 +1,48 @@
+"""Tests of the registry of polymorphic subtypes."""
+import pytest
+
+from citrine._serialization import properties
+from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
+from citrine._serialization.serializable import Serializable
+from citrine.gemtables.columns import Column, MeanColumn
+from citrine.informatics.constraints import AcceptableCategoriesConstraint, Constraint
+
+
+class Shape(PolymorphicSerializable['Shape']):
+
+    @classmethod
+    def get_type(cls, data):
+        return cls._subtypes[data['type']]
+
+
+class Circle(Serializable['Circle'], Shape):
+
+    radius = properties.Float('radius')
+    typ = properties.String('type', default='circle', deserializable=False)
+
+
+class Disk(Circle):
+    """A subclass that shares its parent's type."""
+
+
+class Square(Serializable['Square'], Shape):
+
+    side = properties.Float('side')
+    typ = properties.String('type', default='square', deserializable=False)
+
+
+def test_subtypes_registered():
+    """Subtypes should be registered with their base under their type as they are defined."""
+    assert Shape._subtypes == {'circle': Circle, 'square': Square}
+    assert 'circle' not in Column._subtypes
+    shape = Shape.build({'type': 'square', 'side': 2.0})
+    assert isinstance(shape, Square) and shape.side == 2.0
+    with pytest.raises(KeyError):
+        Shape.build({'type': 'triangle'})
+
+
+def test_library_subtypes():
+    """The library's bases should resolve their subtypes, including aliases."""
+    assert Column.get_type({'type': 'mean_column'}) is MeanColumn
+    assert MeanColumn._subtypes is Column._subtypes
+    assert Constraint.get_type({'type': 'Categorical'}) is AcceptableCategoriesConstraint
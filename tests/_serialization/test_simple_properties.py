@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime, timezone
 
 import arrow
 import pytest
@@ -137,6 +138,35 @@ def test_deserialize_string_datetime():
     assert arrow.get('2019-07-19T10:46:08+00:00').datetime == Datetime().deserialize('2019-07-19T10:46:08+00:00')
 
 
+@pytest.mark.parametrize('serialized', [
+    1563533168123, 10 ** 17,  # Too large for a datetime, so arrow normalizes it
+    '2019-07-19T10:46:08Z', '2019-07-19T10:46:08.123456', '2019-07-19T10:46:08.1234567Z',
+    '2019-07-19T10:46:08+02:00', '2019-07-19'
+])
+def test_deserialize_datetime_matches_arrow(serialized):
+    """Fast paths should give the same datetimes as arrow, falling back to it where needed."""
+    expected = arrow.get(serialized / 1000 if isinstance(serialized, int) else serialized)
+    deserialized = Datetime().deserialize(serialized)
+    assert deserialized == expected.datetime
+    assert deserialized.tzinfo == expected.datetime.tzinfo
+
+
+def test_deserialize_invalid_datetime():
+    with pytest.raises(ValueError):
+        Datetime().deserialize('2019-13-19T10:46:08Z')
+
+
+def test_serialize_naive_datetime():
+    naive = datetime(2019, 7, 19, 10, 46, 8, 123000)
+    assert Datetime().serialize(naive) == 1563533168123
+    assert Datetime().serialize(naive.replace(tzinfo=timezone.utc)) == 1563533168123
+
+
+def test_deserialize_uuid_shared():
+    value = str(uuid.uuid4())
+    assert UUID().deserialize(value) is UUID().deserialize(value)
+
+
 def test_datetime_cannot_deserialize_float():
     with pytest.raises(TypeError):
         Datetime()._deserialize(1.114)
@@ -0,0 +1,85 @@
+"""Tests of building objects from trusted payloads."""
+import pytest
+
+from citrine._serialization import properties
+from citrine._serialization.compiled import compiled_builder
+from citrine._serialization.serializable import Serializable
+from citrine._serialization.trusted import trusted_build
+from citrine.informatics.predictors import GraphPredictor
+from citrine.resources.material_run import MaterialRun
+from tests.utils.factories import MaterialRunDataFactory, PredictorEntityDataFactory
+
+
+class Leaf(Serializable['Leaf']):
+
+    name = properties.String('name')
+    size = properties.Optional(properties.Integer, 'size')
+    extra = properties.Optional(properties.Raw, 'extra')
+
+
+class Tree(Serializable['Tree']):
+
+    name = properties.String('name')
+    leaves = properties.List(properties.Object(Leaf), 'leaves', default=[])
+    tags = properties.Set(properties.String, 'tags', default=set())
+    ages = properties.Optional(properties.List(properties.Integer), 'ages')
+
+
+DATA = {'name': 'oak', 'leaves': [{'name': 'a', 'size': '3', 'extra': [1]}, {'name': 'b'}],
+        'tags': ['tall', 'old'], 'ages': [1, '2']}
+
+
+def test_trusted_build():
+    """Trusted payloads should build the same objects as untrusted ones."""
+    with trusted_build():
+        trusted = Tree.build(DATA)
+        missing = Tree.build({'name': 'elm'})
+    untrusted = Tree.build(DATA)
+    assert trusted.dump() == untrusted.dump()
+    assert vars(trusted.leaves[0]) == vars(untrusted.leaves[0])
+    assert (trusted.tags, trusted.ages) == ({'tall', 'old'}, [1, 2])
+    assert (missing.leaves, missing.ages) == ([], None)
+    assert compiled_builder(Tree, True) is not compiled_builder(Tree)
+
+    for klass, factory in [(GraphPredictor, PredictorEntityDataFactory),
+                           (MaterialRun, MaterialRunDataFactory)]:
+        data = factory()
+        with trusted_build():
+            trusted = klass.build(data)
+        assert trusted.dump() == klass.build(data).dump()
+
+
+def test_trusted_build_skips_validation():
+    """Types should only be checked outside the context, and missing fields always reported."""
+    data = {'name': 7}
+    with trusted_build():
+        assert Leaf.build(data).name == 7
+        with pytest.raises(ValueError, match="missing a required field: name"):
+            Leaf.build({})
+    with pytest.raises(ValueError, match="is not one of valid types"):
+        Leaf.build(data)
+
+
+
+def test_trusted_session():
+    """Collections should only skip validation of responses if their session trusts them."""
+    from uuid import uuid4
+
+    from citrine.resources.dataset import Dataset, DatasetCollection
+    from tests.utils.factories import DatasetDataFactory
+    from tests.utils.session import FakeSession
+
+    data = {**DatasetDataFactory(), 'name': 7}
+    session = FakeSession()
+    collection = DatasetCollection(team_id=uuid4(), session=session)
+
+    session.set_response(data)
+    with pytest.raises(ValueError, match="is not one of valid types"):
+        collection.get(data['id'])
+
+    session.trusted_build = True
+    session.set_response(data)
+    assert collection.get(data['id']).name == 7
+    assert [dataset.name for dataset in collection._build_collection_elements([data])] == [7]
+    with pytest.raises(ValueError, match="is not one of valid types"):
+        Dataset.build(data)  # Objects built outside the collection are still validated
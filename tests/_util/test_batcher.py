@@ -1,12 +1,13 @@
 import pytest
 
-from citrine._utils.batcher import Batcher
+from citrine._utils.batcher import Batcher, BatchSizer
 
 from gemd.demo.cake import make_cake
+from gemd.entity.bounds import IntegerBounds
 from gemd.entity.link_by_uid import LinkByUID
 from gemd.entity.object import *
 from gemd.entity.template import *
-from gemd.util import flatten, writable_sort_order
+from gemd.util import flatten, set_uuids, writable_sort_order
 
 
 def test_by_type():
@@ -35,6 +36,37 @@ def test_by_type():
         batcher.batch(bad, batch_size=10)
 
 
+def test_by_type_levels():
+    batcher = Batcher.by_type()
+    bounds = IntegerBounds(0, 1)
+    objects = [PropertyTemplate(f"prop {i}", bounds=bounds) for i in range(25)] \
+        + [ConditionTemplate(f"cond {i}", bounds=bounds) for i in range(5)] \
+        + [MaterialTemplate(f"mat {i}") for i in range(23)] \
+        + flatten(make_cake())
+    set_uuids(objects, scope="batching")
+    batches = batcher.batch(objects, batch_size=10)
+    levels = batcher.levels(batches)
+
+    assert [batch for level in levels for batch in level] == batches, "Batches lost or reordered"
+    assert any(len(level) > 1 for level in levels), "Nothing could run concurrently"
+    for level in levels:
+        if len(level) > 1:
+            orders = {writable_sort_order(obj) for batch in level for obj in batch}
+            assert len(orders) == 1, "Dependent batches shared a level"
+    for i in range(len(levels) - 1):
+        assert max(writable_sort_order(x) for batch in levels[i] for x in batch) \
+               <= min(writable_sort_order(x) for batch in levels[i + 1] for x in batch), "Load order violated"
+
+
+def test_default_levels():
+    class OneBatch(Batcher):
+        def batch(self, objects, batch_size):
+            return [list(objects)]
+
+    batcher = OneBatch()
+    assert batcher.levels(batcher.batch([1, 2], batch_size=2)) == [[[1, 2]]]
+
+
 def test_by_dependency():
     batcher = Batcher.by_dependency()
     cake = make_cake()
@@ -117,5 +149,98 @@ def test_by_dependency():
             else:
                 pytest.fail(f"Unhandled type in batch: {type(obj)}")
 
+    assert batcher.levels(first) == [first], "Clusters are independent"
+    assert batcher.levels([]) == []
+
     with pytest.raises(ValueError):
         batcher.batch(flatten(cake), batch_size=1)  # Errors out if impossible
+
+
+def test_by_type_by_order():
+    """Test that grouping by order merges independent types and keeps load order."""
+    batcher = Batcher.by_type()
+    cake = flatten(make_cake())
+    groups = batcher.by_order(cake + cake)
+    for group in groups:
+        assert len({writable_sort_order(x) for x in group}) == 1, "Group mixed sort orders"
+    orders = [writable_sort_order(group[0]) for group in groups]
+    assert orders == sorted(set(orders)), "Load order violated"
+    assert len(cake) == len([y for x in groups for y in x]), "Object missing or repeated"
+
+
+def test_batch_sizer():
+    """Test that the batch size adapts to latency and rejection."""
+    with pytest.raises(ValueError):
+        BatchSizer(initial_size=0)
+    with pytest.raises(ValueError):
+        BatchSizer(initial_size=20, max_size=10)
+
+    sizer = BatchSizer(initial_size=4, max_size=10, max_bytes=100, target_seconds=1.0)
+    assert sizer.fits(4, 100)
+    assert not sizer.fits(5, 10)
+    assert not sizer.fits(1, 101)
+
+    sizer.record(count=4, nbytes=10, seconds=0.1)
+    assert sizer.size == 8, "Fast, full batches should grow"
+    sizer.record(count=3, nbytes=10, seconds=0.1)
+    assert sizer.size == 8, "Partial batches say nothing about capacity"
+    sizer.record(count=8, nbytes=10, seconds=0.7)
+    assert sizer.size == 8, "Batches near the target should hold steady"
+    sizer.record(count=8, nbytes=10, seconds=0.1)
+    assert sizer.size == 10, "Growth is capped"
+    sizer.record(count=10, nbytes=10, seconds=2.0)
+    assert sizer.size == 5, "Slow batches should shrink"
+    sizer.record(count=3, nbytes=10, seconds=0.0, succeeded=False)
+    assert sizer.size == 1, "Rejected batches should shrink below their own size"
+    sizer.record(count=1, nbytes=10, seconds=0.0, succeeded=False)
+    assert sizer.size == 1, "Size never drops below one"
+
+    assert len(sizer.history) == 7
+    assert [record.succeeded for record in sizer.history] == [True] * 5 + [False] * 2
+    assert "count=10" in repr(sizer.history[4])
+
+
+def test_by_dependency_references():
+    """Dependencies are found by identity or uid, and outside references are ignored."""
+    batcher = Batcher.by_dependency()
+    bounds = IntegerBounds(0, 1)
+    prop = PropertyTemplate("prop", bounds=bounds, uids={"test": "prop"})
+    outside = MaterialTemplate("outside", uids={"test": "outside"})
+    template = MaterialTemplate("template", properties=[[prop, bounds]], uids={"test": "tmpl"})
+    replicate = MaterialTemplate("template", uids={"test": "tmpl"})  # Same uid, other instance
+    specs = [
+        MaterialSpec("by identity", template=template, uids={"test": "a"}),
+        MaterialSpec("by uid", template=replicate, uids={"test": "b"}),
+        MaterialSpec("by link", template=LinkByUID("test", "tmpl"), uids={"test": "c"}),
+        MaterialSpec("outside", template=outside, uids={"test": "d"}),
+        MaterialSpec("missing", template=LinkByUID("test", "missing"), uids={"test": "e"}),
+    ]
+
+    batches = batcher.batch(specs + [template, prop], batch_size=3)
+    for spec in specs[:3]:
+        batch = next(batch for batch in batches if spec in batch)
+        assert any(x is template for x in batch), "Template wasn't in batch"
+        assert any(x is prop for x in batch), "Template's dependency wasn't in batch"
+    assert [specs[3]] in batches and [specs[4]] in batches, "Outside references were added"
+    assert all(len(batch) <= 3 for batch in batches), "A batch was too long"
+
+    other = PropertyTemplate("other", bounds=bounds, uids={"test": "other"})
+    both = MaterialTemplate("both", properties=[[prop, bounds], [other, bounds]],
+                            uids={"test": "both"})
+    with pytest.raises(ValueError):
+        batcher.batch([both, prop, other], batch_size=1)  # Too many direct references
+
+
+def test_by_dependency_oversized(caplog):
+    """An object whose dependencies don't fit with it still gets a batch, and a warning."""
+    batcher = Batcher.by_dependency()
+    bounds = IntegerBounds(0, 1)
+    prop = PropertyTemplate("prop", bounds=bounds, uids={"test": "prop"})
+    template = MaterialTemplate("template", properties=[[prop, bounds]], uids={"test": "tmpl"})
+    spec = MaterialSpec("spec", template=template, uids={"test": "spec"})
+
+    with caplog.at_level("WARNING", logger="citrine._utils.batcher"):
+        batches = batcher.batch([spec, template, prop], batch_size=2)
+    batch = next(batch for batch in batches if spec in batch)
+    assert len(batch) == 3 and template in batch and prop in batch, "Dependencies were dropped"
+    assert "1 objects have more dependencies than fit in a batch of 2" in caplog.text
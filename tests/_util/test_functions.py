@@ -1,3 +1,5 @@
+import threading
+import time
 from pathlib import Path
 import pytest
 import uuid
@@ -8,9 +10,11 @@ from gemd.entity.link_by_uid import LinkByUID
 
 from citrine._utils.functions import get_object_id, validate_type, object_to_link_by_uid, \
     rewrite_s3_links_locally, write_file_locally, migrate_deprecated_argument, format_escaped_url, \
-    MigratedClassMeta, generate_shared_meta
+    MigratedClassMeta, generate_shared_meta, read_ahead, merge_concurrently, registration_payload, \
+    replace_objects_with_links, scrub_none
 from gemd.entity.attribute.property import Property
 from citrine.resources.condition_template import ConditionTemplate
+from citrine.resources.data_concepts import DataConcepts
 
 
 def test_get_object_id_from_base_attribute():
@@ -193,3 +197,131 @@ def test_format_escaped_url():
     for c in '&' + '+?#':
         assert c not in url
     assert 6 == sum(c == '/' for c in url)
+
+
+def test_read_ahead_preserves_order():
+    assert list(read_ahead(iter(range(100)), depth=3)) == list(range(100))
+    assert list(read_ahead([], depth=1)) == []
+
+
+def test_read_ahead_bounds_depth():
+    produced = []
+
+    def numbers():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    iterator = read_ahead(numbers(), depth=2)
+    assert next(iterator) == 0
+    for _ in range(50):
+        if len(produced) >= 4:
+            break
+        time.sleep(0.01)
+    time.sleep(0.05)
+    # One item consumed, two buffered, and at most one more waiting to be buffered
+    assert len(produced) <= 4
+    iterator.close()
+
+
+def test_read_ahead_reraises_and_stops():
+    def failing():
+        yield 1
+        raise KeyError("boom")
+
+    iterator = read_ahead(failing(), depth=1)
+    assert next(iterator) == 1
+    with pytest.raises(KeyError):
+        next(iterator)
+
+    with pytest.raises(ValueError):
+        read_ahead([1], depth=0)
+
+
+def test_read_ahead_close_releases_producer():
+    iterator = read_ahead(iter(range(1000)), depth=1)
+    assert next(iterator) == 0
+    iterator.close()
+    time.sleep(0.3)
+    assert not any(t.name == 'citrine-read-ahead' and t.is_alive() for t in threading.enumerate())
+
+
+def test_merge_concurrently():
+    sources = [range(i * 100, i * 100 + 50) for i in range(5)]
+    expected = [x for source in sources for x in source]
+
+    assert list(merge_concurrently(sources, max_workers=2, preserve_order=True, buffer_size=3)) == expected
+
+    merged = list(merge_concurrently(sources, max_workers=3, buffer_size=3))
+    assert sorted(merged) == expected
+    for source in sources:
+        assert [x for x in merged if x in source] == list(source)
+
+    assert list(merge_concurrently([], max_workers=1)) == []
+    with pytest.raises(ValueError):
+        merge_concurrently(sources, max_workers=0)
+
+
+def test_merge_concurrently_stops_on_close():
+    merged = merge_concurrently([iter(range(10000)) for _ in range(3)], max_workers=3, buffer_size=1)
+    assert next(merged) == 0
+    merged.close()
+    time.sleep(0.3)
+    assert not any(t.name.startswith('citrine-merge') and t.is_alive() for t in threading.enumerate())
+
+
+def _expected_payload(model):
+    return replace_objects_with_links(scrub_none(model.dump()))
+
+
+def test_registration_payload_matches_dump():
+    """The single-pass payload should be exactly what dumping and then linking produces."""
+    from gemd.demo.cake import make_cake
+    from gemd.json import GEMDJson
+    from gemd.util import recursive_flatmap
+
+    encoder = GEMDJson()
+    cake = encoder.loads(encoder.dumps(make_cake()))  # Rebuilt as citrine objects
+    objects = recursive_flatmap(cake, lambda obj: [obj], unidirectional=False)
+    assert all(isinstance(obj, DataConcepts) for obj in objects)
+    for obj in objects:
+        assert registration_payload(obj) == _expected_payload(obj)
+
+
+def test_registration_payload_edge_cases():
+    """Links, objects without ids, unset bounds and plain gemd objects should all match."""
+    from gemd.entity.object import MaterialRun as GEMDMaterialRun
+    from citrine.resources.material_run import MaterialRun
+    from citrine.resources.material_spec import MaterialSpec
+    from citrine.resources.material_template import MaterialTemplate
+    from citrine.resources.property_template import PropertyTemplate
+
+    prop = PropertyTemplate("length", bounds=RealBounds(0, 1, "m"), uids={"id": str(uuid.uuid4())})
+    template = MaterialTemplate("material", properties=[prop, LinkByUID("id", "width"),
+                                                        [prop, None], (prop, RealBounds(0, 1, "m"))])
+    spec = MaterialSpec("spec", template=template, tags=["a"])  # The spec has no ids
+    run = MaterialRun("run", spec=spec, uids={"id": str(uuid.uuid4())})
+    linked = MaterialRun("linked", spec=LinkByUID("id", "spec"))
+    for model in (prop, template, spec, run, linked, GEMDMaterialRun("gemd", spec=spec)):
+        assert registration_payload(model) == _expected_payload(model)
+    assert registration_payload(run)["spec"]["name"] == "spec"
+
+    with pytest.raises(ValueError):
+        registration_payload(MaterialRun("bad", spec=spec, file_links=["not a file link"]))
+
+
+def test_registration_payload_nested_path():
+    """Fields serialized under a dotted path should be nested as they are by `dump`."""
+    from citrine._serialization import properties
+    from citrine._serialization.serializable import Serializable
+
+    class Nested(Serializable['Nested']):
+        name = properties.String('config.name')
+        label = properties.Optional(properties.String, 'config.label')
+
+        def __init__(self, name, label=None):
+            self.name = name
+            self.label = label
+
+    assert registration_payload(Nested("a")) == {"config": {"name": "a"}}
+    assert registration_payload(Nested("a", "b")) == _expected_payload(Nested("a", "b"))
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+import pytest
+from gemd.entity.bounds import IntegerBounds
+from gemd.entity.template import PropertyTemplate
+
+from citrine._utils.journal import RegistrationJournal
+
+
+def make_templates():
+    bounds = IntegerBounds(0, 1)
+    return [PropertyTemplate("twin", bounds=bounds),
+            PropertyTemplate("twin", bounds=bounds),
+            PropertyTemplate("named", bounds=bounds, uids={"lims": "42"})]
+
+
+def test_restore_and_record(tmpdir):
+    path = Path(tmpdir) / "journal.jsonl"
+    journal = RegistrationJournal(path)
+    assert len(journal) == 0 and not path.exists()
+
+    first = make_templates()
+    remaining, restored = journal.restore(first + first[:1])
+    assert remaining == first and restored == []
+
+    journal.record([])  # Nothing to write
+    assert not path.exists()
+    for i, obj in enumerate(first[:2]):
+        obj.add_uid("id", f"uid {i}")
+        obj.tags = [f"tag {i}"]
+    journal.record(first[:2])
+    journal.record(first[:1])  # Already recorded
+    assert len(path.read_text().splitlines()) == 1
+
+    second = make_templates()
+    journal = RegistrationJournal(path)
+    assert len(journal) == 2
+    remaining, restored = journal.restore(second)
+    assert remaining == second[2:]
+    assert restored == second[:2]
+    # Identical objects are restored in the order they were recorded
+    assert [obj.uids for obj in restored] == [{"id": "uid 0"}, {"id": "uid 1"}]
+    assert [obj.tags for obj in restored] == [["tag 0"], ["tag 1"]]
+
+
+def test_interrupted_writes(tmpdir):
+    path = Path(tmpdir) / "journal.jsonl"
+    entry = {'key': 'k', 'uids': {'id': '1'}, 'tags': None}
+
+    path.write_text(json.dumps([entry]) + '\n' + json.dumps([entry])[:-3])
+    journal = RegistrationJournal(path)
+    assert len(journal) == 1
+    assert path.read_text() == json.dumps([entry]) + '\n', "The partial line should be dropped"
+
+    path.write_text(json.dumps([entry]))
+    assert len(RegistrationJournal(path)) == 1
+    assert path.read_text().endswith('\n'), "The line ending should be restored"
+
+    path.write_text('{"broken\n' + json.dumps([entry]) + '\n')
+    with pytest.raises(ValueError):
+        RegistrationJournal(path)
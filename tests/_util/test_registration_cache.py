@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from gemd.entity.bounds import IntegerBounds
+from gemd.entity.object import MaterialSpec
+from gemd.entity.template import MaterialTemplate
+
+from citrine._utils.registration_cache import RegistrationCache
+from citrine.resources.data_concepts import CITRINE_SCOPE, CITRINE_TAG_PREFIX
+
+
+def make_objects(description="A template"):
+    template = MaterialTemplate("template", description=description, uids={"lims": "t"})
+    spec = MaterialSpec("spec", template=template, uids={"lims": "s"}, tags=["mine"])
+    anonymous = MaterialSpec("anonymous", template=template)
+    return [template, spec, anonymous]
+
+
+def test_digest():
+    template, spec, _ = make_objects()
+    digest = RegistrationCache.digest(spec)
+    spec.add_uid(CITRINE_SCOPE, "assigned")
+    spec.tags.append(f"{CITRINE_TAG_PREFIX}::generated")
+    assert RegistrationCache.digest(spec) == digest, "Platform-assigned fields aren't content"
+    spec.tags.append("user tag")
+    assert RegistrationCache.digest(spec) != digest
+    assert RegistrationCache.digest(MaterialTemplate("bare")) != RegistrationCache.digest(template)
+
+
+def test_filter_and_record(tmpdir):
+    path = Path(tmpdir) / "cache.sqlite"
+    with RegistrationCache(path) as cache:
+        objects = make_objects()
+        for obj in objects:
+            obj.add_uid(CITRINE_SCOPE, f"first {obj.name}")
+        changed, unchanged = cache.filter(objects)
+        assert changed == objects and unchanged == [] and cache.skipped == 0
+
+        for obj in objects:  # What the platform returned
+            obj.uids[CITRINE_SCOPE] = f"registered {obj.name}"
+            obj.tags = obj.tags + [f"{CITRINE_TAG_PREFIX}::{obj.name}"]
+        cache.record(objects)
+        cache.record(objects)  # Already recorded
+        assert len(cache) == 2, "Only objects with their own uids are cached"
+
+    with RegistrationCache(path) as cache:
+        objects = make_objects(description="Changed")
+        for obj in objects:
+            obj.add_uid(CITRINE_SCOPE, f"second {obj.name}")
+        changed, unchanged = cache.filter(objects)
+        template, spec, anonymous = objects
+        assert changed == [template, anonymous]
+        assert unchanged == [spec]
+        assert cache.skipped == 1
+        assert spec.uids[CITRINE_SCOPE] == "registered spec"
+        assert spec.tags == ["mine", f"{CITRINE_TAG_PREFIX}::spec"]
+        assert template.uids[CITRINE_SCOPE] == "registered template", "Known uids are restored"
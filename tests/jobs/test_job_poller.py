@@ -0,0 +1,141 @@
+"""Tests of polling many jobs from one loop."""
+from uuid import uuid4
+
+import mock
+import pytest
+
+from citrine.exceptions import (JobFailureError, NotFound, PollingTimeoutError,
+                                TooManyRequests)
+from citrine.jobs import polling
+from citrine.jobs.job import JobPoller, JobStatus, JobSubmissionResponse
+from citrine.jobs.polling import Backoff
+from tests.utils.factories import JobStatusResponseDataFactory
+from tests.utils.session import FakeSession
+
+
+class FakeClock:
+    """A clock that only moves when something sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(polling, 'time', clock.time)
+    monkeypatch.setattr(polling, 'sleep', clock.sleep)
+    return clock
+
+
+def running():
+    return {'job_type': 'build', 'status': JobStatus.RUNNING, 'tasks': []}
+
+
+def failure():
+    return {'job_type': 'build', 'status': JobStatus.FAILURE, 'tasks': [
+        {'id': 'task', 'task_type': 'build', 'status': JobStatus.FAILURE,
+         'failure_reason': 'because', 'dependencies': []}
+    ]}
+
+
+def test_poller_completes_jobs_as_they_finish(clock):
+    """Jobs should be returned as they finish, and a failure should only affect its own job."""
+    session = FakeSession()
+    session.set_responses(running(), failure(),
+                          JobStatusResponseDataFactory(), running(),
+                          JobStatusResponseDataFactory(output={'table': 'first'}))
+    poller = JobPoller(session, team_id=uuid4(), polling_delay=5.0)
+    first_id, second_id, third_id = uuid4(), uuid4(), uuid4()
+    first = poller.add(JobSubmissionResponse.build({'job_id': str(first_id)}))
+    second, third = poller.add(second_id), poller.add(str(third_id))
+    assert poller.add(first_id) is first
+    assert len(poller) == 3
+
+    finished = list(poller.as_completed())
+    assert finished == [second, third, first]
+    assert len(poller) == 0
+    assert first.result().output == {'table': 'first'}
+    assert third.result().status == JobStatus.SUCCESS
+    with pytest.raises(JobFailureError) as error:
+        second.result()
+    assert error.value.job_id == second_id
+    assert error.value.failure_reasons == ['because']
+
+    # One request every tenth of a second, and each job polled every five seconds
+    assert clock.sleeps == pytest.approx([0.1, 0.1, 4.8, 5.0])
+    assert [call.params['job_id'] for call in session.calls] == \
+        [first_id, second_id, str(third_id), first_id, first_id]
+
+
+def test_poller_rate(clock):
+    """Many jobs should be polled no faster than the maximum rate."""
+    session = FakeSession()
+    session.set_response(JobStatusResponseDataFactory())
+    poller = JobPoller(session, team_id=uuid4(), max_rate=4.0)
+    futures = [poller.add(uuid4()) for _ in range(5)]
+    assert set(poller.as_completed()) == set(futures)
+    assert clock.sleeps == pytest.approx([0.25] * 4)
+
+    with pytest.raises(ValueError):
+        JobPoller(session, team_id=uuid4(), max_rate=0)
+
+
+def test_poller_errors(clock):
+    """Timeouts and errors requesting a job's status should be raised by the job's future."""
+    session = FakeSession()
+    session.set_response(running())
+    poller = JobPoller(session, team_id=uuid4(), timeout=3.0, polling_delay=2.0)
+    late, cancelled = poller.add(uuid4()), poller.add(uuid4())
+    assert cancelled.cancel()
+    assert list(poller.as_completed()) == [late]
+    with pytest.raises(PollingTimeoutError):
+        late.result()
+    assert session.num_calls == 3
+    assert len(poller) == 0
+
+    session.set_responses(NotFound('job-status'), JobStatusResponseDataFactory(failure=True))
+    poller = JobPoller(session, team_id=uuid4(), raise_errors=False)
+    missing, failed = poller.add(uuid4()), poller.add(uuid4())
+    assert list(poller.as_completed()) == [missing, failed]
+    with pytest.raises(NotFound):
+        missing.result()
+    assert failed.result().status == JobStatus.FAILURE
+
+
+def test_poller_backs_off(clock):
+    """Polls should back off, and wait as long as the server asks when rate limited."""
+    session = FakeSession()
+    session.set_responses(running(), running(), running(), JobStatusResponseDataFactory())
+    backoff = Backoff(initial=1.0, factor=2.0, jitter=0.0)
+    poller = JobPoller(session, team_id=uuid4(), backoff=backoff)
+    [done] = [poller.add(uuid4())]
+    assert list(poller.as_completed()) == [done]
+    assert clock.sleeps == pytest.approx([1.0, 2.0, 4.0])
+
+    # Nothing is polled until the server's wait is over, and then each job backs off on its own
+    clock.sleeps.clear()
+    session = mock.Mock()
+    session.get_resource.side_effect = [
+        TooManyRequests('slow down', retry_after=7.0), running(), TooManyRequests('slow down'),
+        JobStatusResponseDataFactory(), JobStatusResponseDataFactory()]
+    backoff = Backoff(initial=1.0, factor=2.0, jitter=0.0)
+    poller = JobPoller(session, team_id=uuid4(), backoff=backoff)
+    first, second = poller.add(uuid4()), poller.add(uuid4())
+    assert list(poller.as_completed()) == [second, first]
+    assert clock.sleeps == pytest.approx([7.0, 0.1, 0.9, 1.1])
+
+    session.get_resource.side_effect = TooManyRequests('slow down')
+    poller = JobPoller(session, team_id=uuid4(), timeout=0.0)
+    late = poller.add(uuid4())
+    assert list(poller.as_completed()) == [late]
+    with pytest.raises(PollingTimeoutError):
+        late.result()
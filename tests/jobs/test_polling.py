@@ -0,0 +1,121 @@
+"""Tests of the polling schedule shared by waits on platform work."""
+import pytest
+
+from citrine.jobs import polling
+from citrine.jobs.polling import (Backoff, Poller, _choose_backoff, background_poller,
+                                  get_default_backoff, set_default_backoff)
+
+
+def test_backoff_delays():
+    """Waits should grow exponentially up to the cap, and never be shorter than asked for."""
+    backoff = Backoff(initial=0.5, factor=2.0, maximum=6.0, jitter=0.0)
+    assert [backoff.delay(attempt) for attempt in range(1, 7)] == [0.5, 1, 2, 4, 6, 6]
+    assert backoff.delay(0) == 0.5
+    assert backoff.delay(100000) == 6.0
+    assert backoff.delay(1, retry_after=3.0) == 3.0
+    assert backoff.delay(5, retry_after=3.0) == 6.0
+
+    assert {Backoff.constant(2.0).delay(attempt) for attempt in range(1, 5)} == {2.0}
+    assert "maximum=6.0" in repr(backoff)
+
+
+def test_backoff_jitter(monkeypatch):
+    """Jitter should only shorten waits, by up to the given fraction."""
+    backoff = Backoff(initial=10.0, maximum=10.0, jitter=0.2)
+    monkeypatch.setattr(polling, 'random', lambda: 1.0)
+    assert backoff.delay(3) == pytest.approx(8.0)
+    monkeypatch.setattr(polling, 'random', lambda: 0.0)
+    assert backoff.delay(3) == 10.0
+
+
+@pytest.mark.parametrize("kwargs", [{'initial': -1.0}, {'initial': 5.0, 'maximum': 1.0},
+                                    {'factor': 0.5}, {'jitter': 1.5}])
+def test_backoff_validation(kwargs):
+    with pytest.raises(ValueError):
+        Backoff(**kwargs)
+
+
+def test_default_backoff(monkeypatch):
+    """A call's own backoff or fixed delay should win over the process-wide default."""
+    monkeypatch.setattr(polling, '_default_backoff', polling._default_backoff)
+    custom = Backoff(initial=2.0, maximum=60.0)
+    set_default_backoff(custom)
+    assert get_default_backoff() is custom
+    assert _choose_backoff(None, None) is custom
+    assert _choose_backoff(None, 4.0).delay(10) == 4.0
+    mine = Backoff()
+    assert _choose_backoff(mine, 4.0) is mine
+    with pytest.raises(TypeError):
+        set_default_backoff(3.0)
+
+
+def test_poller_in_background():
+    """A started poller should resolve futures from its own thread, as work is submitted."""
+    poller = Poller(backoff=Backoff.constant(0.01))
+    polls = []
+
+    def check(name, finish_after):
+        def poll():
+            polls.append(name)
+            return polls.count(name) >= finish_after, name
+        return poll
+
+    poller.start()
+    poller.start()
+    slow = poller.submit(check('slow', 3), timeout=10, on_timeout=RuntimeError)
+    fast = poller.submit(check('fast', 1), timeout=10, on_timeout=RuntimeError, key='fast')
+    assert poller.submit(check('fast', 1), timeout=10, on_timeout=RuntimeError,
+                         key='fast') is fast
+    assert fast.result(timeout=5) == 'fast'
+    assert slow.result(timeout=5) == 'slow'
+    assert polls.count('slow') == 3
+    assert len(poller) == 0
+    with pytest.raises(RuntimeError, match="background"):
+        next(poller.as_completed())
+
+    late = poller.submit(check('late', 100), timeout=0.05,
+                         on_timeout=lambda: TimeoutError('late'))
+    with pytest.raises(TimeoutError):
+        late.result(timeout=5)
+
+
+def test_poller_survives_errors_outside_checks():
+    """An error scheduling or timing out some work should only resolve that work's future."""
+    class BrokenBackoff(Backoff):
+        def delay(self, attempt, *, retry_after=None):
+            raise ArithmeticError("broken backoff")
+
+    def broken_timeout():
+        raise LookupError("broken on_timeout")
+
+    poller = Poller(backoff=Backoff.constant(0.01))
+    poller.start()
+    unscheduled = poller.submit(lambda: (False, None), timeout=10, on_timeout=RuntimeError,
+                                backoff=BrokenBackoff())
+    untimed = poller.submit(lambda: (False, None), timeout=0.0, on_timeout=broken_timeout)
+    with pytest.raises(ArithmeticError):
+        unscheduled.result(timeout=5)
+    with pytest.raises(LookupError):
+        untimed.result(timeout=5)
+    assert poller.submit(lambda: (True, 1), timeout=10, on_timeout=RuntimeError
+                         ).result(timeout=5) == 1, "The poller should still be running"
+
+def test_poller_cancelled_while_polling():
+    """A future cancelled while its work is being polled should be left cancelled."""
+    poller = Poller()
+    futures = []
+
+    def check():
+        futures[0].cancel()
+        return True, 'done'
+
+    futures.append(poller.submit(check, timeout=10, on_timeout=RuntimeError))
+    assert list(poller.as_completed()) == []
+    assert futures[0].cancelled()
+
+
+def test_background_poller():
+    """The background poller should be shared, and already started."""
+    assert background_poller() is background_poller()
+    future = background_poller().submit(lambda: (True, 1), timeout=10, on_timeout=RuntimeError)
+    assert future.result(timeout=5) == 1
@@ -6,13 +6,17 @@ import pytest
 import sys
 import time
 
+from citrine.exceptions import NotFound, TooManyRequests
 from citrine.informatics.executions.design_execution import DesignExecution
+from citrine.jobs import polling
 from citrine.jobs.waiting import (
+    wait_for_all,
     wait_for_asynchronous_object,
     wait_while_executing,
     wait_while_validating,
     ConditionTimeoutError
 )
+from citrine.jobs.polling import Backoff
 from citrine.resources.status_detail import StatusDetail
 
 
@@ -91,3 +95,88 @@ def test_wait_for_asynchronous_object(sleep_mock, time_mock):
 
     assert str(exception.value) == ("Timeout of 1.0 seconds reached, "
         "but task 123456 is still in progress")
+
+@mock.patch('time.time')
+@mock.patch('time.sleep', return_value=None)
+def test_wait_backs_off(sleep_mock, time_mock):
+    time_mock.side_effect = [0.0, 1.0, 3.0, 9.0, 10.0]
+
+    resource = mock.Mock()
+    resource.in_progress.side_effect = [True, True, False]
+    collection = mock.Mock()
+    collection.get.side_effect = [resource, TooManyRequests("Slow down", retry_after=5.0),
+                                  resource, resource]
+
+    result = wait_for_asynchronous_object(collection=collection, resource=resource,
+                                          backoff=Backoff(initial=1.0, factor=2.0, jitter=0.0))
+    assert result is resource
+    assert collection.get.call_count == 4
+    assert [args[0] for args, _ in sleep_mock.call_args_list] == [1.0, 5.0, 4.0]
+
+    # The last wait is cut short at the timeout, to check just once more
+    time_mock.side_effect = [0.0, 9.0, 10.0]
+    resource.in_progress.side_effect = None
+    resource.in_progress.return_value = True
+    collection.get.side_effect = None
+    collection.get.return_value = resource
+    with pytest.raises(ConditionTimeoutError):
+        wait_for_asynchronous_object(collection=collection, resource=resource, timeout=10.0,
+                                     interval=3.0)
+    assert sleep_mock.call_args[0][0] == 1.0
+
+
+def test_wait_for_all(monkeypatch):
+    """Resources should be polled together and yielded as each finishes."""
+    now, sleeps = [1000.0], []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(polling, 'time', lambda: now[0])
+    monkeypatch.setattr(polling, 'sleep', sleep)
+
+    def fetched(uid, *in_progress):
+        for value in in_progress:
+            resource = mock.Mock(uid=uid)
+            resource.in_progress.return_value = value
+            yield resource
+
+    first, second, third = (mock.Mock(uid=uid) for uid in ('first', 'second', 'third'))
+    responses = {'first': fetched('first', True, True, False), 'second': fetched('second', False),
+                 'third': fetched('third', True, False)}
+    collection = mock.Mock()
+    collection.get.side_effect = lambda uid: next(responses[uid])
+
+    finished = wait_for_all([first, second, third, first], collection, interval=5.0)
+    assert collection.get.call_count == 0
+    assert [future.result().uid for future in finished] == ['second', 'third', 'first']
+    assert collection.get.call_count == 6
+    assert sleeps == pytest.approx([0.1, 0.1, 4.8, 0.2, 4.8])
+
+    responses['first'] = fetched('first', True, True)
+    [late] = wait_for_all([first], collection, timeout=1.0,
+                          backoff=Backoff(initial=1.0, jitter=0.0))
+    with pytest.raises(ConditionTimeoutError, match="task first is still in progress"):
+        late.result()
+
+
+def test_wait_for_all_failures(monkeypatch):
+    """A resource that fails shouldn't stop the others from being waited on."""
+    monkeypatch.setattr(polling, 'sleep', lambda seconds: None)
+
+    def get(uid):
+        if uid == 'missing':
+            raise NotFound.build(message='Not found', method='GET', path=f'/executions/{uid}')
+        resource = mock.Mock(uid=uid)
+        resource.in_progress.return_value = False
+        return resource
+
+    collection = mock.Mock()
+    collection.get.side_effect = get
+    missing, found = mock.Mock(uid='missing'), mock.Mock(uid='found')
+
+    failed, succeeded = wait_for_all([missing, found], collection, interval=1.0)
+    with pytest.raises(NotFound):
+        failed.result()
+    assert succeeded.result().uid == 'found'
@@ -11,7 +11,7 @@ from citrine.resources.audit_info import AuditInfo
 from citrine.resources.data_concepts import DataConcepts, _make_link_by_uid, CITRINE_SCOPE, DataConceptsCollection
 from citrine.resources.process_run import ProcessRun
 from citrine.resources.process_spec import ProcessSpec, ProcessSpecCollection
-from tests.utils.session import FakeCall, FakeSession
+from tests.utils.session import FakeCall, FakeSession, make_fake_cursor_request_function
 
 
 def run_noop_gemd_relation_search_test(search_for, search_with, collection, search_fn, per_page=100):
@@ -87,3 +87,89 @@ def test_get_type():
 
     assert DataConcepts.get_type({"type": "process_run"}) == ProcessRun
     assert DataConcepts.get_type(ProcessSpec("foo")) == ProcessSpec
+
+
+def test_parallel_team_listing():
+    """Team-wide listings can be fanned out over the readable datasets."""
+    dataset_ids = [str(uuid4()) for _ in range(4)]
+    by_dataset = {
+        dataset_id: [ProcessSpec(f"spec {i} in {dataset_id}").dump() for i in range(7)]
+        for dataset_id in dataset_ids
+    }
+    cursors = {dataset_id: make_fake_cursor_request_function(specs)
+               for dataset_id, specs in by_dataset.items()}
+    calls = []
+
+    def fake_get_resource(path, params=None, **kwargs):
+        calls.append((path, dict(params)))
+        if path.endswith('authorized-ids'):
+            assert params['action'] == 'READ'
+            return {'ids': dataset_ids}
+        assert 'dataset_id' in params
+        return cursors[params['dataset_id']](path, params=params, **kwargs)
+
+    session = FakeSession()
+    session.get_resource = fake_get_resource
+    collection = ProcessSpecCollection(team_id=uuid4(), dataset_id=None, session=session)
+
+    expected = [spec['name'] for dataset_id in dataset_ids for spec in by_dataset[dataset_id]]
+
+    unconsumed = collection.list(max_workers=2)
+    assert calls == [], "Datasets should only be looked up once iteration begins"
+    unconsumed.close()
+
+    ordered = [spec.name for spec in collection.list(per_page=3, max_workers=2, preserve_order=True)]
+    assert ordered == expected
+
+    unordered = [spec.name for spec in collection.list_by_tag('foo', per_page=3, max_workers=3)]
+    assert sorted(unordered) == sorted(expected)
+    for dataset_id in dataset_ids:  # each dataset's own order is kept
+        assert [name for name in unordered if name.endswith(dataset_id)] == \
+            [spec['name'] for spec in by_dataset[dataset_id]]
+    assert all(params['tags'] == ['foo'] for path, params in calls[-len(dataset_ids) * 3:])
+
+    calls.clear()
+    related = collection.list_by_template(uuid4(), max_workers=4, preserve_order=True)
+    assert [spec.name for spec in related] == expected
+    searched = [params['dataset_id'] for path, params in calls if '/process-templates/' in path]
+    assert sorted(set(searched)) == sorted(dataset_ids)
+
+    # Without max_workers, a single team-wide cursor is used
+    calls.clear()
+    session.get_resource = lambda path, params=None, **kwargs: calls.append(params) or {'contents': []}
+    assert list(collection.list()) == []
+    assert calls == [{'forward': True, 'ascending': True, 'per_page': 100}]
+
+
+def test_listing_is_lazy_without_page_size():
+    """Without a page size, objects are still built and yielded a page at a time."""
+    specs = [ProcessSpec(f"spec {i}").dump() for i in range(250)]
+    cursor = make_fake_cursor_request_function(specs)
+    calls = []
+
+    def fake_get_resource(path, params=None, **kwargs):
+        calls.append(dict(params))
+        assert params['per_page'] is None
+        return cursor(path, params={**params, 'per_page': 100}, **kwargs)  # The server default
+
+    session = FakeSession()
+    session.get_resource = fake_get_resource
+    collection = ProcessSpecCollection(team_id=uuid4(), dataset_id=uuid4(), session=session)
+
+    listing = collection.list(per_page=None)
+    assert next(listing).name == "spec 0"
+    assert len(calls) == 1
+    assert [spec.name for spec in listing] == [spec['name'] for spec in specs[1:]]
+
+
+def test_parallel_listing_propagates_errors():
+    def fake_get_resource(path, params=None, **kwargs):
+        if path.endswith('authorized-ids'):
+            return {'ids': [str(uuid4())]}
+        raise ValueError("Listing failed")
+
+    session = FakeSession()
+    session.get_resource = fake_get_resource
+    collection = ProcessSpecCollection(team_id=uuid4(), dataset_id=None, session=session)
+    with pytest.raises(ValueError, match="Listing failed"):
+        list(collection.list(max_workers=2))
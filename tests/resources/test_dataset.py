@@ -376,6 +376,13 @@ def test_gemd_posts(dataset):
             assert pair in seen_ids  # registered items have the same ids
 
 
+def test_register_stream(dataset):
+    objects = flatten(make_cake())
+    after = list(dataset.register_stream(iter(objects), batch_size=20))
+    assert [x.uids for x in after] == [x.uids for x in objects]
+    assert dataset.session.num_calls == -(-len(objects) // 20)
+
+
 def test_register_all_nested(dataset):
     cake = make_cake()
     after = dataset.register_all([cake], include_nested=True)
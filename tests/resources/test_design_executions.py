@@ -117,6 +117,17 @@ def test_workflow_execution_hierarchical_results(workflow_execution: DesignExecu
     assert session.last_call == FakeCall(method='GET', path=expected_path, params={"per_page": 4, 'page': 1})
 
 
+def test_workflow_execution_results_prefetched(workflow_execution: DesignExecution, session,
+                                               example_candidates, example_hierarchical_candidates):
+    session.set_response(example_candidates)
+    assert len(list(workflow_execution.candidates(per_page=4, prefetch=2))) == \
+        len(example_candidates['response'])
+
+    session.set_response(example_hierarchical_candidates)
+    assert len(list(workflow_execution.hierarchical_candidates(per_page=4, prefetch=2))) == \
+        len(example_hierarchical_candidates['response'])
+
+
 def test_workflow_execution_results_pinned(workflow_execution: DesignExecution, session, example_candidates):
     # Given
     pinned_by = uuid.uuid4()
@@ -205,6 +205,33 @@ def test_build_from_config(collection: GemTableCollection, session):
     assert session.num_calls == 4
 
 
+def test_build_from_config_future(collection: GemTableCollection, session):
+    expected_table_data = GemTableDataFactory()
+    session.set_responses(
+        {'job_id': '12345678-1234-1234-1234-123456789ccc'},
+        {'job_type': 'foo', 'status': 'Success', 'tasks': [], 'output': {
+            'display_table_id': expected_table_data['id'],
+            'display_table_version': str(expected_table_data['version']),
+        }},
+        expected_table_data,
+    )
+    future = collection.build_from_config_future(uuid4(), version=1)
+    gem_table = future.result(timeout=5)
+    assert isinstance(gem_table, GemTable)
+    assert str(gem_table.uid) == expected_table_data['id']
+    assert session.num_calls == 3
+
+    session.set_responses(
+        {'job_id': '12345678-1234-1234-1234-123456789ccc'},
+        {'job_type': 'foo', 'status': 'Failure', 'tasks': [
+            {'task_type': 'foo', 'id': 'foo', 'status': 'Failure', 'failure_reason': 'because', 'dependencies': []}
+        ]},
+    )
+    future = collection.build_from_config_future(uuid4(), version=1)
+    with pytest.raises(JobFailureError):
+        future.result(timeout=5)
+
+
 def test_build_from_config_failures(collection: GemTableCollection, session):
     with pytest.raises(ValueError):
         collection.build_from_config(uuid4())
@@ -1,8 +1,13 @@
+import json
 import random
+from pathlib import Path
+from threading import Barrier
 from uuid import uuid4, UUID
 from os.path import basename
 
+import mock
 import pytest
+from requests.exceptions import RetryError
 
 from gemd.entity.bounds.integer_bounds import IntegerBounds
 from gemd.entity.attribute import Property, Condition, Parameter, PropertyAndConditions
@@ -23,11 +28,12 @@ from gemd.entity.template.condition_template import ConditionTemplate as GemdCon
 from gemd.entity.template.parameter_template import ParameterTemplate as GemdParameterTemplate
 from gemd.entity.template.property_template import PropertyTemplate as GemdPropertyTemplate
 
-from citrine.exceptions import PollingTimeoutError, JobFailureError
+from citrine.exceptions import PollingTimeoutError, JobFailureError, PayloadTooLarge
 from citrine.resources.api_error import ApiError, ValidationError
 from citrine.resources.audit_info import AuditInfo
 from citrine.resources.condition_template import ConditionTemplate
 from citrine.resources.data_concepts import DataConcepts, CITRINE_SCOPE, CITRINE_TAG_PREFIX
+from citrine.resources import gemd_resource
 from citrine.resources.gemd_resource import GEMDResourceCollection
 from citrine.resources.ingredient_run import IngredientRun
 from citrine.resources.ingredient_spec import IngredientSpec
@@ -42,7 +48,10 @@ from citrine.resources.process_run import ProcessRun
 from citrine.resources.process_spec import ProcessSpec
 from citrine.resources.process_template import ProcessTemplate
 from citrine.resources.property_template import PropertyTemplate
+from citrine._utils.batcher import BatchSizer
 from citrine._utils.functions import format_escaped_url
+from citrine._utils.journal import RegistrationJournal
+from citrine._utils.registration_cache import RegistrationCache
 
 from tests.utils.factories import MaterialRunDataFactory, MaterialSpecDataFactory
 from tests.utils.factories import JobSubmissionResponseDataFactory
@@ -343,6 +352,309 @@ def test_register_all_dry_run(gemd_collection):
         assert x in result_obj
 
 
+def test_register_all_concurrently(gemd_collection, session):
+    """Concurrent submission registers the same objects as a sequential run."""
+    bounds = IntegerBounds(0, 1)
+    properties = [PropertyTemplate(f"prop {i}", bounds=bounds) for i in range(130)]
+    materials = [MaterialTemplate(f"mat {i}", properties=[[prop, bounds]])
+                 for i, prop in enumerate(properties)]
+    models = materials + properties
+
+    registered = gemd_collection.register_all(models, max_workers=4)
+
+    assert [x.name for x in registered] == [x.name for x in properties + materials]
+    assert all(CITRINE_SCOPE in obj.uids for obj in models)
+    for model, result in zip(properties + materials, registered):
+        assert model.uids == result.uids
+
+    batch_calls = [call for call in session.calls if call.path.endswith('/batch')]
+    assert len(batch_calls) == 6
+    # Every property template batch is sent before any material template batch
+    first_material = next(i for i, call in enumerate(batch_calls)
+                          if call.json['objects'][0]['type'] == 'material_template')
+    assert all(obj['type'] == 'property_template'
+               for call in batch_calls[:first_material] for obj in call.json['objects'])
+
+    dry_run = gemd_collection.register_all(models, dry_run=True, max_workers=4)
+    assert len(dry_run) >= len(models)
+
+
+def test_register_all_serializes_lazily(gemd_collection, session, monkeypatch):
+    """Without a batch sizer, each batch is serialized as it is sent, and isn't measured."""
+    sent_before = []
+    serialize = gemd_resource.registration_payload
+
+    def registration_payload(model):
+        sent_before.append(len(session.calls))
+        return serialize(model)
+
+    monkeypatch.setattr(gemd_resource, 'registration_payload', registration_payload)
+    monkeypatch.setattr(gemd_resource, 'json', mock.Mock(wraps=json))
+    bounds = IntegerBounds(0, 1)
+    gemd_collection.register_all([PropertyTemplate(f"prop {i}", bounds=bounds)
+                                  for i in range(120)])
+    assert sent_before == [i // 50 for i in range(120)]
+    gemd_resource.json.dumps.assert_not_called()
+
+class LimitedBatchSession(FakeSession):
+    """A FakeSession that rejects batches holding more than `limit` objects."""
+
+    def __init__(self, limit: int, error=None):
+        super().__init__()
+        self.limit = limit
+        self.error = error
+
+    def checked_put(self, path: str, json: dict, **kwargs) -> dict:
+        if len(json['objects']) > self.limit:
+            self.calls.append(FakeCall('PUT', path, json, **kwargs))
+            raise self.error or PayloadTooLarge(path)
+        return super().checked_put(path, json, **kwargs)
+
+
+def test_register_all_batch_sizer(gemd_collection):
+    """An adaptive batch size splits rejected batches and records every submission."""
+    session = LimitedBatchSession(limit=8)
+    gemd_collection.session = session
+    bounds = IntegerBounds(0, 1)
+    properties = [PropertyTemplate(f"prop {i}", bounds=bounds) for i in range(20)]
+    conditions = [ConditionTemplate(f"cond {i}", bounds=bounds) for i in range(10)]
+    materials = [MaterialTemplate(f"mat {i}", properties=[[prop, bounds]])
+                 for i, prop in enumerate(properties)]
+    models = materials + conditions + properties
+
+    sizer = BatchSizer(initial_size=16, max_size=64)
+    registered = gemd_collection.register_all(models, max_workers=2, batch_sizer=sizer,
+                                              status_bar=True)
+
+    assert {x.name for x in registered} == {x.name for x in models}
+    assert len(registered) == len(models)
+    assert all(CITRINE_SCOPE in obj.uids for obj in models)
+    # The first round of 16-object batches is rejected; only batches that fit get through
+    assert [r.succeeded for r in sizer.history[:2]] == [False, False]
+    assert all(r.count <= 8 and r.nbytes > 0 for r in sizer.history if r.succeeded)
+    assert all(r.count > 8 for r in sizer.history if not r.succeeded)
+    assert sum(r.count for r in sizer.history if r.succeeded) == len(models)
+    # Templates are all registered before the materials that reference them
+    batch_objects = [obj for call in session.calls if call.path.endswith('/batch')
+                     for obj in call.json['objects']
+                     if len(call.json['objects']) <= 8]
+    first_material = next(i for i, obj in enumerate(batch_objects)
+                          if obj['type'] == 'material_template')
+    assert all(obj['type'] == 'material_template' for obj in batch_objects[first_material:])
+
+    # Byte limits apply as well
+    sizer = BatchSizer(initial_size=8, max_bytes=1)
+    gemd_collection.register_all(properties, batch_sizer=sizer)
+    assert all(r.count == 1 for r in sizer.history)
+
+    # Dry runs use the current size without adapting it
+    sizer = BatchSizer(initial_size=4)
+    gemd_collection.register_all(properties, dry_run=True, batch_sizer=sizer)
+    assert sizer.size == 4
+    assert sizer.history and all(r.count <= 4 for r in sizer.history)
+
+
+def test_register_all_batch_sizer_rejected(gemd_collection):
+    """A single object that is rejected raises the error."""
+    gemd_collection.session = LimitedBatchSession(limit=0)
+    models = [PropertyTemplate(f"prop {i}", bounds=IntegerBounds(0, 1)) for i in range(3)]
+    sizer = BatchSizer(initial_size=2)
+    with pytest.raises(PayloadTooLarge):
+        gemd_collection.register_all(models, batch_sizer=sizer)
+    assert [r.count for r in sizer.history] == [2]
+
+    gemd_collection.session = LimitedBatchSession(limit=0, error=RetryError("timed out"))
+    with pytest.raises(RetryError):
+        gemd_collection.register_all(models, batch_sizer=BatchSizer(initial_size=1))
+
+
+class FailingSession(FakeSession):
+    """
+    A FakeSession that fails on the batch starting with `fail_on`, and tags what it registers.
+
+    If `concurrent` is given, that many batches must be in flight before any of them returns.
+    """
+
+    def __init__(self, fail_on: str, field: str = 'name', concurrent: int | None = None):
+        super().__init__()
+        self.fail_on = fail_on
+        self.field = field
+        self.started = None if concurrent is None else Barrier(concurrent)
+
+    def checked_put(self, path: str, json: dict, **kwargs) -> dict:
+        if self.started is not None:
+            self.started.wait(timeout=10)
+        if json['objects'][0][self.field] == self.fail_on:
+            self.calls.append(FakeCall('PUT', path, json, **kwargs))
+            raise ConnectionError("VPN dropped")
+        response = super().checked_put(path, json, **kwargs)
+        return {'objects': [{**obj, 'tags': ['registered']} for obj in response['objects']]}
+
+
+def make_journal_models():
+    """Make objects that register_all sends in three batches that don't depend on each other."""
+    bounds = IntegerBounds(0, 1)
+    props = [PropertyTemplate(f"prop {i}", bounds=bounds) for i in range(100)]
+    conds = [ConditionTemplate(f"cond {i}", bounds=bounds) for i in range(30)]
+    return props + conds
+
+
+def test_register_all_partial_failure(gemd_collection):
+    """Batches that succeed alongside a failed one still update the local objects."""
+    gemd_collection.session = FailingSession(fail_on='prop 50', concurrent=3)
+    models = make_journal_models()
+    with pytest.raises(ConnectionError):
+        gemd_collection.register_all(models, max_workers=3)
+    assert sorted(len(call.json['objects']) for call in gemd_collection.session.calls) == \
+        [30, 50, 50]
+    tagged = [obj.name for obj in models if obj.tags == ['registered']]
+    assert tagged == [obj.name for obj in models[:50] + models[100:]], \
+        "Both written batches should be ingested"
+
+    gemd_collection.session = FailingSession(fail_on='prop 50', concurrent=3)
+    models = make_journal_models()
+    with pytest.raises(ConnectionError):
+        gemd_collection.register_all(models, max_workers=3,
+                                     batch_sizer=BatchSizer(initial_size=50))
+    assert [obj.name for obj in models if obj.tags == ['registered']] == \
+        [obj.name for obj in models[:50] + models[100:]]
+
+    # Sequentially, nothing is sent after the failed batch
+    gemd_collection.session = FailingSession(fail_on='prop 50')
+    models = make_journal_models()
+    with pytest.raises(ConnectionError):
+        gemd_collection.register_all(models)
+    assert [len(call.json['objects']) for call in gemd_collection.session.calls] == [50, 50]
+    assert [obj.name for obj in models if obj.tags == ['registered']] == \
+        [obj.name for obj in models[:50]]
+
+    # Concurrently, batches that haven't been submitted when one fails are never sent
+    gemd_collection.session = FailingSession(fail_on='prop 0', concurrent=2)
+    models = make_journal_models()
+    with pytest.raises(ConnectionError):
+        gemd_collection.register_all(models, max_workers=2)
+    assert [len(call.json['objects']) for call in gemd_collection.session.calls] == [50, 50]
+
+
+def test_register_all_journal(gemd_collection, tmpdir):
+    """A journaled registration resumes where an interrupted attempt stopped."""
+    path = Path(tmpdir) / "journal.jsonl"
+
+    gemd_collection.session = FailingSession(fail_on='prop 50', concurrent=3)
+    first = make_journal_models()
+    with pytest.raises(ConnectionError):
+        gemd_collection.register_all(first, max_workers=3, journal=RegistrationJournal(path))
+    registered = {obj.name: obj.uids[CITRINE_SCOPE] for obj in first
+                  if obj.uids[CITRINE_SCOPE] in path.read_text()}
+    assert len(registered) == 80, "Both acknowledged batches should be journaled"
+
+    session = FakeSession()
+    gemd_collection.session = session
+    second = make_journal_models()
+    results = gemd_collection.register_all(second, journal=RegistrationJournal(path))
+    assert len(results) == len(second)
+    assert [len(call.json['objects']) for call in session.calls] == [50], \
+        "Only the failed batch should be sent"
+    assert {obj['name'] for obj in session.calls[0].json['objects']} == \
+        {obj.name for obj in first[50:100]}
+    for obj in second:
+        if obj.name in registered:
+            assert obj.uids[CITRINE_SCOPE] == registered[obj.name], "uids should be restored"
+    assert len(RegistrationJournal(path)) == len(second)
+
+    with pytest.raises(ValueError):
+        gemd_collection.register_all(second, dry_run=True, journal=RegistrationJournal(path))
+
+
+def test_register_all_journal_lookalikes(gemd_collection, tmpdir):
+    """Objects that look alike are resumed as the same objects they were journaled as."""
+    path = Path(tmpdir) / "journal.jsonl"
+
+    gemd_collection.session = FailingSession(fail_on='50', field='notes', concurrent=3)
+    first = [ProcessSpec("same", notes=str(i)) for i in range(150)]
+    with pytest.raises(ConnectionError):
+        gemd_collection.register_all(first, max_workers=3, journal=RegistrationJournal(path))
+
+    session = FakeSession()
+    gemd_collection.session = session
+    second = [ProcessSpec("same", notes=str(i)) for i in range(150)]
+    gemd_collection.register_all(second, journal=RegistrationJournal(path))
+    assert [obj['notes'] for call in session.calls for obj in call.json['objects']] == \
+        [str(i) for i in range(50, 100)], "Only the failed batch should be sent"
+    for before, after in zip(first[:50] + first[100:], second[:50] + second[100:]):
+        assert after.uids == before.uids, "uids should be restored onto the same objects"
+
+def test_register_all_cache(gemd_collection, session, tmpdir):
+    """Objects that are unchanged since they were last registered are skipped."""
+    path = Path(tmpdir) / "cache.sqlite"
+
+    def make_models(changed: int):
+        bounds = IntegerBounds(0, 1)
+        return [PropertyTemplate(f"prop {i}", bounds=bounds, uids={"lims": str(i)},
+                                 description="changed" if i == changed else None)
+                for i in range(10)]
+
+    with RegistrationCache(path) as cache:
+        first = make_models(changed=-1)
+        assert len(gemd_collection.register_all(first, cache=cache)) == 10
+        assert cache.skipped == 0
+        assert len(cache) == 10
+
+        session.calls.clear()
+        second = make_models(changed=3)
+        results = gemd_collection.register_all(second, cache=cache)
+        assert cache.skipped == 9
+        assert len(results) == 10
+        assert [obj['uids']['lims'] for call in session.calls for obj in call.json['objects']] \
+            == ['3']
+        assert [obj.uids for obj in second] == [obj.uids for obj in first]
+
+        with pytest.raises(ValueError):
+            gemd_collection.register_all(second, dry_run=True, cache=cache)
+
+
+def test_register_stream(gemd_collection, session):
+    """Streaming registers objects in load order, a batch at a time, as results are consumed."""
+    bounds = IntegerBounds(0, 1)
+    consumed = []
+
+    def generate():
+        for i in range(7):
+            prop = PropertyTemplate(f"prop {i}", bounds=bounds)
+            material = MaterialTemplate(f"mat {i}", properties=[[prop, bounds]])
+            consumed.extend([prop, material])
+            yield prop
+            yield material
+
+    stream = gemd_collection.register_stream(generate(), batch_size=4, status_bar=True)
+    assert session.num_calls == 0, "Nothing should be registered before iteration"
+
+    first = next(stream)
+    assert first.name == "prop 0"
+    assert session.num_calls == 1
+    assert len(consumed) == 4, "Only one batch should have been drawn from the generator"
+
+    registered = [first] + list(stream)
+    assert [x.name for x in registered] == [x.name for x in consumed]
+    assert session.num_calls == 4
+    assert [len(call.json['objects']) for call in session.calls] == [4, 4, 4, 2]
+    assert all(call.params == {'dry_run': False} for call in session.calls)
+    for model, result in zip(consumed, registered):
+        assert CITRINE_SCOPE in model.uids
+        assert model.uids == result.uids
+    # References across batches are sent as links
+    material = session.calls[2].json['objects'][1]
+    assert material['type'] == 'material_template'
+    assert material['properties'][0][0]['type'] == LinkByUID.typ
+
+    assert list(gemd_collection.register_stream([])) == []
+    with pytest.raises(ValueError):
+        gemd_collection.register_stream([], batch_size=0)
+    with pytest.raises(RuntimeError):
+        GEMDResourceCollection(team_id=uuid4(), dataset_id=None, session=session) \
+            .register_stream([])
+
+
 def test_register_all_object_update(gemd_collection):
     """Check that uids of gemd-python objects get updated"""
     process = GemdProcessSpec("process")
@@ -484,6 +796,28 @@ def test_async_update_and_wait_failure(gemd_collection, session):
         gemd_collection.async_update(obj, wait_for_response=True)
 
 
+def test_async_update_future(gemd_collection, session):
+    """Check that async_update_future waits for the update in the background"""
+
+    obj = ProcessTemplate(
+        "foo",
+        uids={'id': str(uuid4())}
+    )
+    success = {'job_type': 'some_typ', 'status': 'Success', 'tasks': [], 'output': {}}
+
+    session.set_responses(JobSubmissionResponseDataFactory(), success)
+    assert gemd_collection.async_update_future(obj).result(timeout=5) is None
+
+    session.set_responses(JobSubmissionResponseDataFactory(), success, obj.dump())
+    updated = gemd_collection.async_update_future(obj, return_model=True).result(timeout=5)
+    assert updated.name == "foo"
+    assert session.last_call.method == 'GET'
+
+    session.set_responses(JobSubmissionResponseDataFactory(), {**success, 'status': 'Failure'})
+    with pytest.raises(JobFailureError):
+        gemd_collection.async_update_future(obj, dry_run=True).result(timeout=5)
+
+
 def test_async_update_with_no_wait(gemd_collection, session):
     """Check that async_update parses the response when not waiting"""
 
@@ -2,7 +2,7 @@ import pytest
 from uuid import uuid4, UUID
 
 from citrine._session import Session
-from citrine.exceptions import BadRequest
+from citrine.exceptions import BadRequest, PollingTimeoutError
 from citrine.resources.api_error import ValidationError
 from citrine.resources.dataset import Dataset
 from citrine.resources.file_link import FileLink
@@ -10,7 +10,7 @@ from citrine.resources.ingestion import (
     Ingestion, IngestionCollection, IngestionStatus, IngestionStatusType, IngestionException,
     IngestionErrorTrace, IngestionErrorType, IngestionErrorFamily, IngestionErrorLevel
 )
-from citrine.jobs.job import JobSubmissionResponse, JobStatusResponse, JobFailureError
+from citrine.jobs.job import JobSubmissionResponse, JobStatus, JobStatusResponse, JobFailureError
 from citrine.resources.project import Project
 
 from tests.utils.factories import (
@@ -275,6 +275,50 @@ def test_ingestion_with_table_build(session: FakeSession,
     assert status.success
 
 
+def test_build_objects_future(session: FakeSession, ingest: Ingestion):
+    validation_error = ValidationError.build({"failure_message": "you failed", "failure_id": "failure_id"})
+    table_job = str(uuid4())
+    session.set_responses(
+        JobSubmissionResponseDataFactory(),
+        JobStatusResponseDataFactory(output={'table_build_job_id': table_job}),
+        {'job_type': 'build', 'status': JobStatus.RUNNING, 'tasks': []},
+        JobStatusResponseDataFactory(),
+        IngestionStatusResponseDataFactory()
+    )
+    future = ingest.build_objects_future(build_table=True, project=uuid4())
+    assert future.result(timeout=5).success
+    assert session.calls[2].params == {'job_id': table_job}
+    assert session.num_calls == 5
+
+    ingest.raise_errors = True
+    session.set_responses(
+        JobSubmissionResponseDataFactory(),
+        JobStatusResponseDataFactory(failure=True),
+        {"status": IngestionStatusType.INGESTION_CREATED, "errors": [IngestionErrorTrace("Sad").dump()]}
+    )
+    with pytest.raises(IngestionException, match="Sad"):
+        ingest.build_objects_future(timeout=10).result(timeout=5)
+
+    session.set_response(BadRequest("path", FakeRequestResponseApiError(400, "Bad Request", [validation_error])))
+    with pytest.raises(IngestionException, match="you failed"):
+        ingest.build_objects_future()
+    ingest.raise_errors = False
+    assert not ingest.build_objects_future().result(timeout=5).success
+
+
+def test_build_objects_future_timeout(session: FakeSession, ingest: Ingestion):
+    submission = JobSubmissionResponseDataFactory()
+    table_job = str(uuid4())
+    session.set_responses(
+        submission,
+        JobStatusResponseDataFactory(output={'table_build_job_id': table_job}),
+        {'job_type': 'build', 'status': JobStatus.RUNNING, 'tasks': []}
+    )
+    future = ingest.build_objects_future(build_table=True, project=uuid4(), timeout=0.5)
+    with pytest.raises(PollingTimeoutError, match=f"{submission['job_id']}, {table_job}"):
+        future.result(timeout=5)
+
+
 def test_ingestion_flow(session: FakeSession,
                         ingest: Ingestion,
                         collection: IngestionCollection,
@@ -309,6 +353,7 @@ def test_ingestion_flow(session: FakeSession,
         m.setattr(Session, 'request', _raise_exception)
         assert not failed.status().success
         assert not failed.build_objects().success
+        assert not failed.build_objects_future().result().success
         with pytest.raises(JobFailureError):
             assert not failed.build_objects_async()
         with pytest.raises(JobFailureError):
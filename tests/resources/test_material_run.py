@@ -70,6 +70,16 @@ def test_register_all(collection, session):
         MaterialRunCollection(team_id=collection.team_id, dataset_id=None, session=session).register_all([])
 
 
+def test_register_stream(collection, session):
+    runs = [MaterialRunFactory(name='1'), MaterialRunFactory(name='2'), MaterialRunFactory(name='3')]
+    session.set_response({'objects': [r.dump() for r in runs]})
+    registered = list(collection.register_stream(iter(runs), batch_size=3))
+    assert [r.name for r in runs] == [r.name for r in registered]
+    assert len(session.calls) == 1
+    assert session.calls[0].method == 'PUT'
+    assert session.calls[0].path.endswith('/batch')
+
+
 def test_dry_run_register_material_run(collection, session):
     # Given
     session.set_response(MaterialRunDataFactory(name='Test MR 123'))
@@ -260,6 +270,12 @@ def test_cursor_paginated_searches(collection, session):
     assert len(list(collection.list_by_attribute_bounds(
         {LinkByUIDFactory(): IntegerBounds(1, 5)}, per_page=2))) == len(all_runs)
 
+    # read-ahead does not change the results
+    names = [run['name'] for run in all_runs]
+    assert [r.name for r in collection.list_by_name('unused', per_page=3, prefetch=2)] == names
+    assert [r.name for r in collection.list(per_page=3, prefetch=2)] == names
+    assert [r.name for r in collection.list_by_tag('unused', per_page=3, prefetch=2)] == names
+
     # invalid inputs
     with pytest.raises(TypeError):
         collection.list_by_attribute_bounds([1, 5], per_page=2)
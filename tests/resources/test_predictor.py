@@ -13,6 +13,8 @@ from citrine.informatics.predictors import (
     GraphPredictor,
     SimpleMixturePredictor
 )
+from citrine.jobs import polling
+from citrine.jobs.polling import Backoff
 from citrine.resources.predictor import PredictorCollection, _PredictorVersionCollection, AutoConfigureMode
 from tests.conftest import build_predictor_entity
 from tests.utils.session import (
@@ -259,6 +261,27 @@ def test_register_update_checks_status(valid_graph_predictor_data):
     assert session.num_calls == 2
 
 
+def test_register_future(valid_graph_predictor_data, monkeypatch):
+    """A registered predictor should be trained in the background, and resolve once trained."""
+    monkeypatch.setattr(polling, '_default_backoff', Backoff.constant(0.01))
+    session = FakeSession()
+    pc = PredictorCollection(uuid.uuid4(), session)
+
+    instance = deepcopy(valid_graph_predictor_data)["data"]["instance"]
+    training = build_predictor_entity(instance, status_name="VALIDATING")
+    ready = build_predictor_entity(instance)
+    session.set_responses(training, training, training, ready)
+    future = pc.register_future(pc.build(training))
+    assert future.result(timeout=5).status == "READY"
+    assert session.num_calls == 4
+
+    invalid = build_predictor_entity(instance, status_name="INVALID")
+    session.set_responses(invalid)
+    future = pc.register_future(pc.build(ready))
+    assert future.done()
+    assert future.result().failed()
+
+
 def test_train(valid_graph_predictor_data):
     session = FakeSession()
     pc = PredictorCollection(uuid.uuid4(), session)
@@ -328,6 +351,22 @@ def test_list_all(valid_graph_predictor_data, valid_graph_predictor_data_empty):
     assert len(predictors) == 2
 
 
+def test_list_lazy(valid_graph_predictor_data):
+    from citrine._serialization.lazy import Deferred
+
+    session = FakeSession()
+    collection = PredictorCollection(uuid.uuid4(), session)
+    session.set_response({'response': [valid_graph_predictor_data]})
+    eager = next(iter(collection.list()))
+    session.set_response({'response': [valid_graph_predictor_data]})
+
+    predictor = next(iter(collection.list(lazy=True)))
+
+    assert any(isinstance(value, Deferred) for value in vars(predictor).values())
+    assert predictor.name == eager.name
+    assert predictor.dump() == eager.dump()
+
+
 def test_list_archived(valid_graph_predictor_data):
     # Given
     session = FakeSession()
@@ -260,8 +260,8 @@ def test_wait():
     session = FakeSession()
     pec = PredictorEvaluationCollection(uuid.uuid4(), session)
     
-    # wait_while_executing makes two additional calls once it's done polling.
-    responses = 4 * [in_progress_response] + 3 * [completed_response]
+    # wait_while_executing stops fetching as soon as it sees the evaluation has completed.
+    responses = 4 * [in_progress_response] + [completed_response]
     session.set_responses(*responses)
 
     evaluation = pec.build(in_progress_response)
@@ -5,6 +5,7 @@ from mock import Mock
 import pytest
 
 from citrine._rest.paginator import Paginator
+from citrine._serialization.interning import intern_string
 
 
 class DummyResource:
@@ -51,6 +52,37 @@ def test_pagination_deduplicates_repeated_intermediate_values():
     assert list(result) == [a, b, c]
 
 
+def test_prefetched_pagination_matches_sequential():
+    result = Paginator().paginate(mocked_fetcher(a, b, b, c, c), lambda x: x, per_page=1, prefetch=2)
+    assert list(result) == [a, b, c]
+
+
+def test_prefetched_pagination_stops_after_short_page():
+    fetcher = Mock(side_effect=[([a, b], "next_uri"), ([c], ""), AssertionError("past the end")])
+    result = Paginator().paginate(fetcher, lambda x: x, per_page=2, prefetch=3)
+    assert list(result) == [a, b, c]
+    assert fetcher.call_count == 2
+
+
+def test_prefetched_pagination_propagates_errors():
+    fetcher = Mock(side_effect=[([a], "next_uri"), ValueError("fetch failed")])
+    result = Paginator().paginate(fetcher, lambda x: x, per_page=1, prefetch=1)
+    assert next(result) == a
+    with pytest.raises(ValueError):
+        next(result)
+
+
+def test_pagination_shares_strings_across_pages():
+    def build(collection):
+        return (DummyResource(intern_string(''.join(['v', val]))) for val in collection)
+
+    result = list(Paginator().paginate(mocked_fetcher("a", "b", "a"), build, per_page=1,
+                                       deduplicate=False))
+    assert [resource.val for resource in result] == ["va", "vb", "va"]
+    assert result[0].val is result[2].val
+    assert intern_string(''.join(['v', 'a'])) is not result[0].val
+
+
 def mocked_fetcher(*args):
     """
     Take a list of arguments, and return them (wrapped in a list) in subsequent calls to this mock.
@@ -1,11 +1,13 @@
+import asyncio
 import platform
 from datetime import datetime, timezone
 
 import jwt
 import pytest
 import requests_mock
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
 
-from citrine import Citrine
+from citrine import AsyncCitrine, Citrine
 
 
 def refresh_token(expiration: datetime = None) -> dict:
@@ -53,6 +55,25 @@ def test_citrine_signature(monkeypatch):
         Citrine()
 
 
+def test_citrine_pool_options():
+    with requests_mock.Mocker() as m:
+        m.post('https://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
+        citrine = Citrine(api_key='foo', host='citrine-testing.fake', pool_maxsize=32)
+        default = Citrine(api_key='foo', host='citrine-testing.fake')
+
+    assert citrine.session.get_adapter('https://citrine-testing.fake')._pool_maxsize == 32
+    adapter = default.session.get_adapter('https://citrine-testing.fake')
+    assert adapter._pool_maxsize == DEFAULT_POOLSIZE
+    assert adapter._pool_block == DEFAULT_POOLBLOCK
+
+
+def test_citrine_trusted_build():
+    with requests_mock.Mocker() as m:
+        m.post('https://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
+        assert Citrine(api_key='foo', host='citrine-testing.fake', trusted_build=True).session.trusted_build
+        assert not Citrine(api_key='foo', host='citrine-testing.fake').session.trusted_build
+
+
 def test_citrine_project_session():
     with requests_mock.Mocker() as m:
         m.post('https://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
@@ -103,3 +124,30 @@ def test_citrine_user_agent():
             # enforce them to be ints.  It's common to see strings used
             # as the patch version
             assert len(product_version.split('.')) == 3
+
+
+def test_async_citrine_signature(monkeypatch):
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake:8080/api/v1/tokens/refresh', json=token_refresh_response)
+        citrine = AsyncCitrine(api_key='1234', scheme='http', host='citrine-testing.fake',
+                               port="8080", max_workers=2)
+    assert '1234' == citrine.session.session.refresh_token
+    assert citrine.max_workers == 2
+    citrine.close()
+
+    with requests_mock.Mocker() as m:
+        patched_key = "5678"
+        patched_host = "monkeypatch.citrine-testing.fake"
+        monkeypatch.setenv("CITRINE_API_KEY", patched_key)
+        monkeypatch.setenv("CITRINE_API_HOST", patched_host)
+        m.post(f'https://{patched_host}/api/v1/tokens/refresh', json=token_refresh_response)
+
+        async def go():
+            async with AsyncCitrine() as citrine:
+                return citrine.session.session.refresh_token
+
+        assert patched_key == asyncio.run(go())
+
+    monkeypatch.delenv("CITRINE_API_HOST")
+    with pytest.raises(ValueError):
+        AsyncCitrine()
@@ -1,3 +1,10 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import jwt
 from datetime import datetime, timedelta, timezone
 
@@ -6,18 +13,22 @@ import requests
 import requests_mock
 import pytest
 
-from citrine._session import Session
+from citrine._session import AsyncSession, Session, deferring_retry_after
 from citrine.exceptions import (
     BadRequest,
     Conflict,
     NonRetryableException,
     NotFound,
+    PayloadTooLarge,
     RetryableException,
+    TooManyRequests,
     WorkflowNotReadyException,
     Unauthorized,
     UnauthorizedRefreshToken, 
 )
 
+from citrine.jobs.polling import Backoff, Poller
+
 from tests.utils.session import make_fake_cursor_request_function
 
 
@@ -91,6 +102,51 @@ def test_get_refreshes_token(session: Session):
     assert datetime(2019, 3, 14, tzinfo=timezone.utc) == session.access_token_expiration
 
 
+def test_pool_options():
+    token_refresh_response = refresh_token(datetime(2019, 3, 14, tzinfo=timezone.utc))
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
+        session = Session(refresh_token='12345', scheme='http', host='citrine-testing.fake',
+                          pool_maxsize=64, pool_block=True)
+
+    adapter = session.get_adapter('http://citrine-testing.fake')
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+
+
+@pytest.mark.parametrize('initial_token', ['expired', None])
+def test_concurrent_refresh_is_shared(session: Session, initial_token):
+    session.access_token = initial_token  # None if no refresh has succeeded yet
+    session.access_token_expiration = datetime.now(timezone.utc) - timedelta(minutes=1)
+    token_refresh_response = refresh_token(datetime.now(timezone.utc) + timedelta(minutes=10))
+
+    def slow_refresh(request, context):
+        time.sleep(0.2)  # So that the other threads queue up behind it
+        return token_refresh_response
+
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=slow_refresh)
+        m.get('http://citrine-testing.fake/api/v1/foo',
+              json={'foo': 'bar'},
+              headers={'content-type': "application/json"})
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lambda _: session.get_resource('/foo'), range(64)))
+
+    assert results == [{'foo': 'bar'}] * 64
+    assert refresh.call_count == 1
+
+
+def test_denied_refresh_skipped_when_token_replaced(session: Session):
+    session.access_token = 'stale'
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh')
+        session._refresh_access_token(stale_token='older')
+
+    assert refresh.call_count == 0
+    assert session.access_token == 'stale'
+
+
 def test_get_refresh_token_failure(session: Session):
     session.access_token_expiration = datetime.now(timezone.utc) - timedelta(minutes=1)
 
@@ -134,6 +190,15 @@ def test_status_code_409(session: Session):
         assert "409" in str(einfo.value)
 
 
+def test_status_code_413(session: Session):
+    with requests_mock.Mocker() as m:
+        m.put('http://citrine-testing.fake/api/v1/foo', status_code=413)
+        with pytest.raises(NonRetryableException):
+            session.put_resource('/foo', json={})
+        with pytest.raises(PayloadTooLarge):
+            session.put_resource('/foo', json={})
+
+
 def test_status_code_425(session: Session):
     with requests_mock.Mocker() as m:
         m.get('http://citrine-testing.fake/api/v1/foo', status_code=425)
@@ -143,6 +208,89 @@ def test_status_code_425(session: Session):
             session.get_resource('/foo')
 
 
+def test_status_code_429(session: Session):
+    soon = (datetime.now(timezone.utc) + timedelta(seconds=30)).strftime('%a, %d %b %Y %H:%M:%S GMT')
+    with requests_mock.Mocker() as m:
+        for headers, retry_after in [({'Retry-After': '12'}, 12.0),
+                                     ({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}, 0.0),
+                                     ({'Retry-After': 'soon'}, None),
+                                     ({}, None)]:
+            m.get('http://citrine-testing.fake/api/v1/foo', status_code=429, headers=headers)
+            with pytest.raises(TooManyRequests) as error:
+                session.get_resource('/foo')
+            assert error.value.retry_after == retry_after
+        assert isinstance(error.value, RetryableException)
+
+        m.get('http://citrine-testing.fake/api/v1/foo', status_code=429,
+              headers={'Retry-After': soon})
+        with pytest.raises(TooManyRequests) as error:
+            session.get_resource('/foo')
+        assert 20 < error.value.retry_after <= 30
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answer the first GET with a 429 asking to wait a second, and later ones with {}."""
+
+    def do_POST(self):
+        self._respond(200, refresh_token(datetime.now(timezone.utc) + timedelta(minutes=3)))
+
+    def do_GET(self):
+        self.server.gets.append(time.monotonic())
+        if len(self.server.gets) == 1:
+            self._respond(429, {}, {'Retry-After': '1'})
+        else:
+            self._respond(200, {})
+
+    def _respond(self, status: int, body: dict, headers: dict = None):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        for key, value in {**(headers or {}), 'Content-Length': str(len(content))}.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def throttling_session():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ThrottlingHandler)
+    server.gets = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield Session(refresh_token='12345', scheme='http', host='127.0.0.1',
+                      port=str(server.server_port)), server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_status_code_429_while_polling(throttling_session):
+    """Polling gets a 429 with its Retry-After, rather than the session waiting on it."""
+    session, server = throttling_session
+    checks = []
+
+    def check():
+        checks.append(time.monotonic())
+        return True, session.get_resource('/foo')
+
+    poller = Poller(backoff=Backoff.constant(0.01))
+    future = poller.submit(check, timeout=10, on_timeout=lambda: TimeoutError())
+    assert list(poller.as_completed()) == [future]
+    assert future.result() == {}
+    assert len(checks) == len(server.gets) == 2, "The 429 should be retried by the poller"
+    assert checks[1] - checks[0] >= 1, "The poller should wait as long as the server asked"
+
+    server.gets.clear()
+    assert session.get_resource('/foo') == {}, "Other requests still wait and retry"
+    assert len(server.gets) == 2
+
+    server.gets.clear()
+    with deferring_retry_after(), pytest.raises(TooManyRequests) as error:
+        session.get_resource('/foo')
+    assert error.value.retry_after == 1.0
+
 def test_status_code_400(session: Session):
     with requests_mock.Mocker() as m:
         resp_json = {
@@ -264,6 +412,8 @@ def test_cursor_paged_resource():
     assert list(Session.cursor_paged_resource(fake_request, 'foo', forward=True, per_page=10)) == full_result_set
     assert list(Session.cursor_paged_resource(fake_request, 'foo', forward=True, per_page=26)) == full_result_set
     assert list(Session.cursor_paged_resource(fake_request, 'foo', forward=True, per_page=40)) == full_result_set
+    # nor should reading ahead
+    assert list(Session.cursor_paged_resource(fake_request, 'foo', per_page=4, prefetch=3)) == full_result_set
 
 
 def test_bad_json_response(session: Session):
@@ -295,3 +445,111 @@ def test_patch(session: Session):
                 headers={'content-type': "application/json"})
         response_json = session.patch_resource('bar/something', {"ignored": "true"})
         assert response_json == json_to_validate
+
+
+@pytest.fixture
+def async_session(session: Session):
+    async_session = AsyncSession(session=session, max_workers=4)
+    yield async_session
+    async_session.close()
+
+
+def test_async_session_creation():
+    token_refresh_response = refresh_token(datetime(2019, 3, 14, tzinfo=timezone.utc))
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
+        async_session = AsyncSession(refresh_token='12345', scheme='http', host='citrine-testing.fake')
+    assert async_session.session.refresh_token == '12345'
+    assert async_session.max_workers == 256
+    async_session.close()
+
+
+def test_async_session_runs_hundreds_at_once(session: Session):
+    """By default, hundreds of requests are in flight at once, rather than queueing."""
+    in_flight = threading.Barrier(200, timeout=10)
+
+    def get_resource(path, **kwargs):
+        in_flight.wait()
+        return {'path': path}
+
+    async def go():
+        async with AsyncSession(session=session) as async_session:
+            return await asyncio.gather(*(async_session.get_resource(f'/{i}') for i in range(200)))
+
+    with mock.patch.object(session, 'get_resource', side_effect=get_resource):
+        resources = asyncio.run(go())
+    assert [r['path'] for r in resources] == [f'/{i}' for i in range(200)]
+
+
+def test_async_resources(async_session: AsyncSession):
+    async def go():
+        return await asyncio.gather(
+            async_session.get_resource('/foo'),
+            async_session.post_resource('/foo', json={}),
+            async_session.put_resource('/foo', json={}),
+            async_session.patch_resource('/foo', json={}),
+            async_session.delete_resource('/foo'),
+            async_session.checked_request('GET', '/foo'),
+        )
+
+    with requests_mock.Mocker() as m:
+        for method in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
+            m.register_uri(method, 'http://citrine-testing.fake/api/v1/foo',
+                           json={'method': method},
+                           headers={'content-type': "application/json"})
+        *resources, response = asyncio.run(go())
+
+    assert [r['method'] for r in resources] == ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
+    assert response.status_code == 200
+
+
+def test_async_errors_and_refresh(async_session: AsyncSession):
+    async_session.session.access_token_expiration = datetime.now(timezone.utc) - timedelta(minutes=1)
+    token_refresh_response = refresh_token(datetime(2019, 3, 14, tzinfo=timezone.utc))
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
+        m.get('http://citrine-testing.fake/api/v1/foo', status_code=404)
+        with pytest.raises(NotFound):
+            asyncio.run(async_session.get_resource('/foo'))
+
+    assert datetime(2019, 3, 14, tzinfo=timezone.utc) == async_session.session.access_token_expiration
+
+
+def test_async_cursor_paged_resource():
+    full_result_set = list(range(26))
+    fake_request = make_fake_cursor_request_function(full_result_set)
+
+    async def fake_async_request(*args, **kwargs):
+        return fake_request(*args, **kwargs)
+
+    async def collect(per_page):
+        return [x async for x in AsyncSession.cursor_paged_resource(fake_async_request, 'foo',
+                                                                    per_page=per_page)]
+
+    assert asyncio.run(collect(10)) == full_result_set
+    assert asyncio.run(collect(40)) == full_result_set
+
+
+def test_async_session_context_manager(session: Session):
+    async def go():
+        async with AsyncSession(session=session) as async_session:
+            return async_session
+
+    async_session = asyncio.run(go())
+    with pytest.raises(RuntimeError):
+        async_session._executor.submit(print)
+
+
+def test_async_session_closes_off_the_loop(session: Session):
+    """Shutting down waits for the worker threads, so it shouldn't block the event loop."""
+    closed_on = []
+
+    async def go():
+        async with AsyncSession(session=session) as async_session:
+            close = async_session.close
+            async_session.close = lambda: closed_on.append(threading.get_ident()) or close()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(go())
+    assert closed_on and closed_on[0] != loop_thread
@@ -54,6 +54,7 @@ class FakeSession(Session):
         self.s3_use_ssl = True
         self.s3_addressing_style = 'auto'
         self.use_idempotent_dataset_put = False
+        self.trusted_build = False
 
     def set_response(self, resp):
         self.responses = [resp]
@@ -123,25 +124,16 @@ class FakeSession(Session):
     @staticmethod
     def cursor_paged_resource(base_method: Callable[..., dict], path: str,
                               forward: bool = True, per_page: int = 100,
-                              version: str = 'v2', **kwargs) -> Iterator[dict]:
+                              version: str = 'v2', prefetch: int = 0,
+                              **kwargs) -> Iterator[dict]:
         """
         Returns a flat generator of results for an API query.
 
         Results are fetched in chunks of size `per_page` and loaded lazily.
         """
-        params = kwargs.get('params', {})
-        params['forward'] = forward
-        params['ascending'] = forward
-        params['per_page'] = per_page
-        kwargs['params'] = params
-        while True:
-            response_json = base_method(path, version=version, **kwargs)
-            for obj in response_json['contents']:
-                yield obj
-            cursor = response_json.get('next')
-            if cursor is None:
-                break
-            params['cursor'] = cursor
+        return Session.cursor_paged_resource(base_method, path, forward=forward,
+                                             per_page=per_page, version=version,
+                                             prefetch=prefetch, **kwargs)
 
 
 class FakePaginatedSession(FakeSession):